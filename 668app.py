@@ -19,6 +19,16 @@ import hashlib
 import time
 from collections import Counter
 import numpy as np
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import random
+import tempfile
+import os
+
+try:
+    from openpyxl import Workbook
+except ImportError:
+    Workbook = None
 
 # Page configuration
 st.set_page_config(
@@ -337,6 +347,381 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Shared sheet cache (one per server process, shared by all sessions)
+@st.cache_resource
+def get_shared_sheet_cache():
+    """Parsed sheet DataFrames and single columns keyed by spreadsheet id, tagged with the Drive revision they were read at"""
+    return {'lock': threading.Lock(), 'sheets': {}, 'columns': {}}
+
+# Google API client pool (one per server process, keyed by service account)
+@st.cache_resource
+def get_google_client_pool():
+    """Authorized credentials and Sheets clients per service-account fingerprint"""
+    return {'lock': threading.Lock(), 'clients': {}}
+
+# Columns needed by the lightweight views, loaded on their own via get_sheet_columns
+STATS_COLUMNS = ['Message', 'Month(1-12)', 'Day(1-31)', 'Year', 'Category']
+DASHBOARD_COLUMNS = ['Message', 'ImageURL', 'VideoURL', 'Month(1-12)', 'Day(1-31)', 'Year', 'Category']
+CALENDAR_COLUMNS = ['Message', 'Link', 'Month(1-12)', 'Day(1-31)', 'Year', 'Hour', 'Minute(0-59)', 'Category']
+
+# Derived scheduling columns, computed once per sheet revision and shared by every view
+DATE_COLUMNS = ['Year', 'Month(1-12)', 'Day(1-31)']
+SCHEDULE_COLUMNS = ['scheduled_at', 'status']
+
+def add_schedule_columns(df):
+    """Add scheduled_at (NaT unless Year/Month/Day form a real date) and a Scheduled/Queued status"""
+    df = df.copy()
+    
+    def number(col, low=None, high=None):
+        if col not in df.columns:
+            return pd.Series(0, index=df.index)
+        values = pd.to_numeric(df[col], errors='coerce').astype('float64')
+        if low is None:
+            return values
+        # A bad time shouldn't unschedule a post that has a valid date
+        return values.where(values.between(low, high)).fillna(0)
+    
+    parts = pd.DataFrame({
+        'year': number('Year'),
+        'month': number('Month(1-12)'),
+        'day': number('Day(1-31)'),
+        'hour': number('Hour', 0, 23),
+        'minute': number('Minute(0-59)', 0, 59)
+    }, index=df.index)
+    df['scheduled_at'] = pd.to_datetime(parts, errors='coerce')
+    df['status'] = pd.Categorical(
+        np.where(df['scheduled_at'].notna(), 'Scheduled', 'Queued'),
+        categories=['Scheduled', 'Queued']
+    )
+    return df
+
+class ScheduleIndex:
+    """Row labels of scheduled posts sorted by scheduled_at, so date-range lookups are a binary search"""
+    
+    def __init__(self, df):
+        self.index = df.index
+        self.source = df['scheduled_at'].values
+        scheduled = df['scheduled_at'].dropna().sort_values(kind='stable')
+        self.times = scheduled.values
+        self.labels = scheduled.index.values
+    
+    def __len__(self):
+        return len(self.labels)
+    
+    def matches(self, df):
+        """Whether this index was built from df's current schedule"""
+        return (
+            'scheduled_at' in df.columns
+            and df.index.equals(self.index)
+            and np.array_equal(df['scheduled_at'].values, self.source, equal_nan=True)
+        )
+    
+    def between(self, start, end):
+        """Row labels scheduled in [start, end), in time order"""
+        bounds = [pd.Timestamp(t).to_datetime64().astype(self.times.dtype) for t in (start, end)]
+        low, high = np.searchsorted(self.times, bounds, side='left')
+        return self.labels[low:high]
+    
+    def in_month(self, year, month):
+        """Row labels scheduled in the given month, in time order"""
+        start = datetime(year, month, 1)
+        end = datetime(year + month // 12, month % 12 + 1, 1)
+        return self.between(start, end)
+
+# Bulk import: rows read and validated per chunk, and limits for the values that get checked
+IMPORT_CHUNK_ROWS = 10000
+IMPORT_MAX_ERRORS = 1000
+IMPORT_NUMBER_RANGES = {
+    'Year': (2000, 2100),
+    'Month(1-12)': (1, 12),
+    'Day(1-31)': (1, 31),
+    'Hour': (0, 23),
+    'Minute(0-59)': (0, 59)
+}
+STORY_VALUES = {'': '', 'Y': 'Y', 'YES': 'Y', 'TRUE': 'Y', '1': 'Y', 'N': 'N', 'NO': 'N', 'FALSE': 'N', '0': 'N'}
+CONTENT_COLUMNS = ['Message', 'Link', 'ImageURL', 'VideoURL']
+
+# Exports: built in chunks only when a download is clicked, and cached per data version and columns
+EXPORT_CHUNK_ROWS = 10000
+EXPORT_FORMATS = {
+    'CSV': ('csv', 'text/csv'),
+    'JSON': ('json', 'application/json'),
+    'Parquet': ('parquet', 'application/vnd.apache.parquet'),
+    'Excel': ('xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
+}
+
+def export_chunks(df):
+    """Slices of df with typed columns: whole-number date fields and text everywhere else"""
+    for start in range(0, len(df), EXPORT_CHUNK_ROWS):
+        chunk = df.iloc[start:start + EXPORT_CHUNK_ROWS].copy()
+        for col in chunk.columns:
+            if col in IMPORT_NUMBER_RANGES:
+                chunk[col] = pd.to_numeric(chunk[col], errors='coerce').round().astype('Int64')
+            else:
+                chunk[col] = chunk[col].fillna('').astype(str)
+        yield chunk
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def build_export_file(version, export_format, columns, _df):
+    """Export file bytes for one data version, format and column selection
+    
+    _df is not hashed; version must change whenever its contents do. Rows are written a chunk
+    at a time into a temporary file that only spills to disk for large exports.
+    """
+    df = _df[list(columns)]
+    with tempfile.SpooledTemporaryFile(max_size=32 * 1024 * 1024) as out:
+        if export_format == 'CSV':
+            # A header row even when there are no posts
+            pd.DataFrame(columns=list(columns)).to_csv(out, index=False, encoding='utf-8')
+            for chunk in export_chunks(df):
+                chunk.to_csv(out, header=False, index=False, encoding='utf-8')
+        elif export_format == 'JSON':
+            out.write(b'[')
+            separator = b'\n'
+            for chunk in export_chunks(df):
+                for line in chunk.to_json(orient='records', lines=True, force_ascii=False).splitlines():
+                    out.write(separator + line.encode('utf-8'))
+                    separator = b',\n'
+            out.write(b'\n]\n')
+        elif export_format == 'Parquet':
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            schema = pa.schema([
+                (col, pa.int64() if col in IMPORT_NUMBER_RANGES else pa.string()) for col in columns
+            ])
+            with pq.ParquetWriter(out, schema) as writer:
+                for chunk in export_chunks(df):
+                    writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+        else:  # Excel
+            # Write-only mode streams rows to the file instead of keeping every cell object
+            workbook = Workbook(write_only=True)
+            worksheet = workbook.create_sheet("Posts")
+            worksheet.append(list(columns))
+            for chunk in export_chunks(df):
+                for row in chunk.astype(object).where(chunk.notna(), None).itertuples(index=False):
+                    worksheet.append(list(row))
+            workbook.save(out)
+        
+        out.seek(0)
+        return out.read()
+
+# Google API rate limiting (one per server process, shared by all sessions)
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+class GoogleApiLimiter:
+    """Token bucket with jittered exponential backoff and per-call metrics for one Google API
+    
+    Sessions share the service account's quota, so every call waits for a token first. Calls
+    that fail with 429 or a 5xx are retried with growing, randomized delays.
+    """
+    
+    def __init__(self, rate, burst, max_retries=5, base_delay=1.0, max_delay=32.0):
+        self.rate = rate
+        self.burst = burst
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.lock = threading.Lock()
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.metrics = {}
+    
+    def acquire(self):
+        """Block until a request token is available"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+    
+    def is_retryable(self, error):
+        """Whether an exception is a quota or server error worth retrying"""
+        if isinstance(error, gspread.exceptions.APIError):
+            return error.code in RETRYABLE_STATUS_CODES
+        return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+    
+    def record(self, name, elapsed, retried=False, failed=False):
+        """Add one attempt to the metrics for a call name"""
+        with self.lock:
+            stats = self.metrics.setdefault(name, {'calls': 0, 'retries': 0, 'errors': 0, 'total_time': 0.0, 'max_time': 0.0})
+            stats['calls'] += 0 if retried else 1
+            stats['retries'] += 1 if retried else 0
+            stats['errors'] += 1 if failed else 0
+            stats['total_time'] += elapsed
+            stats['max_time'] = max(stats['max_time'], elapsed)
+    
+    def call(self, name, func, *args, **kwargs):
+        """Run func under the rate limit, retrying quota and server errors"""
+        for attempt in range(self.max_retries + 1):
+            self.acquire()
+            start = time.monotonic()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                elapsed = time.monotonic() - start
+                if attempt == self.max_retries or not self.is_retryable(e):
+                    self.record(name, elapsed, failed=True)
+                    raise
+                
+                self.record(name, elapsed, retried=True)
+                delay = min(self.max_delay, self.base_delay * 2 ** attempt)
+                time.sleep(delay / 2 + random.uniform(0, delay / 2))
+            else:
+                self.record(name, time.monotonic() - start)
+                return result
+    
+    def get_metrics(self):
+        """Copy of the per-call metrics"""
+        with self.lock:
+            return {name: dict(stats) for name, stats in self.metrics.items()}
+
+@st.cache_resource
+def get_google_api_limiters():
+    """Rate limiters per API; Sheets allows far fewer requests per minute than Drive"""
+    return {
+        'sheets': GoogleApiLimiter(rate=1.0, burst=10),
+        'drive': GoogleApiLimiter(rate=10.0, burst=20)
+    }
+
+# Card thumbnails, kept on disk so reruns and other sessions don't download the originals again
+THUMBNAIL_CACHE_DIR = os.environ.get('THUMBNAIL_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'social-media-thumbnails'))
+THUMBNAIL_CACHE_MAX_BYTES = int(os.environ.get('THUMBNAIL_CACHE_MAX_MB', '256')) * 1024 * 1024
+THUMBNAIL_SIZE = 480
+# Seconds a thumbnail is used without asking the origin whether the image has changed
+THUMBNAIL_MAX_AGE = float(os.environ.get('THUMBNAIL_MAX_AGE', '3600'))
+IMAGE_PREFETCH_WORKERS = 8
+
+class ThumbnailCache:
+    """Disk LRU of resized WebP thumbnails keyed by image URL, with the origin's ETag/Last-Modified alongside
+    
+    Reading an entry bumps its mtime; once the directory passes max_bytes the least recently read go first.
+    Entries older than max_age are revalidated with a conditional request before they are used again.
+    """
+    
+    def __init__(self, directory=THUMBNAIL_CACHE_DIR, max_bytes=THUMBNAIL_CACHE_MAX_BYTES, size=THUMBNAIL_SIZE, max_age=THUMBNAIL_MAX_AGE):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.size = size
+        self.max_age = max_age
+        self.lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+    
+    def paths(self, url):
+        """Thumbnail and metadata file paths for a URL"""
+        base = os.path.join(self.directory, hashlib.sha256(url.encode('utf-8')).hexdigest())
+        return base + '.webp', base + '.json'
+    
+    def get(self, url):
+        """(thumbnail, metadata) for a cached URL, or None"""
+        image_path, meta_path = self.paths(url)
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            image = Image.open(image_path)
+            image.load()
+            os.utime(image_path)
+        except (OSError, ValueError):
+            return None
+        return image, meta
+    
+    def is_fresh(self, meta):
+        """Whether an entry can be used without revalidating it"""
+        return time.time() - meta.get('fetched_at', 0) < self.max_age
+    
+    def conditional_headers(self, meta):
+        """If-None-Match / If-Modified-Since headers from an entry's validators"""
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+    
+    def mark_fresh(self, url, meta, headers):
+        """Record a 304 Not Modified: keep the thumbnail, restart its max-age and take any updated validators"""
+        meta = dict(meta, fetched_at=time.time())
+        if headers.get('ETag'):
+            meta['etag'] = headers['ETag']
+        if headers.get('Last-Modified'):
+            meta['last_modified'] = headers['Last-Modified']
+        
+        _, meta_path = self.paths(url)
+        self.write_file(meta_path, lambda f: f.write(json.dumps(meta).encode('utf-8')))
+    
+    def put(self, url, content, headers):
+        """Resize downloaded image bytes, store the thumbnail with its validators and return it"""
+        image = Image.open(io.BytesIO(content))
+        image.thumbnail((self.size, self.size))
+        if image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGBA' if image.mode in ('LA', 'PA') or 'transparency' in image.info else 'RGB')
+        
+        meta = {
+            'url': url,
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'fetched_at': time.time()
+        }
+        image_path, meta_path = self.paths(url)
+        self.write_file(image_path, lambda f: image.save(f, format='WEBP', quality=80))
+        self.write_file(meta_path, lambda f: f.write(json.dumps(meta).encode('utf-8')))
+        self.evict()
+        return image
+    
+    def write_file(self, path, write):
+        """Write through a temporary file and rename, so readers never see half a file"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                write(f)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def evict(self):
+        """Remove least recently used thumbnails until the cache fits in max_bytes"""
+        with self.lock:
+            entries = []
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith('.webp'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.path, stat.st_size))
+            
+            total = sum(size for _, _, size in entries)
+            for _, path, size in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                for stale_path in (path, path[:-len('.webp')] + '.json'):
+                    try:
+                        os.remove(stale_path)
+                    except OSError:
+                        pass
+                total -= size
+
+@st.cache_resource
+def get_thumbnail_cache():
+    """Process-wide thumbnail cache shared by all sessions"""
+    return ThumbnailCache()
+
+@st.cache_resource
+def get_image_session():
+    """HTTP session shared by image downloads, pooling one connection per prefetch worker"""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=IMAGE_PREFETCH_WORKERS, pool_maxsize=IMAGE_PREFETCH_WORKERS)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+@st.cache_resource
+def get_image_prefetch_pool():
+    """Background pool that warms the thumbnail cache ahead of the page being viewed"""
+    return ThreadPoolExecutor(max_workers=IMAGE_PREFETCH_WORKERS, thread_name_prefix='thumbnail-prefetch')
+
 class EnhancedSocialMediaManager:
     def __init__(self):
         self.column_names = [
@@ -345,6 +730,11 @@ class EnhancedSocialMediaManager:
             'Category', 'Watermark', 'HashtagGroup', 'VideoThumbnailURL',
             'CTAGroup', 'FirstComment', 'Story(YorN)', 'PinterestBoard', 'AltText'
         ]
+        self.schedule_index = None
+        self.data_version = None
+        
+        # Thumbnails loaded ahead of rendering a page of cards, see prefetch_thumbnails()
+        self.prefetched_thumbnails = {}
         
         self.platform_limits = {
             'Facebook': {'limit': 63206, 'optimal': 40, 'color': '#1877f2'},
@@ -393,58 +783,474 @@ class EnhancedSocialMediaManager:
             'Industry Specific': ['#Healthcare', '#Finance', '#Retail', '#Manufacturing', '#RealEstate', '#Consulting']
         }
     
+    def get_credentials_fingerprint(self, credentials_dict):
+        """Stable hash of the service account JSON, used to key pooled clients"""
+        return hashlib.sha256(json.dumps(credentials_dict, sort_keys=True).encode()).hexdigest()
+    
+    def get_pooled_google_resources(self):
+        """Shared credentials and Sheets client for the uploaded service account
+        
+        The credentials refresh their own access token when it expires, and the
+        client keeps its HTTP connections open, so every rerun and session using
+        the same service account skips the OAuth exchange.
+        """
+        credentials_dict = st.session_state.google_credentials
+        fingerprint = self.get_credentials_fingerprint(credentials_dict)
+        pool = get_google_client_pool()
+        
+        with pool['lock']:
+            entry = pool['clients'].get(fingerprint)
+            if entry is None:
+                credentials = Credentials.from_service_account_info(
+                    credentials_dict,
+                    scopes=[
+                        "https://www.googleapis.com/auth/spreadsheets",
+                        "https://www.googleapis.com/auth/drive"
+                    ]
+                )
+                entry = {
+                    'fingerprint': fingerprint,
+                    'credentials': credentials,
+                    'client': gspread.authorize(credentials)
+                }
+                pool['clients'][fingerprint] = entry
+        
+        return entry
+    
     def setup_google_sheets(self):
         """Initialize Google Sheets connection"""
         try:
             if 'google_credentials' not in st.session_state:
                 return None, "Please upload Google service account credentials"
             
-            credentials_dict = st.session_state.google_credentials
-            credentials = Credentials.from_service_account_info(
-                credentials_dict,
-                scopes=[
-                    "https://www.googleapis.com/auth/spreadsheets",
-                    "https://www.googleapis.com/auth/drive"
-                ]
-            )
-            
-            client = gspread.authorize(credentials)
-            return client, None
+            return self.get_pooled_google_resources()['client'], None
         except Exception as e:
             return None, f"Error connecting to Google Sheets: {str(e)}"
     
+    def api_call(self, api, name, func, *args, **kwargs):
+        """Call a Google API function through the shared rate limiter for that API"""
+        return get_google_api_limiters()[api].call(name, func, *args, **kwargs)
+    
+    def open_worksheet(self, client, sheet_url):
+        """First worksheet of a spreadsheet; opening it costs a Sheets metadata request"""
+        return self.api_call('sheets', 'open_by_url', lambda: client.open_by_url(sheet_url).sheet1)
+    
+    def get_sheet_key(self, sheet_url):
+        """Spreadsheet id for a sheet URL, so different links to the same sheet share a cache entry"""
+        try:
+            return gspread.utils.extract_id_from_url(sheet_url)
+        except Exception:
+            return sheet_url
+    
+    def get_sheet_revision(self, client, sheet_url):
+        """Get the spreadsheet's Drive modifiedTime, used as a cheap revision marker"""
+        try:
+            metadata = self.api_call('drive', 'get_file_metadata', client.get_file_drive_metadata, self.get_sheet_key(sheet_url))
+            return metadata.get('modifiedTime')
+        except Exception:
+            # Drive API unavailable for this project - caller falls back to a full read
+            return None
+    
     def get_sheet_data(self, client, sheet_url):
-        """Fetch data from Google Sheets"""
+        """Fetch data from Google Sheets, served from the shared cache while the revision is unchanged"""
+        cache = get_shared_sheet_cache()
+        sheet_id = self.get_sheet_key(sheet_url)
+        
+        # Read the revision before the data so a concurrent edit can only make the entry look older
+        revision = self.get_sheet_revision(client, sheet_url)
+        
+        with cache['lock']:
+            entry = cache['sheets'].get(sheet_id)
+            if revision and entry and entry['revision'] == revision:
+                self.schedule_index = entry['schedule']
+                self.data_version = (sheet_id, revision)
+                # Callers edit the frame in place, so never hand out the cached object itself
+                return entry['df'].copy()
+        
+        self.data_version = None
         try:
-            sheet = client.open_by_url(sheet_url).sheet1
-            data = sheet.get_all_records()
+            df, complete = self.fetch_sheet_data(client, sheet_url)
+        except Exception as e:
+            return self.get_stale_sheet_data(sheet_url, e)
+        
+        entry = self.make_sheet_entry(revision, df)
+        if revision and complete:
+            with cache['lock']:
+                cache['sheets'][sheet_id] = entry
+            self.data_version = (sheet_id, revision)
+        
+        self.schedule_index = entry['schedule']
+        return entry['df'].copy()
+    
+    def get_export(self, df, columns, export_format, version=None):
+        """Bytes of an export of df's columns, reused while the data version and selection are unchanged
+        
+        Without a known version (e.g. a stale copy), the contents are hashed to key the cache instead.
+        """
+        if version is None:
+            content = pd.util.hash_pandas_object(df[columns].astype(str), index=False).values
+            version = hashlib.sha256(content.tobytes()).hexdigest()
+        return build_export_file(version, export_format, tuple(columns), df)
+    
+    def get_export_formats(self):
+        """Export formats that can be built with the installed packages"""
+        return [name for name in EXPORT_FORMATS if name != 'Excel' or Workbook is not None]
+    
+    def make_sheet_entry(self, revision, df):
+        """Cache entry for one revision of a sheet, with the schedule columns and index derived up front"""
+        df = add_schedule_columns(df.reindex(columns=self.column_names, fill_value=''))
+        return {'revision': revision, 'df': df, 'schedule': ScheduleIndex(df)}
+    
+    def get_schedule_index(self, df):
+        """Sorted schedule index for df, reusing the one built when this revision was loaded"""
+        if self.schedule_index is None or not self.schedule_index.matches(df):
+            if 'scheduled_at' not in df.columns:
+                df = add_schedule_columns(df)
+            self.schedule_index = ScheduleIndex(df)
+        return self.schedule_index
+    
+    def fetch_sheet_data(self, client, sheet_url):
+        """Read the whole worksheet; returns (df, complete) where complete is False for a fresh sheet
+        
+        Read errors are raised so callers can fall back to an older copy.
+        """
+        sheet = self.open_worksheet(client, sheet_url)
+        data = self.api_call('sheets', 'get_all_records', sheet.get_all_records)
+        
+        if not data:
+            self.api_call('sheets', 'append_row', sheet.append_row, self.column_names)
+            return pd.DataFrame(columns=self.column_names), False
+        
+        df = pd.DataFrame(data)
+        
+        for col in self.column_names:
+            if col not in df.columns:
+                df[col] = ''
+        
+        return df[self.column_names], True
+    
+    def get_stale_sheet_data(self, sheet_url, error):
+        """Last known copy of a sheet that can't be read right now, so views degrade instead of going blank"""
+        cache = get_shared_sheet_cache()
+        with cache['lock']:
+            entry = cache['sheets'].get(self.get_sheet_key(sheet_url))
+        
+        if not entry or entry['df'].empty:
+            st.error(f"Error reading sheet: {str(error)}")
+            return add_schedule_columns(pd.DataFrame(columns=self.column_names))
+        
+        st.warning(f"⚠️ Google Sheets is unavailable ({str(error)}). Showing the last loaded copy, which may be out of date.")
+        return entry['df'].copy()
+    
+    def get_sheet_columns(self, client, sheet_url, columns):
+        """Just the given columns, each fetched and cached on its own while the revision is unchanged"""
+        cache = get_shared_sheet_cache()
+        sheet_id = self.get_sheet_key(sheet_url)
+        revision = self.get_sheet_revision(client, sheet_url)
+        derived = SCHEDULE_COLUMNS if set(DATE_COLUMNS) <= set(columns) else []
+        
+        with cache['lock']:
+            entry = cache['sheets'].get(sheet_id)
+            if revision and entry and entry['revision'] == revision:
+                return entry['df'][columns + derived].copy()
             
-            if not data:
-                sheet.append_row(self.column_names)
-                return pd.DataFrame(columns=self.column_names)
+            column_entry = cache['columns'].get(sheet_id)
+            current = revision and column_entry and column_entry['revision'] == revision
+            cached = dict(column_entry['columns']) if current else {}
+            row_count = column_entry['rows'] if current else None
+        
+        missing = [col for col in columns if col not in cached]
+        if missing or row_count is None:
+            try:
+                result = self.fetch_sheet_columns(client, sheet_url, missing, max([0] + [len(values) for values in cached.values()]))
+            except Exception:
+                result = None
+            
+            if result is None:
+                # Unexpected layout or a failed read - the full loader knows how to handle both
+                return self.get_sheet_data(client, sheet_url)[columns + derived]
+            
+            fetched, row_count = result
+            cached.update(fetched)
+            if revision:
+                with cache['lock']:
+                    column_entry = cache['columns'].get(sheet_id)
+                    if not column_entry or column_entry['revision'] != revision:
+                        column_entry = cache['columns'][sheet_id] = {'revision': revision, 'columns': {}, 'rows': None}
+                    column_entry['columns'].update(fetched)
+                    column_entry['rows'] = row_count
+        
+        # The API trims each column after its last value, so pad them all to the sheet's data rows
+        df = pd.DataFrame({col: cached[col] + [''] * (row_count - len(cached[col])) for col in columns})
+        return add_schedule_columns(df) if derived else df
+    
+    def fetch_sheet_columns(self, client, sheet_url, columns, known_rows=0):
+        """Read only the given columns in one batch_get; returns ({column: values}, data row count), or None if the header doesn't match
+        
+        Each column comes back trimmed after its last value, so the rows past the longest one (or known_rows)
+        are read in full width to find posts that only have data in other columns, as the full loader would.
+        """
+        sheet = self.open_worksheet(client, sheet_url)
+        letters = [
+            re.sub(r'\d', '', gspread.utils.rowcol_to_a1(1, self.column_names.index(col) + 1))
+            for col in columns
+        ]
+        ranges = [f'{letter}1:{letter}' for letter in letters]
+        response = self.api_call('sheets', 'batch_get', sheet.batch_get, ranges, major_dimension='COLUMNS') if ranges else []
+        
+        fetched = {}
+        for col, value_range in zip(columns, response):
+            values = value_range[0] if value_range else []
+            if not values or values[0] != col:
+                return None
+            fetched[col] = gspread.utils.numericise_all(values[1:], empty2zero=False, default_blank='')
+        
+        row_count = max([known_rows] + [len(values) for values in fetched.values()])
+        if row_count + 2 <= sheet.row_count:
+            tail = self.api_call('sheets', 'batch_get', sheet.batch_get, [f'{row_count + 2}:{sheet.row_count}'])[0]
+            row_count += len(tail)
+        return fetched, row_count
+    
+    def invalidate_sheet_cache(self, sheet_url):
+        """Drop the cached copy of a sheet whose contents we can no longer vouch for"""
+        cache = get_shared_sheet_cache()
+        sheet_id = self.get_sheet_key(sheet_url)
+        with cache['lock']:
+            cache['sheets'].pop(sheet_id, None)
+    
+    def get_sheet_snapshot(self, client, sheet_url):
+        """Cached copy of the sheet if it still matches the live revision, else None"""
+        cache = get_shared_sheet_cache()
+        revision = self.get_sheet_revision(client, sheet_url)
+        
+        with cache['lock']:
+            entry = cache['sheets'].get(self.get_sheet_key(sheet_url))
+        
+        if revision and entry and entry['revision'] == revision:
+            return entry['df'][self.column_names]
+        return None
+    
+    def remember_sheet_data(self, client, sheet_url, df):
+        """Store what we just wrote as the cached snapshot for the sheet's new revision"""
+        revision = self.get_sheet_revision(client, sheet_url)
+        if not revision:
+            self.invalidate_sheet_cache(sheet_url)
+            return
+        
+        entry = self.make_sheet_entry(revision, df)
+        cache = get_shared_sheet_cache()
+        with cache['lock']:
+            cache['sheets'][self.get_sheet_key(sheet_url)] = entry
+    
+    def update_sheet(self, client, sheet_url, df):
+        """Update Google Sheets with DataFrame, sending only the cells that changed"""
+        try:
+            sheet = self.open_worksheet(client, sheet_url)
+            df = df.reindex(columns=self.column_names, fill_value='')
+            new_rows = df.fillna('').values.tolist()
             
-            df = pd.DataFrame(data)
+            snapshot = self.get_sheet_snapshot(client, sheet_url)
+            updates = None
+            if snapshot is not None:
+                updates = self.diff_sheet_rows(snapshot.fillna('').values.tolist(), new_rows)
             
-            for col in self.column_names:
-                if col not in df.columns:
-                    df[col] = ''
+            if updates is None:
+                self.rewrite_sheet(sheet, new_rows)
+            elif updates:
+                self.api_call('sheets', 'batch_update', sheet.batch_update, updates)
             
-            return df[self.column_names]
+            self.remember_sheet_data(client, sheet_url, df)
+            return True, "Sheet updated successfully!"
         except Exception as e:
-            st.error(f"Error reading sheet: {str(e)}")
-            return pd.DataFrame(columns=self.column_names)
+            # A failed write may have partially applied, so the snapshot can no longer be trusted
+            self.invalidate_sheet_cache(sheet_url)
+            return False, f"Error updating sheet: {str(e)}"
     
-    def update_sheet(self, client, sheet_url, df):
-        """Update Google Sheets with DataFrame"""
+    def append_rows(self, client, sheet_url, rows, batch_size=1000):
+        """Append posts after the last row without rewriting the existing ones
+        
+        rows can be a DataFrame or a list of dicts/Series keyed by column name.
+        """
         try:
-            sheet = client.open_by_url(sheet_url).sheet1
-            sheet.clear()
+            new_df = rows if isinstance(rows, pd.DataFrame) else pd.DataFrame(list(rows))
+            new_df = new_df.reindex(columns=self.column_names, fill_value='')
+            values = new_df.fillna('').values.tolist()
+            if not values:
+                return True, "No posts to append"
             
-            data_to_upload = [self.column_names] + df.fillna('').values.tolist()
-            sheet.update(f'A1:S{len(data_to_upload)}', data_to_upload)
-            return True, "Sheet updated successfully!"
+            sheet = self.open_worksheet(client, sheet_url)
+            snapshot = self.get_sheet_snapshot(client, sheet_url)
+            
+            for start in range(0, len(values), batch_size):
+                self.api_call('sheets', 'append_rows', sheet.append_rows, values[start:start + batch_size], table_range='A1')
+            
+            if snapshot is not None:
+                self.remember_sheet_data(client, sheet_url, pd.concat([snapshot, new_df], ignore_index=True))
+            else:
+                self.invalidate_sheet_cache(sheet_url)
+            return True, f"Appended {len(values)} post(s)"
         except Exception as e:
-            return False, f"Error updating sheet: {str(e)}"
+            self.invalidate_sheet_cache(sheet_url)
+            return False, f"Error appending to sheet: {str(e)}"
+    
+    def append_row(self, client, sheet_url, row):
+        """Append a single post (dict or Series keyed by column name)"""
+        return self.append_rows(client, sheet_url, [row])
+    
+    def iter_import_chunks(self, uploaded_file, chunk_rows=IMPORT_CHUNK_ROWS):
+        """Yield (chunk, first_row) from an uploaded CSV, JSON or JSON Lines file
+        
+        CSV and JSON Lines are read lazily. Values are read as text so validation sees what the
+        user typed; first_row is the file row number of the chunk's first row, for error reports.
+        """
+        uploaded_file.seek(0)
+        name = uploaded_file.name.lower()
+        
+        if name.endswith('.csv'):
+            reader = pd.read_csv(uploaded_file, dtype=str, keep_default_na=False, chunksize=chunk_rows)
+            first_row = 2  # Row 1 is the header
+        elif name.endswith(('.jsonl', '.ndjson')):
+            reader = pd.read_json(uploaded_file, lines=True, dtype=False, convert_dates=False, chunksize=chunk_rows)
+            first_row = 1
+        else:
+            # A JSON array has to be parsed whole, but it is still validated and written in chunks
+            records = pd.read_json(uploaded_file, dtype=False, convert_dates=False)
+            reader = (records.iloc[start:start + chunk_rows] for start in range(0, len(records), chunk_rows))
+            first_row = 1
+        
+        for chunk in reader:
+            yield chunk, first_row
+            first_row += len(chunk)
+    
+    def normalize_import_chunk(self, chunk, first_row):
+        """Validate and normalise one chunk of imported rows
+        
+        Returns (clean, errors): clean holds the valid rows in sheet column order, and errors lists
+        (row_number, problem) for each row that was dropped.
+        """
+        chunk = chunk.reindex(columns=self.column_names, fill_value='')
+        chunk = chunk.fillna('').astype(str).apply(lambda col: col.str.strip())
+        problems = pd.Series('', index=chunk.index)
+        
+        def flag(mask, problem):
+            # Keep the first problem found for each row
+            problems[mask & (problems == '')] = problem
+        
+        flag(chunk['Message'] == '', "Message is empty")
+        
+        numbers = {}
+        for col, (low, high) in IMPORT_NUMBER_RANGES.items():
+            values = pd.to_numeric(chunk[col], errors='coerce')
+            given = chunk[col] != ''
+            flag(given & values.isna(), f"{col} is not a number")
+            flag(values.notna() & ((values % 1 != 0) | ~values.between(low, high)), f"{col} must be a whole number from {low} to {high}")
+            numbers[col] = values
+        
+        date_given = chunk[DATE_COLUMNS] != ''
+        flag(date_given.any(axis=1) & ~date_given.all(axis=1), "Year, Month and Day must be set together")
+        dates = pd.to_datetime(pd.DataFrame({
+            'year': numbers['Year'], 'month': numbers['Month(1-12)'], 'day': numbers['Day(1-31)']
+        }), errors='coerce')
+        flag(date_given.all(axis=1) & dates.isna(), "Year/Month/Day is not a real date")
+        
+        story = chunk['Story(YorN)'].str.upper().map(STORY_VALUES)
+        flag(story.isna(), "Story(YorN) must be Y or N")
+        chunk['Story(YorN)'] = story.fillna('')
+        
+        # Write whole numbers rather than text like "09" or "9.0"; blanks stay blank
+        for col, values in numbers.items():
+            chunk[col] = values.round().astype('Int64').astype(object).where(values.notna(), '')
+        
+        bad = problems != ''
+        rows = np.arange(first_row, first_row + len(chunk))
+        errors = list(zip(rows[bad.values].tolist(), problems[bad].tolist()))
+        return chunk[~bad], errors
+    
+    def post_content_hashes(self, df):
+        """Hash of each post's message, link and media URLs, used to spot duplicate posts"""
+        content = df.reindex(columns=CONTENT_COLUMNS, fill_value='').fillna('').astype(str)
+        return pd.util.hash_pandas_object(content.apply(lambda col: col.str.strip()), index=False)
+    
+    def import_posts(self, client, sheet_url, uploaded_file, existing_df, replace=False, on_progress=None):
+        """Stream an uploaded file into the sheet: each chunk is validated, normalised, deduped and appended
+        
+        With replace=True the valid rows replace the sheet in one write once the whole file has been
+        checked. on_progress(report) is called after each chunk. Returns (success, message, report).
+        """
+        seen = set() if replace else set(self.post_content_hashes(existing_df))
+        report = {'rows': 0, 'imported': 0, 'duplicates': 0, 'error_count': 0, 'errors': []}
+        kept = []
+        
+        for chunk, first_row in self.iter_import_chunks(uploaded_file):
+            clean, errors = self.normalize_import_chunk(chunk, first_row)
+            report['rows'] += len(chunk)
+            report['error_count'] += len(errors)
+            report['errors'].extend(errors[:IMPORT_MAX_ERRORS - len(report['errors'])])
+            
+            hashes = self.post_content_hashes(clean)
+            duplicate = (hashes.duplicated() | hashes.isin(seen)).values
+            seen.update(hashes[~duplicate])
+            report['duplicates'] += int(duplicate.sum())
+            clean = clean[~duplicate]
+            
+            if replace:
+                kept.append(clean)
+            elif not clean.empty:
+                # One request per chunk keeps large imports well inside the Sheets rate limit
+                success, message = self.append_rows(client, sheet_url, clean, batch_size=len(clean))
+                if not success:
+                    return False, f"{message} ({report['imported']} post(s) were imported before the error)", report
+            
+            report['imported'] += len(clean)
+            if on_progress is not None:
+                on_progress(report)
+        
+        if replace:
+            if not report['imported']:
+                return False, "No valid posts in the file, so the sheet was left unchanged", report
+            
+            success, message = self.update_sheet(client, sheet_url, pd.concat(kept, ignore_index=True))
+            if not success:
+                report['imported'] = 0
+                return False, message, report
+        
+        return True, (
+            f"Imported {report['imported']} post(s); skipped {report['duplicates']} duplicate(s) "
+            f"and {report['error_count']} invalid row(s)"
+        ), report
+    
+    def diff_sheet_rows(self, old_rows, new_rows):
+        """Build batch_update ranges for the cells that differ between two lists of sheet rows
+        
+        Returns None when enough rows changed that a full rewrite is the cheaper request.
+        """
+        width = len(self.column_names)
+        updates = []
+        
+        for i in range(max(len(old_rows), len(new_rows))):
+            # Rows past the new end are blanked out; rows past the old end are written in full
+            old = old_rows[i] if i < len(old_rows) else [None] * width
+            new = new_rows[i] if i < len(new_rows) else [''] * width
+            
+            changed_cols = [j for j in range(width) if str(old[j]) != str(new[j])]
+            if not changed_cols:
+                continue
+            
+            first, last = changed_cols[0], changed_cols[-1]
+            start = gspread.utils.rowcol_to_a1(i + 2, first + 1)
+            end = gspread.utils.rowcol_to_a1(i + 2, last + 1)
+            updates.append({'range': f'{start}:{end}', 'values': [list(new[first:last + 1])]})
+        
+        if len(updates) > 50 and len(updates) > len(new_rows) // 2:
+            return None
+        
+        return updates
+    
+    def rewrite_sheet(self, sheet, rows):
+        """Overwrite the whole sheet, then trim leftovers so it is never left empty mid-write"""
+        data_to_upload = [self.column_names] + rows
+        self.api_call('sheets', 'update', sheet.update, range_name=f'A1:S{len(data_to_upload)}', values=data_to_upload)
+        self.api_call('sheets', 'batch_clear', sheet.batch_clear, [f'A{len(data_to_upload) + 1}:S'])
     
     def generate_ai_post(self, topic, platform, tone="professional", include_hashtags=True):
         """Generate AI-powered social media post"""
@@ -594,9 +1400,56 @@ class EnhancedSocialMediaManager:
             pass
         return None
     
+    def load_thumbnail(self, url):
+        """Card-sized copy of an image, served from the disk cache after the first download"""
+        if url in self.prefetched_thumbnails:
+            return self.prefetched_thumbnails[url]
+        if not isinstance(url, str) or not url.startswith(('http://', 'https://')):
+            return None
+        
+        cache = get_thumbnail_cache()
+        cached = cache.get(url)
+        if cached and cache.is_fresh(cached[1]):
+            return cached[0]
+        
+        # Past max-age, ask the origin whether the image changed; a 304 costs no body
+        headers = cache.conditional_headers(cached[1]) if cached else {}
+        try:
+            response = get_image_session().get(url, headers=headers, timeout=10)
+            if cached and response.status_code == 304:
+                cache.mark_fresh(url, cached[1], response.headers)
+                return cached[0]
+            response.raise_for_status()
+            return cache.put(url, response.content, response.headers)
+        except Exception:
+            # Keep showing the old thumbnail while the origin can't be reached
+            return cached[0] if cached else None
+    
+    def warm_thumbnails(self, urls):
+        """Load thumbnails into the disk cache in the background, e.g. for the next page of cards"""
+        pool = get_image_prefetch_pool()
+        get_thumbnail_cache()
+        get_image_session()
+        for url in dict.fromkeys(urls):
+            if url and url not in self.prefetched_thumbnails:
+                pool.submit(self.load_thumbnail, url)
+    
+    def prefetch_thumbnails(self, urls, max_workers=IMAGE_PREFETCH_WORKERS):
+        """Load the thumbnails for a page of cards concurrently; a failed image only leaves its own card without one"""
+        pending = [url for url in dict.fromkeys(urls) if url and url not in self.prefetched_thumbnails]
+        if not pending:
+            return
+        
+        # Resolve the shared resources here rather than racing to create them in the workers
+        get_thumbnail_cache()
+        get_image_session()
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as pool:
+            for url, image in zip(pending, pool.map(self.load_thumbnail, pending)):
+                self.prefetched_thumbnails[url] = image
+    
     def get_post_status(self, row):
         """Determine post status based on scheduling info"""
-        if any([row.get(f, '') for f in ['Month(1-12)', 'Day(1-31)', 'Year', 'Hour']]):
+        if row.get('status') == 'Scheduled':
             return "Scheduled", "status-scheduled"
         return "Queued", "status-queued"
     
@@ -606,22 +1459,13 @@ class EnhancedSocialMediaManager:
             return None
         
         # Filter scheduled posts
-        scheduled_df = df[
-            (df['Month(1-12)'] != '') & 
-            (df['Day(1-31)'] != '') & 
-            (df['Year'] != '')
-        ].copy()
+        scheduled_df = df.loc[self.get_schedule_index(df).labels].copy()
         
         if scheduled_df.empty:
             return None
         
-        # Convert to datetime
         try:
-            scheduled_df['date'] = pd.to_datetime(
-                scheduled_df[['Year', 'Month(1-12)', 'Day(1-31)']].rename(columns={
-                    'Year': 'year', 'Month(1-12)': 'month', 'Day(1-31)': 'day'
-                })
-            )
+            scheduled_df['date'] = scheduled_df['scheduled_at'].dt.normalize()
             
             # Group by date
             posts_by_date = scheduled_df.groupby('date').size().reset_index(name='post_count')
@@ -719,9 +1563,10 @@ class EnhancedSocialMediaManager:
             
             # Display media
             if row.get('ImageURL'):
-                image = self.load_image_from_url(row.get('ImageURL'))
+                image = self.load_thumbnail(row.get('ImageURL'))
                 if image:
                     st.image(image, caption="Post Image", use_column_width=True)
+                    st.markdown(f"🔍 [Full size]({row.get('ImageURL')})")
                 else:
                     st.info(f"🖼️ Image URL: {row.get('ImageURL')}")
             
@@ -756,6 +1601,71 @@ class EnhancedSocialMediaManager:
                     st.session_state.optimize_post = index
                     st.rerun()
 
+class SheetDataContext:
+    """Sheet data for one rerun, loaded once and shared by the sidebar, page router and post actions"""
+    
+    def __init__(self, manager, client, sheet_url):
+        self.manager = manager
+        self.client = client
+        self.sheet_url = sheet_url
+        self._df = None
+        self._projections = {}
+        self._stats = None
+    
+    @property
+    def df(self):
+        """The posts DataFrame, fetched on first access"""
+        if self._df is None:
+            self._df = self.manager.get_sheet_data(self.client, self.sheet_url)
+        return self._df
+    
+    def project(self, columns):
+        """Only the given columns; fetched on their own unless the full sheet is already loaded"""
+        if self._df is not None:
+            derived = SCHEDULE_COLUMNS if set(DATE_COLUMNS) <= set(columns) else []
+            return self._df[columns + derived].copy()
+        
+        key = tuple(columns)
+        if key not in self._projections:
+            self._projections[key] = self.manager.get_sheet_columns(self.client, self.sheet_url, columns)
+        return self._projections[key].copy()
+    
+    @property
+    def stats(self):
+        """Quick-stat counts, computed once per rerun"""
+        if self._stats is None:
+            df = self.project(STATS_COLUMNS)
+            scheduled = len(self.manager.get_schedule_index(df))
+            categories = df['Category'][df['Category'].fillna('') != ''].value_counts()
+            
+            self._stats = {
+                'total': len(df),
+                'scheduled': scheduled,
+                'queued': len(df) - scheduled,
+                'top_category': categories.index[0] if not categories.empty else "None"
+            }
+        return self._stats
+
+def show_api_metrics():
+    """Sidebar table of Google API calls, retries and latency since the server started"""
+    rows = []
+    for api, limiter in get_google_api_limiters().items():
+        for name, stats in limiter.get_metrics().items():
+            attempts = stats['calls'] + stats['retries']
+            rows.append({
+                'API': api,
+                'Call': name,
+                'Calls': stats['calls'],
+                'Retries': stats['retries'],
+                'Errors': stats['errors'],
+                'Avg ms': round(stats['total_time'] / attempts * 1000) if attempts else 0,
+                'Max ms': round(stats['max_time'] * 1000)
+            })
+    
+    if rows:
+        with st.expander("📡 Google API Usage"):
+            st.dataframe(pd.DataFrame(rows), hide_index=True, use_container_width=True)
+
 def main():
     st.title("🚀 AI-Powered Social Media Manager Pro")
     st.markdown("**Advanced social media management with AI insights, analytics, and automation**")
@@ -817,34 +1727,8 @@ def main():
         
         st.markdown('</div>', unsafe_allow_html=True)
         
-        # Quick Stats
-        if 'google_credentials' in st.session_state and 'sheet_url' in st.session_state:
-            st.markdown('<div class="sidebar-section">', unsafe_allow_html=True)
-            st.subheader("📊 Quick Stats")
-            
-            try:
-                client, error = manager.setup_google_sheets()
-                if not error:
-                    df = manager.get_sheet_data(client, st.session_state.sheet_url)
-                    
-                    total_posts = len(df)
-                    scheduled_posts = len(df[
-                        (df['Month(1-12)'] != '') & 
-                        (df['Day(1-31)'] != '') & 
-                        (df['Year'] != '')
-                    ])
-                    
-                    st.metric("Total Posts", total_posts)
-                    st.metric("Scheduled", scheduled_posts)
-                    st.metric("Queued", total_posts - scheduled_posts)
-                    
-                    if not df.empty and 'Category' in df.columns:
-                        top_category = df['Category'].value_counts().index[0] if len(df['Category'].value_counts()) > 0 else "None"
-                        st.metric("Top Category", top_category)
-            except:
-                pass
-            
-            st.markdown('</div>', unsafe_allow_html=True)
+        # Quick Stats are filled in below, once the sheet has been loaded for this run
+        quick_stats = st.container()
         
         # Platform Limits Reference
         st.markdown('<div class="sidebar-section">', unsafe_allow_html=True)
@@ -904,13 +1788,34 @@ def main():
         st.error(error)
         return
     
-    # Load data
+    # Data is loaded once for the whole run; lightweight views only fetch the columns they use
+    data = SheetDataContext(manager, client, st.session_state.sheet_url)
+    current_view = st.session_state.current_view
     with st.spinner("🔄 Loading data from Google Sheets..."):
-        df = manager.get_sheet_data(client, st.session_state.sheet_url)
+        if current_view == 'dashboard':
+            df = data.project(DASHBOARD_COLUMNS)
+        elif current_view == 'calendar':
+            df = data.project(CALENDAR_COLUMNS)
+        else:
+            df = data.df
     
-    # Route to different views
-    current_view = st.session_state.current_view
+    # Quick Stats
+    with quick_stats:
+        st.markdown('<div class="sidebar-section">', unsafe_allow_html=True)
+        st.subheader("📊 Quick Stats")
+        
+        stats = data.stats
+        st.metric("Total Posts", stats['total'])
+        st.metric("Scheduled", stats['scheduled'])
+        st.metric("Queued", stats['queued'])
+        
+        if stats['total']:
+            st.metric("Top Category", stats['top_category'])
+        
+        show_api_metrics()
+        st.markdown('</div>', unsafe_allow_html=True)
     
+    # Route to different views
     if current_view == 'dashboard':
         show_dashboard(manager, df, client)
     elif current_view == 'posts':
@@ -936,11 +1841,7 @@ def show_dashboard(manager, df, client):
     col1, col2, col3, col4, col5 = st.columns(5)
     
     total_posts = len(df)
-    scheduled_posts = len(df[
-        (df['Month(1-12)'] != '') & 
-        (df['Day(1-31)'] != '') & 
-        (df['Year'] != '')
-    ]) if not df.empty else 0
+    scheduled_posts = len(manager.get_schedule_index(df))
     
     posts_with_media = len(df[
         (df['ImageURL'] != '') | (df['VideoURL'] != '')
@@ -1081,6 +1982,68 @@ def show_dashboard(manager, df, client):
             st.session_state.current_view = 'create'
             st.rerun()
 
+# Post lists render one page of cards per run
+POST_PAGE_SIZES = [10, 25, 50, 100]
+DEFAULT_POST_PAGE_SIZE = 25
+
+def paginate_posts(filtered_df, key, filters, focus_post_id=None):
+    """Current page of a filtered post list, with page size and navigation controls; returns (page, next_page)
+    
+    The page is kept per list in session state and goes back to the first page when the filters change.
+    focus_post_id jumps once to the page holding that post, e.g. one opened for editing from the calendar.
+    """
+    state_key = f"{key}_pagination"
+    if state_key not in st.session_state:
+        st.session_state[state_key] = {'page': 0, 'page_size': DEFAULT_POST_PAGE_SIZE, 'filters': filters, 'focus': None}
+    state = st.session_state[state_key]
+    
+    col1, col2, col3, col4 = st.columns([1, 1, 2, 1])
+    
+    with col4:
+        page_size = st.selectbox(
+            "Posts per page",
+            POST_PAGE_SIZES,
+            index=POST_PAGE_SIZES.index(DEFAULT_POST_PAGE_SIZE),
+            key=f"{key}_page_size"
+        )
+    
+    # Keep the first visible post in view when the page size changes
+    if page_size != state['page_size']:
+        state['page'] = state['page'] * state['page_size'] // page_size
+        state['page_size'] = page_size
+    
+    if filters != state['filters']:
+        state['filters'] = filters
+        state['page'] = 0
+    
+    if focus_post_id and focus_post_id != state['focus'] and 'PostID' in filtered_df.columns:
+        positions = np.flatnonzero(filtered_df['PostID'].values == focus_post_id)
+        if len(positions):
+            state['page'] = int(positions[0]) // page_size
+    state['focus'] = focus_post_id
+    
+    page_count = max(1, -(-len(filtered_df) // page_size))
+    state['page'] = min(state['page'], page_count - 1)
+    
+    with col1:
+        if st.button("◀ Previous", key=f"{key}_previous", disabled=state['page'] == 0):
+            state['page'] -= 1
+            st.rerun()
+    
+    with col2:
+        if st.button("Next ▶", key=f"{key}_next", disabled=state['page'] >= page_count - 1):
+            state['page'] += 1
+            st.rerun()
+    
+    with col3:
+        st.markdown(
+            f"<div style='text-align: center; padding-top: 8px;'>Page {state['page'] + 1} of {page_count}</div>",
+            unsafe_allow_html=True
+        )
+    
+    start = state['page'] * page_size
+    return filtered_df.iloc[start:start + page_size], filtered_df.iloc[start + page_size:start + 2 * page_size]
+
 def show_posts_view(manager, df, client):
     """Enhanced posts management view"""
     st.header("📋 Manage Your Posts")
@@ -1114,18 +2077,7 @@ def show_posts_view(manager, df, client):
         ]
     
     if status_filter != "All":
-        if status_filter == "Scheduled":
-            filtered_df = filtered_df[
-                (filtered_df['Month(1-12)'] != '') | 
-                (filtered_df['Day(1-31)'] != '') | 
-                (filtered_df['Year'] != '')
-            ]
-        else:  # Queued
-            filtered_df = filtered_df[
-                (filtered_df['Month(1-12)'] == '') & 
-                (filtered_df['Day(1-31)'] == '') & 
-                (filtered_df['Year'] == '')
-            ]
+        filtered_df = filtered_df[filtered_df['status'] == status_filter]
     
     # Apply sorting
     if not filtered_df.empty:
@@ -1153,14 +2105,23 @@ def show_posts_view(manager, df, client):
     # Display posts
     if not filtered_df.empty:
         if view_mode == "Cards":
+            # Only the current page is rendered
+            page_df, next_page_df = paginate_posts(
+                filtered_df, "posts_view", (category_filter, status_filter, sort_by, search_term)
+            )
+            
+            # Fetch the page's images together before rendering the cards, and the next page's in the background
+            manager.prefetch_thumbnails(page_df['ImageURL'])
+            manager.warm_thumbnails(next_page_df['ImageURL'])
+            
             # Enhanced card view
-            for i in range(0, len(filtered_df), 2):
+            for i in range(0, len(page_df), 2):
                 cols = st.columns(2)
                 
                 for j, col in enumerate(cols):
-                    if i + j < len(filtered_df):
+                    if i + j < len(page_df):
                         with col:
-                            manager.display_enhanced_post_card(filtered_df.iloc[i + j], i + j)
+                            manager.display_enhanced_post_card(page_df.iloc[i + j], page_df.index[i + j])
         else:
             # Table view
             display_columns = ['Message', 'Category', 'Month(1-12)', 'Day(1-31)', 'Year', 'Hour']
@@ -1344,11 +2305,8 @@ def show_manual_post_creation(manager, df, client):
                 'AltText': alt_text
             }
             
-            # Add to dataframe
-            new_df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-            
-            # Update Google Sheets
-            success, message_result = manager.update_sheet(client, st.session_state.sheet_url, new_df)
+            # Append to Google Sheets
+            success, message_result = manager.append_row(client, st.session_state.sheet_url, new_row)
             
             if success:
                 st.success("✅ Post created successfully!")
@@ -1693,7 +2651,7 @@ def show_analytics(manager, df, client):
     avg_length = df['Message'].str.len().mean()
     posts_with_links = len(df[df['Link'] != ''])
     posts_with_media = len(df[(df['ImageURL'] != '') | (df['VideoURL'] != '')])
-    scheduled_ratio = len(df[(df['Month(1-12)'] != '') & (df['Day(1-31)'] != '') & (df['Year'] != '')]) / total_posts * 100 if total_posts > 0 else 0
+    scheduled_ratio = len(manager.get_schedule_index(df)) / total_posts * 100 if total_posts > 0 else 0
     
     with col1:
         st.metric("Total Posts", total_posts)
@@ -1791,7 +2749,7 @@ def show_analytics(manager, df, client):
         st.subheader("📅 Scheduling Patterns")
         
         # Scheduled vs Queued
-        scheduled_count = len(df[(df['Month(1-12)'] != '') & (df['Day(1-31)'] != '') & (df['Year'] != '')])
+        scheduled_count = len(manager.get_schedule_index(df))
         queued_count = total_posts - scheduled_count
         
         fig = px.pie(
@@ -1927,14 +2885,9 @@ def show_calendar_view(manager, df, client):
         st.info("📅 No posts to display in calendar view.")
         return
     
-    # Filter for scheduled posts
-    scheduled_df = df[
-        (df['Month(1-12)'] != '') & 
-        (df['Day(1-31)'] != '') & 
-        (df['Year'] != '')
-    ].copy()
+    schedule = manager.get_schedule_index(df)
     
-    if scheduled_df.empty:
+    if len(schedule) == 0:
         st.info("📅 No scheduled posts found. Schedule some posts to see them in calendar view!")
         
         if st.button("➕ Schedule a Post"):
@@ -1946,7 +2899,7 @@ def show_calendar_view(manager, df, client):
     col1, col2, col3 = st.columns([2, 1, 1])
     
     with col1:
-        st.subheader(f"📊 {len(scheduled_df)} Scheduled Posts")
+        st.subheader(f"📊 {len(schedule)} Scheduled Posts")
     
     with col2:
         view_mode = st.selectbox("View Mode", ["Month", "Week", "List"])
@@ -1965,22 +2918,9 @@ def show_calendar_view(manager, df, client):
             index=current_date.year - 2024
         )
     
-    # Convert scheduling info to datetime
     try:
-        scheduled_df['scheduled_date'] = pd.to_datetime(
-            scheduled_df[['Year', 'Month(1-12)', 'Day(1-31)', 'Hour', 'Minute(0-59)']].rename(columns={
-                'Year': 'year',
-                'Month(1-12)': 'month', 
-                'Day(1-31)': 'day',
-                'Hour': 'hour',
-                'Minute(0-59)': 'minute'
-            })
-        )
-        
-        # Filter by selected month/year
-        month_filter = (scheduled_df['scheduled_date'].dt.month == selected_month) & \
-                      (scheduled_df['scheduled_date'].dt.year == selected_year)
-        month_posts = scheduled_df[month_filter]
+        # Posts in the selected month, straight from the sorted schedule index
+        month_posts = df.loc[schedule.in_month(selected_year, selected_month)]
         
         if view_mode == "Month":
             show_month_calendar(month_posts, selected_year, selected_month)
@@ -2005,7 +2945,7 @@ def show_month_calendar(posts_df, year, month):
     
     # Group posts by day
     if not posts_df.empty:
-        posts_by_day = posts_df.groupby(posts_df['scheduled_date'].dt.day).size().to_dict()
+        posts_by_day = posts_df.groupby(posts_df['scheduled_at'].dt.day).size().to_dict()
     else:
         posts_by_day = {}
     
@@ -2045,10 +2985,10 @@ def show_month_calendar(posts_df, year, month):
                         """, unsafe_allow_html=True)
                         
                         # Show posts for this day
-                        day_posts = posts_df[posts_df['scheduled_date'].dt.day == day]
+                        day_posts = posts_df[posts_df['scheduled_at'].dt.day == day]
                         with st.expander(f"Posts for {month_name} {day}"):
                             for _, post in day_posts.iterrows():
-                                time_str = post['scheduled_date'].strftime("%H:%M")
+                                time_str = post['scheduled_at'].strftime("%H:%M")
                                 message_preview = post['Message'][:100] + "..." if len(post['Message']) > 100 else post['Message']
                                 st.markdown(f"**{time_str}** - {message_preview}")
                     else:
@@ -2075,8 +3015,8 @@ def show_week_calendar(posts_df):
         return
     
     # Group by day of week
-    posts_df['day_of_week'] = posts_df['scheduled_date'].dt.day_name()
-    posts_df['hour'] = posts_df['scheduled_date'].dt.hour
+    posts_df['day_of_week'] = posts_df['scheduled_at'].dt.day_name()
+    posts_df['hour'] = posts_df['scheduled_at'].dt.hour
     
     days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
     
@@ -2087,7 +3027,7 @@ def show_week_calendar(posts_df):
             st.markdown(f"### {day}")
             
             for _, post in day_posts.iterrows():
-                time_str = post['scheduled_date'].strftime("%H:%M")
+                time_str = post['scheduled_at'].strftime("%H:%M")
                 
                 st.markdown(f"""
                 <div style="
@@ -2116,10 +3056,10 @@ def show_calendar_list(posts_df):
         return
     
     # Sort by scheduled date
-    posts_df_sorted = posts_df.sort_values('scheduled_date')
+    posts_df_sorted = posts_df.sort_values('scheduled_at')
     
     for _, post in posts_df_sorted.iterrows():
-        date_str = post['scheduled_date'].strftime("%B %d, %Y at %H:%M")
+        date_str = post['scheduled_at'].strftime("%B %d, %Y at %H:%M")
         
         with st.container():
             col1, col2 = st.columns([4, 1])
@@ -2258,7 +3198,7 @@ def show_bulk_actions(manager, df, client):
         with col1:
             st.markdown("### 📥 Export Data")
             
-            export_format = st.selectbox("Export Format", ["CSV", "JSON", "Excel"])
+            export_format = st.selectbox("Export Format", manager.get_export_formats())
             
             include_options = st.multiselect(
                 "Include Fields",
@@ -2266,74 +3206,66 @@ def show_bulk_actions(manager, df, client):
                 default=manager.column_names[:5]
             )
             
-            if st.button("📥 Export Data", type="primary"):
-                if export_format == "CSV":
-                    csv_data = df[include_options].to_csv(index=False)
-                    st.download_button(
-                        label="💾 Download CSV",
-                        data=csv_data,
-                        file_name=f"social_media_posts_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                        mime="text/csv"
-                    )
-                elif export_format == "JSON":
-                    json_data = df[include_options].to_json(orient='records', indent=2)
-                    st.download_button(
-                        label="💾 Download JSON",
-                        data=json_data,
-                        file_name=f"social_media_posts_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                        mime="application/json"
-                    )
-                else:  # Excel
-                    st.info("📊 Excel export coming soon!")
+            # The file is only built when the button is clicked, off the script thread
+            extension, mime = EXPORT_FORMATS[export_format]
+            version = manager.data_version
+            st.download_button(
+                label=f"💾 Download {export_format}",
+                data=lambda: manager.get_export(df, include_options, export_format, version),
+                file_name=f"social_media_posts_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}",
+                mime=mime,
+                type="primary",
+                disabled=not include_options
+            )
         
         with col2:
             st.markdown("### 📤 Import Data")
             
-            uploaded_file = st.file_uploader("📤 Upload File", type=["csv", "json"])
+            uploaded_file = st.file_uploader("📤 Upload File", type=["csv", "json", "jsonl"])
             
             if uploaded_file:
                 try:
-                    if uploaded_file.name.endswith('.csv'):
-                        new_df = pd.read_csv(uploaded_file)
-                    else:  # JSON
-                        new_df = pd.read_json(uploaded_file)
-                    
-                    # Ensure all required columns exist
-                    for col in manager.column_names:
-                        if col not in new_df.columns:
-                            new_df[col] = ''
-                    
-                    new_df = new_df[manager.column_names]
+                    # Only the first few rows are read for the preview
+                    preview = next(manager.iter_import_chunks(uploaded_file, chunk_rows=5), (pd.DataFrame(), 0))[0]
                     
                     st.markdown("**📋 Preview of uploaded data:**")
-                    st.dataframe(new_df.head(), use_container_width=True)
+                    st.dataframe(preview.reindex(columns=manager.column_names, fill_value=''), use_container_width=True)
                     
                     col1_1, col1_2 = st.columns(2)
+                    replace = None
                     
                     with col1_1:
                         if st.button("🔄 Replace All Data", type="secondary"):
-                            success, message = manager.update_sheet(
-                                client, st.session_state.sheet_url, new_df
-                            )
-                            if success:
-                                st.success("✅ Data replaced successfully!")
-                                time.sleep(1)
-                                st.rerun()
-                            else:
-                                st.error(f"❌ Error: {message}")
+                            replace = True
                     
                     with col1_2:
                         if st.button("➕ Append to Existing", type="primary"):
-                            combined_df = pd.concat([df, new_df], ignore_index=True)
-                            success, message = manager.update_sheet(
-                                client, st.session_state.sheet_url, combined_df
+                            replace = False
+                    
+                    if replace is not None:
+                        progress = st.empty()
+                        success, message, report = manager.import_posts(
+                            client, st.session_state.sheet_url, uploaded_file, df, replace=replace,
+                            on_progress=lambda report: progress.info(
+                                f"⏳ Read {report['rows']:,} rows, imported {report['imported']:,} posts..."
                             )
-                            if success:
-                                st.success("✅ Data appended successfully!")
+                        )
+                        progress.empty()
+                        
+                        if report['errors']:
+                            st.warning(f"⚠️ {report['error_count']} row(s) were skipped because of invalid values")
+                            st.dataframe(pd.DataFrame(report['errors'], columns=['Row', 'Problem']), use_container_width=True)
+                            if report['error_count'] > len(report['errors']):
+                                st.caption(f"Showing the first {len(report['errors'])} problems.")
+                        
+                        if not success:
+                            st.error(f"❌ Error: {message}")
+                        else:
+                            st.success(f"✅ {message}")
+                            # Stay on the page when there are skipped rows to look at
+                            if not report['errors']:
                                 time.sleep(1)
                                 st.rerun()
-                            else:
-                                st.error(f"❌ Error: {message}")
                 
                 except Exception as e:
                     st.error(f"❌ Error reading file: {str(e)}")
@@ -2366,18 +3298,7 @@ def show_bulk_actions(manager, df, client):
             edit_df = edit_df[edit_df['Category'] == edit_category]
         
         if edit_status != "All":
-            if edit_status == "Scheduled":
-                edit_df = edit_df[
-                    (edit_df['Month(1-12)'] != '') | 
-                    (edit_df['Day(1-31)'] != '') | 
-                    (edit_df['Year'] != '')
-                ]
-            else:  # Queued
-                edit_df = edit_df[
-                    (edit_df['Month(1-12)'] == '') & 
-                    (edit_df['Day(1-31)'] == '') & 
-                    (edit_df['Year'] == '')
-                ]
+            edit_df = edit_df[edit_df['status'] == edit_status]
         
         st.write(f"📊 {len(edit_df)} posts selected for editing")
         
@@ -2428,11 +3349,7 @@ def show_bulk_actions(manager, df, client):
         st.subheader("📅 Bulk Scheduling")
         
         # Select unscheduled posts
-        unscheduled_df = df[
-            (df['Month(1-12)'] == '') & 
-            (df['Day(1-31)'] == '') & 
-            (df['Year'] == '')
-        ]
+        unscheduled_df = df[df['status'] == 'Queued']
         
         if unscheduled_df.empty:
             st.info("📅 All posts are already scheduled!")
@@ -2547,6 +3464,11 @@ def show_bulk_actions(manager, df, client):
 def handle_post_actions(manager, df, client):
     """Handle various post actions like edit, delete, duplicate"""
     
+    # Actions hold the post's row label; drop any whose row is gone since it was clicked
+    for action in ['delete_post', 'duplicate_post']:
+        if action in st.session_state and st.session_state[action] not in df.index:
+            del st.session_state[action]
+    
     # Handle delete action
     if 'delete_post' in st.session_state:
         st.warning(f"⚠️ Are you sure you want to delete this post?")
@@ -2554,7 +3476,7 @@ def handle_post_actions(manager, df, client):
         col1, col2 = st.columns(2)
         with col1:
             if st.button("✅ Confirm Delete", type="secondary"):
-                df_updated = df.drop(df.index[st.session_state.delete_post]).reset_index(drop=True)
+                df_updated = df.drop(st.session_state.delete_post).reset_index(drop=True)
                 success, message = manager.update_sheet(client, st.session_state.sheet_url, df_updated)
                 if success:
                     st.success("✅ Post deleted successfully!")
@@ -2571,7 +3493,7 @@ def handle_post_actions(manager, df, client):
     
     # Handle duplicate action
     if 'duplicate_post' in st.session_state:
-        original_post = df.iloc[st.session_state.duplicate_post].copy()
+        original_post = df.loc[st.session_state.duplicate_post].copy()
         
         # Clear scheduling info for duplicate
         original_post['Month(1-12)'] = ''
@@ -2583,8 +3505,7 @@ def handle_post_actions(manager, df, client):
         # Add "Copy" to message
         original_post['Message'] = f"[COPY] {original_post['Message']}"
         
-        new_df = pd.concat([df, pd.DataFrame([original_post])], ignore_index=True)
-        success, message = manager.update_sheet(client, st.session_state.sheet_url, new_df)
+        success, message = manager.append_row(client, st.session_state.sheet_url, original_post)
         
         if success:
             st.success("✅ Post duplicated successfully!")
@@ -10,6 +10,11 @@ import io
 import re
 from typing import Optional
 import base64
+import hashlib
+import os
+import tempfile
+import threading
+import time
 
 # Page configuration
 st.set_page_config(
@@ -88,6 +93,125 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Card thumbnails, kept on disk so reruns and other sessions don't download the originals again
+THUMBNAIL_CACHE_DIR = os.environ.get('THUMBNAIL_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'social-media-thumbnails'))
+THUMBNAIL_CACHE_MAX_BYTES = int(os.environ.get('THUMBNAIL_CACHE_MAX_MB', '256')) * 1024 * 1024
+THUMBNAIL_SIZE = 480
+# Seconds a thumbnail is used without asking the origin whether the image has changed
+THUMBNAIL_MAX_AGE = float(os.environ.get('THUMBNAIL_MAX_AGE', '3600'))
+
+class ThumbnailCache:
+    """Disk LRU of resized WebP thumbnails keyed by image URL, with the origin's ETag/Last-Modified alongside
+    
+    Reading an entry bumps its mtime; once the directory passes max_bytes the least recently read go first.
+    Entries older than max_age are revalidated with a conditional request before they are used again.
+    """
+    
+    def __init__(self, directory=THUMBNAIL_CACHE_DIR, max_bytes=THUMBNAIL_CACHE_MAX_BYTES, size=THUMBNAIL_SIZE, max_age=THUMBNAIL_MAX_AGE):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.size = size
+        self.max_age = max_age
+        self.lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+    
+    def paths(self, url):
+        """Thumbnail and metadata file paths for a URL"""
+        base = os.path.join(self.directory, hashlib.sha256(url.encode('utf-8')).hexdigest())
+        return base + '.webp', base + '.json'
+    
+    def get(self, url):
+        """(thumbnail, metadata) for a cached URL, or None"""
+        image_path, meta_path = self.paths(url)
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            image = Image.open(image_path)
+            image.load()
+            os.utime(image_path)
+        except (OSError, ValueError):
+            return None
+        return image, meta
+    
+    def is_fresh(self, meta):
+        """Whether an entry can be used without revalidating it"""
+        return time.time() - meta.get('fetched_at', 0) < self.max_age
+    
+    def conditional_headers(self, meta):
+        """If-None-Match / If-Modified-Since headers from an entry's validators"""
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+    
+    def mark_fresh(self, url, meta, headers):
+        """Record a 304 Not Modified: keep the thumbnail, restart its max-age and take any updated validators"""
+        meta = dict(meta, fetched_at=time.time())
+        if headers.get('ETag'):
+            meta['etag'] = headers['ETag']
+        if headers.get('Last-Modified'):
+            meta['last_modified'] = headers['Last-Modified']
+        
+        _, meta_path = self.paths(url)
+        self.write_file(meta_path, lambda f: f.write(json.dumps(meta).encode('utf-8')))
+    
+    def put(self, url, content, headers):
+        """Resize downloaded image bytes, store the thumbnail with its validators and return it"""
+        image = Image.open(io.BytesIO(content))
+        image.thumbnail((self.size, self.size))
+        if image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGBA' if image.mode in ('LA', 'PA') or 'transparency' in image.info else 'RGB')
+        
+        meta = {
+            'url': url,
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'fetched_at': time.time()
+        }
+        image_path, meta_path = self.paths(url)
+        self.write_file(image_path, lambda f: image.save(f, format='WEBP', quality=80))
+        self.write_file(meta_path, lambda f: f.write(json.dumps(meta).encode('utf-8')))
+        self.evict()
+        return image
+    
+    def write_file(self, path, write):
+        """Write through a temporary file and rename, so readers never see half a file"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                write(f)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def evict(self):
+        """Remove least recently used thumbnails until the cache fits in max_bytes"""
+        with self.lock:
+            entries = []
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith('.webp'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.path, stat.st_size))
+            
+            total = sum(size for _, _, size in entries)
+            for _, path, size in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                for stale_path in (path, path[:-len('.webp')] + '.json'):
+                    try:
+                        os.remove(stale_path)
+                    except OSError:
+                        pass
+                total -= size
+
+@st.cache_resource
+def get_thumbnail_cache():
+    """Process-wide thumbnail cache shared by all sessions"""
+    return ThumbnailCache()
+
 class SocialMediaManager:
     def __init__(self):
         self.column_names = [
@@ -130,7 +254,10 @@ class SocialMediaManager:
     def get_sheet_data(self, client, sheet_url):
         """Fetch data from Google Sheets"""
         try:
-            sheet = client.open_by_url(sheet_url).sheet1
+            spreadsheet = client.open_by_url(sheet_url)
+            sheet = spreadsheet.sheet1
+            # Read the revision before the data so a concurrent edit can only make the snapshot look older
+            revision = self.get_sheet_revision(client, spreadsheet)
             data = sheet.get_all_records()
             
             if not data:
@@ -145,24 +272,88 @@ class SocialMediaManager:
                 if col not in df.columns:
                     df[col] = ''
             
-            return df[self.column_names]
+            df = df[self.column_names]
+            self.remember_sheet_snapshot(sheet_url, df, revision)
+            return df
         except Exception as e:
             st.error(f"Error reading sheet: {str(e)}")
             return pd.DataFrame(columns=self.column_names)
     
+    def get_sheet_revision(self, client, spreadsheet):
+        """The spreadsheet's Drive modifiedTime, or None if Drive can't be asked"""
+        try:
+            return client.get_file_drive_metadata(spreadsheet.id).get('modifiedTime')
+        except Exception:
+            return None
+    
+    def remember_sheet_snapshot(self, sheet_url, df, revision):
+        """Keep the last rows read from or written to a sheet with the sheet revision they match, used to diff the next write"""
+        if 'sheet_snapshots' not in st.session_state:
+            st.session_state.sheet_snapshots = {}
+        if revision:
+            st.session_state.sheet_snapshots[sheet_url] = {'revision': revision, 'rows': df.fillna('').values.tolist()}
+        else:
+            st.session_state.sheet_snapshots.pop(sheet_url, None)
+    
     def update_sheet(self, client, sheet_url, df):
-        """Update Google Sheets with DataFrame"""
+        """Update Google Sheets with DataFrame, sending only the cells that changed"""
         try:
-            sheet = client.open_by_url(sheet_url).sheet1
-            sheet.clear()
+            spreadsheet = client.open_by_url(sheet_url)
+            sheet = spreadsheet.sheet1
+            df = df.reindex(columns=self.column_names, fill_value='')
+            new_rows = df.fillna('').values.tolist()
+            
+            # The diff is only safe if nobody has changed the sheet since the snapshot was taken
+            snapshot = st.session_state.get('sheet_snapshots', {}).get(sheet_url)
+            if snapshot is not None and snapshot['revision'] != self.get_sheet_revision(client, spreadsheet):
+                snapshot = None
+            updates = self.diff_sheet_rows(snapshot['rows'], new_rows) if snapshot is not None else None
             
-            # Update with headers and data
-            data_to_upload = [self.column_names] + df.fillna('').values.tolist()
-            sheet.update(f'A1:S{len(data_to_upload)}', data_to_upload)
+            if updates is None:
+                self.rewrite_sheet(sheet, new_rows)
+            elif updates:
+                sheet.batch_update(updates)
+            
+            self.remember_sheet_snapshot(sheet_url, df, self.get_sheet_revision(client, spreadsheet))
             return True, "Sheet updated successfully!"
         except Exception as e:
+            # A failed write may have partially applied, so the snapshot can no longer be trusted
+            st.session_state.get('sheet_snapshots', {}).pop(sheet_url, None)
             return False, f"Error updating sheet: {str(e)}"
     
+    def diff_sheet_rows(self, old_rows, new_rows):
+        """Build batch_update ranges for the cells that differ between two lists of sheet rows
+        
+        Returns None when enough rows changed that a full rewrite is the cheaper request.
+        """
+        width = len(self.column_names)
+        updates = []
+        
+        for i in range(max(len(old_rows), len(new_rows))):
+            # Rows past the new end are blanked out; rows past the old end are written in full
+            old = old_rows[i] if i < len(old_rows) else [None] * width
+            new = new_rows[i] if i < len(new_rows) else [''] * width
+            
+            changed_cols = [j for j in range(width) if str(old[j]) != str(new[j])]
+            if not changed_cols:
+                continue
+            
+            first, last = changed_cols[0], changed_cols[-1]
+            start = gspread.utils.rowcol_to_a1(i + 2, first + 1)
+            end = gspread.utils.rowcol_to_a1(i + 2, last + 1)
+            updates.append({'range': f'{start}:{end}', 'values': [list(new[first:last + 1])]})
+        
+        if len(updates) > 50 and len(updates) > len(new_rows) // 2:
+            return None
+        
+        return updates
+    
+    def rewrite_sheet(self, sheet, rows):
+        """Overwrite the whole sheet, then trim leftovers so it is never left empty mid-write"""
+        data_to_upload = [self.column_names] + rows
+        sheet.update(range_name=f'A1:S{len(data_to_upload)}', values=data_to_upload)
+        sheet.batch_clear([f'A{len(data_to_upload) + 1}:S'])
+    
     def load_image_from_url(self, url):
         """Load and display image from URL"""
         try:
@@ -177,6 +368,29 @@ class SocialMediaManager:
             pass
         return None
     
+    def load_thumbnail(self, url):
+        """Card-sized copy of an image, served from the disk cache after the first download"""
+        if not url or not url.startswith(('http://', 'https://')):
+            return None
+        
+        cache = get_thumbnail_cache()
+        cached = cache.get(url)
+        if cached and cache.is_fresh(cached[1]):
+            return cached[0]
+        
+        # Past max-age, ask the origin whether the image changed; a 304 costs no body
+        headers = cache.conditional_headers(cached[1]) if cached else {}
+        try:
+            response = requests.get(url, headers=headers, timeout=10)
+            if cached and response.status_code == 304:
+                cache.mark_fresh(url, cached[1], response.headers)
+                return cached[0]
+            response.raise_for_status()
+            return cache.put(url, response.content, response.headers)
+        except Exception:
+            # Keep showing the old thumbnail while the origin can't be reached
+            return cached[0] if cached else None
+    
     def truncate_text(self, text, max_length):
         """Truncate text with ellipsis"""
         if len(text) <= max_length:
@@ -225,9 +439,10 @@ class SocialMediaManager:
             
             # Display media if available
             if row.get('ImageURL'):
-                image = self.load_image_from_url(row.get('ImageURL'))
+                image = self.load_thumbnail(row.get('ImageURL'))
                 if image:
                     st.image(image, caption="Post Image", use_column_width=True)
+                    st.markdown(f"🔍 [Full size]({row.get('ImageURL')})")
                 else:
                     st.info(f"🖼️ Image URL: {row.get('ImageURL')}")
             
@@ -19,6 +19,7 @@ import hashlib
 import time
 from collections import Counter
 import numpy as np
+import uuid
 
 # Page configuration
 st.set_page_config(
@@ -132,7 +133,7 @@ class SocialMediaManager:
             'Message', 'Link', 'ImageURL', 'VideoURL', 'Month(1-12)', 
             'Day(1-31)', 'Year', 'Hour', 'Minute(0-59)', 'PinTitle', 
             'Category', 'Watermark', 'HashtagGroup', 'VideoThumbnailURL',
-            'CTAGroup', 'FirstComment', 'Story(YorN)', 'PinterestBoard', 'AltText'
+            'CTAGroup', 'FirstComment', 'Story(YorN)', 'PinterestBoard', 'AltText', 'PostID'
         ]
         
         self.platform_limits = {
@@ -145,6 +146,9 @@ class SocialMediaManager:
             'YouTube': {'limit': 5000, 'optimal': 125, 'color': '#ff0000'},
             'Snapchat': {'limit': 250, 'optimal': 80, 'color': '#fffc00'}
         }
+        
+        # PostID -> row index for the data loaded this run, see index_posts()
+        self.post_index = {}
     
     def setup_google_sheets(self):
         """Initialize Google Sheets connection"""
@@ -169,7 +173,10 @@ class SocialMediaManager:
     def get_sheet_data(self, client, sheet_url):
         """Fetch data from Google Sheets"""
         try:
-            sheet = client.open_by_url(sheet_url).sheet1
+            spreadsheet = client.open_by_url(sheet_url)
+            sheet = spreadsheet.sheet1
+            # Read the revision before the data so a concurrent edit can only make the snapshot look older
+            revision = self.get_sheet_revision(client, spreadsheet)
             data = sheet.get_all_records()
             
             if not data:
@@ -182,23 +189,137 @@ class SocialMediaManager:
                 if col not in df.columns:
                     df[col] = ''
             
-            return df[self.column_names]
+            # Backfill ids for sheets created before the PostID column existed
+            df, backfilled = self.assign_post_ids(df[self.column_names])
+            if backfilled:
+                try:
+                    self.write_post_ids(sheet, df)
+                    revision = self.get_sheet_revision(client, spreadsheet)
+                except Exception as e:
+                    # The sheet doesn't hold these ids, so keep no snapshot and let the next write send them in full
+                    revision = None
+                    st.warning(f"Could not save post ids to the sheet: {str(e)}")
+            
+            self.remember_sheet_snapshot(sheet_url, df, revision)
+            self.index_posts(df)
+            return df
         except Exception as e:
             st.error(f"Error reading sheet: {str(e)}")
             return pd.DataFrame(columns=self.column_names)
     
+    def get_sheet_revision(self, client, spreadsheet):
+        """The spreadsheet's Drive modifiedTime, or None if Drive can't be asked"""
+        try:
+            return client.get_file_drive_metadata(spreadsheet.id).get('modifiedTime')
+        except Exception:
+            return None
+    
+    def remember_sheet_snapshot(self, sheet_url, df, revision):
+        """Keep the last rows read from or written to a sheet with the sheet revision they match, used to diff the next write"""
+        if 'sheet_snapshots' not in st.session_state:
+            st.session_state.sheet_snapshots = {}
+        if revision:
+            st.session_state.sheet_snapshots[sheet_url] = {'revision': revision, 'rows': df.fillna('').values.tolist()}
+        else:
+            st.session_state.sheet_snapshots.pop(sheet_url, None)
+    
     def update_sheet(self, client, sheet_url, df):
-        """Update Google Sheets with DataFrame"""
+        """Update Google Sheets with DataFrame, sending only the cells that changed"""
         try:
-            sheet = client.open_by_url(sheet_url).sheet1
-            sheet.clear()
+            spreadsheet = client.open_by_url(sheet_url)
+            sheet = spreadsheet.sheet1
+            df = df.reindex(columns=self.column_names, fill_value='')
+            df, _ = self.assign_post_ids(df)
+            new_rows = df.fillna('').values.tolist()
             
-            data_to_upload = [self.column_names] + df.fillna('').values.tolist()
-            sheet.update(f'A1:S{len(data_to_upload)}', data_to_upload)
+            # The diff is only safe if nobody has changed the sheet since the snapshot was taken
+            snapshot = st.session_state.get('sheet_snapshots', {}).get(sheet_url)
+            if snapshot is not None and snapshot['revision'] != self.get_sheet_revision(client, spreadsheet):
+                snapshot = None
+            updates = self.diff_sheet_rows(snapshot['rows'], new_rows) if snapshot is not None else None
+            
+            if updates is None:
+                self.rewrite_sheet(sheet, new_rows)
+            elif updates:
+                sheet.batch_update(updates)
+            
+            self.remember_sheet_snapshot(sheet_url, df, self.get_sheet_revision(client, spreadsheet))
             return True, "Sheet updated successfully!"
         except Exception as e:
+            # A failed write may have partially applied, so the snapshot can no longer be trusted
+            st.session_state.get('sheet_snapshots', {}).pop(sheet_url, None)
             return False, f"Error updating sheet: {str(e)}"
     
+    def diff_sheet_rows(self, old_rows, new_rows):
+        """Build batch_update ranges for the cells that differ between two lists of sheet rows
+        
+        Returns None when enough rows changed that a full rewrite is the cheaper request.
+        """
+        width = len(self.column_names)
+        updates = []
+        
+        for i in range(max(len(old_rows), len(new_rows))):
+            # Rows past the new end are blanked out; rows past the old end are written in full
+            old = old_rows[i] if i < len(old_rows) else [None] * width
+            new = new_rows[i] if i < len(new_rows) else [''] * width
+            
+            changed_cols = [j for j in range(width) if str(old[j]) != str(new[j])]
+            if not changed_cols:
+                continue
+            
+            first, last = changed_cols[0], changed_cols[-1]
+            start = gspread.utils.rowcol_to_a1(i + 2, first + 1)
+            end = gspread.utils.rowcol_to_a1(i + 2, last + 1)
+            updates.append({'range': f'{start}:{end}', 'values': [list(new[first:last + 1])]})
+        
+        if len(updates) > 50 and len(updates) > len(new_rows) // 2:
+            return None
+        
+        return updates
+    
+    def rewrite_sheet(self, sheet, rows):
+        """Overwrite the whole sheet, then trim leftovers so it is never left empty mid-write"""
+        data_to_upload = [self.column_names] + rows
+        last_col = self.get_last_column_letter()
+        sheet.update(range_name=f'A1:{last_col}{len(data_to_upload)}', values=data_to_upload)
+        sheet.batch_clear([f'A{len(data_to_upload) + 1}:{last_col}'])
+    
+    def get_last_column_letter(self):
+        """Sheet column letter of the last managed column (PostID)"""
+        return re.sub(r'\d', '', gspread.utils.rowcol_to_a1(1, len(self.column_names)))
+    
+    def generate_post_id(self):
+        """New unique id for a post row, prefixed so Sheets never reads it as a number"""
+        return f"P{uuid.uuid4().hex[:11]}"
+    
+    def assign_post_ids(self, df):
+        """Give rows without a PostID a new one; returns (df, whether any ids were added)"""
+        missing = df['PostID'].fillna('').astype(str) == ''
+        if not missing.any():
+            return df, False
+        
+        df = df.copy()
+        df.loc[missing, 'PostID'] = [self.generate_post_id() for _ in range(int(missing.sum()))]
+        return df, True
+    
+    def write_post_ids(self, sheet, df):
+        """Write the whole PostID column back in one request"""
+        if sheet.col_count < len(self.column_names):
+            sheet.add_cols(len(self.column_names) - sheet.col_count)
+        
+        last_col = self.get_last_column_letter()
+        values = [['PostID']] + [[post_id] for post_id in df['PostID']]
+        sheet.update(range_name=f'{last_col}1:{last_col}{len(values)}', values=values)
+    
+    def index_posts(self, df):
+        """Build the PostID -> row index lookup used by post actions this run"""
+        self.post_index = {post_id: index for index, post_id in zip(df.index, df['PostID']) if post_id}
+        return self.post_index
+    
+    def get_post_row(self, post_id):
+        """Row index of a post in this run's data, or None if it no longer exists"""
+        return self.post_index.get(post_id)
+    
     def safe_int_conversion(self, value, default=0):
         """Safely convert value to integer with fallback"""
         try:
@@ -366,9 +487,13 @@ def show_posts_for_date(manager, date_info, df, client):
         manager.safe_int_conversion(x.get('Minute(0-59)', ''), 0)
     ))
     
-    for i, post in enumerate(posts_sorted):
-        # Find the original index in the dataframe
-        original_index = df[df['Message'] == post['Message']].index[0] if not df[df['Message'] == post['Message']].empty else i
+    for post in posts_sorted:
+        # Find the post's current row; the selection may predate an edit or delete
+        post_id = post.get('PostID', '')
+        original_index = manager.get_post_row(post_id)
+        if original_index is None:
+            continue
+        post = df.loc[original_index]
         
         # Post card
         st.markdown('<div class="post-card-clean">', unsafe_allow_html=True)
@@ -420,29 +545,29 @@ def show_posts_for_date(manager, date_info, df, client):
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            if st.button("✏️ Edit", key=f"edit_{original_index}"):
-                st.session_state.editing_post = original_index
+            if st.button("✏️ Edit", key=f"edit_{post_id}"):
+                st.session_state.editing_post = post_id
                 st.rerun()
         
         with col2:
-            if st.button("📅 Change Date", key=f"change_date_{original_index}"):
-                st.session_state.editing_post_date = original_index
+            if st.button("📅 Change Date", key=f"change_date_{post_id}"):
+                st.session_state.editing_post_date = post_id
                 st.session_state.page = "edit_dates"
                 st.rerun()
         
         with col3:
-            if st.button("📋 Duplicate", key=f"duplicate_{original_index}"):
+            if st.button("📋 Duplicate", key=f"duplicate_{post_id}"):
                 duplicate_post(manager, df, client, original_index)
         
         with col4:
-            if st.button("🗑️ Delete", key=f"delete_{original_index}"):
-                if st.button("Confirm Delete", key=f"confirm_delete_{original_index}"):
+            if st.button("🗑️ Delete", key=f"delete_{post_id}"):
+                if st.button("Confirm Delete", key=f"confirm_delete_{post_id}"):
                     delete_post(manager, df, client, original_index)
         
         st.markdown('</div>', unsafe_allow_html=True)
         
         # Handle inline editing
-        if 'editing_post' in st.session_state and st.session_state.editing_post == original_index:
+        if 'editing_post' in st.session_state and st.session_state.editing_post == post_id:
             show_inline_edit_form(manager, df, client, original_index, post)
 
 def show_inline_edit_form(manager, df, client, index, post):
@@ -489,6 +614,68 @@ def show_inline_edit_form(manager, df, client, index, post):
                 del st.session_state.editing_post
                 st.rerun()
 
+# Post lists render one page of cards per run
+POST_PAGE_SIZES = [10, 25, 50, 100]
+DEFAULT_POST_PAGE_SIZE = 25
+
+def paginate_posts(filtered_df, key, filters, focus_post_id=None):
+    """Current page of a filtered post list, with page size and navigation controls; returns (page, next_page)
+    
+    The page is kept per list in session state and goes back to the first page when the filters change.
+    focus_post_id jumps once to the page holding that post, e.g. one opened for editing from the calendar.
+    """
+    state_key = f"{key}_pagination"
+    if state_key not in st.session_state:
+        st.session_state[state_key] = {'page': 0, 'page_size': DEFAULT_POST_PAGE_SIZE, 'filters': filters, 'focus': None}
+    state = st.session_state[state_key]
+    
+    col1, col2, col3, col4 = st.columns([1, 1, 2, 1])
+    
+    with col4:
+        page_size = st.selectbox(
+            "Posts per page",
+            POST_PAGE_SIZES,
+            index=POST_PAGE_SIZES.index(DEFAULT_POST_PAGE_SIZE),
+            key=f"{key}_page_size"
+        )
+    
+    # Keep the first visible post in view when the page size changes
+    if page_size != state['page_size']:
+        state['page'] = state['page'] * state['page_size'] // page_size
+        state['page_size'] = page_size
+    
+    if filters != state['filters']:
+        state['filters'] = filters
+        state['page'] = 0
+    
+    if focus_post_id and focus_post_id != state['focus'] and 'PostID' in filtered_df.columns:
+        positions = np.flatnonzero(filtered_df['PostID'].values == focus_post_id)
+        if len(positions):
+            state['page'] = int(positions[0]) // page_size
+    state['focus'] = focus_post_id
+    
+    page_count = max(1, -(-len(filtered_df) // page_size))
+    state['page'] = min(state['page'], page_count - 1)
+    
+    with col1:
+        if st.button("◀ Previous", key=f"{key}_previous", disabled=state['page'] == 0):
+            state['page'] -= 1
+            st.rerun()
+    
+    with col2:
+        if st.button("Next ▶", key=f"{key}_next", disabled=state['page'] >= page_count - 1):
+            state['page'] += 1
+            st.rerun()
+    
+    with col3:
+        st.markdown(
+            f"<div style='text-align: center; padding-top: 8px;'>Page {state['page'] + 1} of {page_count}</div>",
+            unsafe_allow_html=True
+        )
+    
+    start = state['page'] * page_size
+    return filtered_df.iloc[start:start + page_size], filtered_df.iloc[start + page_size:start + 2 * page_size]
+
 def show_edit_dates_page(manager, df, client):
     """Separate page for editing posting dates and times"""
     st.markdown('<div class="main-header"><h2>📅 Edit Posting Dates & Times</h2></div>', unsafe_allow_html=True)
@@ -536,8 +723,12 @@ def show_edit_dates_page(manager, df, client):
             filtered_df['Message'].str.contains(search_term, case=False, na=False)
         ]
     
-    # Show posts
-    for index, post in filtered_df.iterrows():
+    # Show the current page of posts
+    page_df, _ = paginate_posts(
+        filtered_df, "edit_dates", (filter_option, search_term),
+        focus_post_id=st.session_state.get('editing_post_date')
+    )
+    for index, post in page_df.iterrows():
         st.markdown('<div class="post-card-clean">', unsafe_allow_html=True)
         
         # Post info
@@ -570,14 +761,14 @@ def show_edit_dates_page(manager, df, client):
             st.markdown(f'<div class="post-content">{preview}</div>', unsafe_allow_html=True)
         
         with col2:
-            if st.button("📅 Edit Date/Time", key=f"edit_date_{index}"):
-                st.session_state.editing_post_date = index
+            if st.button("📅 Edit Date/Time", key=f"edit_date_{post['PostID']}"):
+                st.session_state.editing_post_date = post['PostID']
                 st.rerun()
         
         st.markdown('</div>', unsafe_allow_html=True)
         
         # Show edit form if this post is being edited
-        if 'editing_post_date' in st.session_state and st.session_state.editing_post_date == index:
+        if 'editing_post_date' in st.session_state and st.session_state.editing_post_date == post['PostID']:
             show_date_edit_form(manager, df, client, index, post)
 
 def show_date_edit_form(manager, df, client, index, post):
@@ -715,6 +906,7 @@ def duplicate_post(manager, df, client, index):
     if index < len(df):
         post = df.iloc[index].copy()
         post['Message'] = f"[COPY] {post['Message']}"
+        post['PostID'] = manager.generate_post_id()
         
         # Clear scheduling to avoid conflicts
         post['Month(1-12)'] = ''
@@ -793,8 +985,9 @@ def show_posts_list(manager, df, client):
     
     st.write(f"Showing {len(filtered_df)} of {len(df)} posts")
     
-    # Display posts
-    for index, post in filtered_df.iterrows():
+    # Display the current page of posts
+    page_df, _ = paginate_posts(filtered_df, "posts_list", (category_filter, status_filter, search_term))
+    for index, post in page_df.iterrows():
         st.markdown('<div class="post-card-clean">', unsafe_allow_html=True)
         
         # Status and scheduling info
@@ -844,12 +1037,12 @@ def show_posts_list(manager, df, client):
         
         with col1:
             if st.button("✏️ Edit", key=f"edit_list_{index}"):
-                st.session_state.editing_post = index
+                st.session_state.editing_post = post['PostID']
                 st.rerun()
         
         with col2:
             if st.button("📅 Schedule", key=f"schedule_list_{index}"):
-                st.session_state.editing_post_date = index
+                st.session_state.editing_post_date = post['PostID']
                 st.session_state.page = "edit_dates"
                 st.rerun()
         
@@ -4,6 +4,7 @@ import gspread
 from google.oauth2.service_account import Credentials
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload
+from googleapiclient.errors import HttpError
 import json
 from datetime import datetime, timedelta
 import requests
@@ -21,8 +22,13 @@ import hashlib
 import time
 from collections import Counter
 import numpy as np
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import sqlite3
 import tempfile
 import os
+import uuid
+import random
 
 # Page configuration
 st.set_page_config(
@@ -332,13 +338,1124 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Shared sheet cache (one per server process, shared by all sessions)
+@st.cache_resource
+def get_shared_sheet_cache():
+    """Parsed sheet DataFrames keyed by spreadsheet id, tagged with the Drive revision they were read at"""
+    return {'lock': threading.Lock(), 'sheets': {}}
+
+# Google API client pool (one per server process, keyed by service account)
+@st.cache_resource
+def get_google_client_pool():
+    """Authorized credentials and Sheets clients per service-account fingerprint"""
+    return {'lock': threading.Lock(), 'clients': {}}
+
+@st.cache_resource
+def get_drive_folder_cache():
+    """Media folder id and sharing per (service-account fingerprint, sheet), kept for the process lifetime"""
+    return {'lock': threading.Lock(), 'folders': {}}
+
+# Files up to this size go up in a single multipart request instead of a two-step resumable upload
+DRIVE_SIMPLE_UPLOAD_MAX_BYTES = 5 * 1024 * 1024
+# Drive's batch endpoint accepts at most 100 calls per request
+DRIVE_BATCH_MAX_CALLS = 100
+
+# Google API rate limiting (one per server process, shared by all sessions)
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+class GoogleApiLimiter:
+    """Token bucket with jittered exponential backoff and per-call metrics for one Google API
+    
+    Sessions share the service account's quota, so every call waits for a token first. Calls
+    that fail with 429 or a 5xx are retried with growing, randomized delays.
+    """
+    
+    def __init__(self, rate, burst, max_retries=5, base_delay=1.0, max_delay=32.0):
+        self.rate = rate
+        self.burst = burst
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.lock = threading.Lock()
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.metrics = {}
+    
+    def acquire(self):
+        """Block until a request token is available"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+    
+    def is_retryable(self, error):
+        """Whether an exception is a quota or server error worth retrying"""
+        if isinstance(error, gspread.exceptions.APIError):
+            return error.code in RETRYABLE_STATUS_CODES
+        if isinstance(error, HttpError):
+            return error.resp.status in RETRYABLE_STATUS_CODES
+        return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+    
+    def record(self, name, elapsed, retried=False, failed=False):
+        """Add one attempt to the metrics for a call name"""
+        with self.lock:
+            stats = self.metrics.setdefault(name, {'calls': 0, 'retries': 0, 'errors': 0, 'total_time': 0.0, 'max_time': 0.0})
+            stats['calls'] += 0 if retried else 1
+            stats['retries'] += 1 if retried else 0
+            stats['errors'] += 1 if failed else 0
+            stats['total_time'] += elapsed
+            stats['max_time'] = max(stats['max_time'], elapsed)
+    
+    def call(self, name, func, *args, **kwargs):
+        """Run func under the rate limit, retrying quota and server errors"""
+        for attempt in range(self.max_retries + 1):
+            self.acquire()
+            start = time.monotonic()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                elapsed = time.monotonic() - start
+                if attempt == self.max_retries or not self.is_retryable(e):
+                    self.record(name, elapsed, failed=True)
+                    raise
+                
+                self.record(name, elapsed, retried=True)
+                delay = min(self.max_delay, self.base_delay * 2 ** attempt)
+                time.sleep(delay / 2 + random.uniform(0, delay / 2))
+            else:
+                self.record(name, time.monotonic() - start)
+                return result
+    
+    def get_metrics(self):
+        """Copy of the per-call metrics"""
+        with self.lock:
+            return {name: dict(stats) for name, stats in self.metrics.items()}
+
+@st.cache_resource
+def get_google_api_limiters():
+    """Rate limiters per API; Sheets allows far fewer requests per minute than Drive"""
+    return {
+        'sheets': GoogleApiLimiter(rate=1.0, burst=10),
+        'drive': GoogleApiLimiter(rate=10.0, burst=20)
+    }
+
+# Rows per batch_get request when reading a sheet
+SHEET_CHUNK_ROWS = 2000
+
+# Optional local mirror of content sheets
+MIRROR_DB_PATH = "social_media_mirror.db"
+
+class SheetMirror:
+    """Local SQLite copy of content sheets, synced row by row using content hashes
+    
+    Edits that could not be written to the sheet are kept per PostID in pending_edits,
+    so a failed write is pushed again later instead of being lost, onto whichever rows
+    those posts occupy by then.
+    """
+    
+    def __init__(self, db_path, column_names):
+        self.column_names = list(column_names)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.ensure_schema()
+    
+    def ensure_schema(self):
+        """Create the tables, rebuilding them if the sheet columns have changed"""
+        expected = ['sheet_id', 'row_num', 'row_hash', 'sched_year', 'sched_month', 'sched_day'] + self.column_names
+        
+        with self.lock, self.conn:
+            existing = [row[1] for row in self.conn.execute('PRAGMA table_info(posts)')]
+            if existing and existing != expected:
+                self.conn.execute('DROP TABLE posts')
+                self.conn.execute('DROP TABLE IF EXISTS sync_state')
+                self.conn.execute('DROP TABLE IF EXISTS pending_edits')
+            
+            # Sheet columns are declared without a type so ints and strings round-trip unchanged
+            quoted = ', '.join(f'"{col}"' for col in self.column_names)
+            self.conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS posts (
+                    sheet_id TEXT NOT NULL,
+                    row_num INTEGER NOT NULL,
+                    row_hash TEXT NOT NULL,
+                    sched_year INTEGER,
+                    sched_month INTEGER,
+                    sched_day INTEGER,
+                    {quoted},
+                    PRIMARY KEY (sheet_id, row_num)
+                )
+            """)
+            self.conn.execute('CREATE INDEX IF NOT EXISTS idx_posts_schedule ON posts (sheet_id, sched_year, sched_month, sched_day)')
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS sync_state (
+                    sheet_id TEXT PRIMARY KEY,
+                    revision TEXT,
+                    synced_at REAL
+                )
+            """)
+            # kind is 'update' (changes holds the edited cells), 'append' (the whole new row) or 'delete'
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS pending_edits (
+                    sheet_id TEXT NOT NULL,
+                    post_id TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    kind TEXT NOT NULL,
+                    changes TEXT,
+                    PRIMARY KEY (sheet_id, post_id)
+                )
+            """)
+    
+    def row_hash(self, values):
+        """Content hash of one sheet row; ints and their string form hash the same"""
+        return hashlib.sha256(json.dumps([str(v) for v in values]).encode('utf-8')).hexdigest()
+    
+    def schedule_key(self, values):
+        """Integer (year, month, day) for the schedule index, None where unset"""
+        keys = []
+        for col in ['Year', 'Month(1-12)', 'Day(1-31)']:
+            try:
+                keys.append(int(float(str(values[self.column_names.index(col)]))))
+            except (ValueError, TypeError):
+                keys.append(None)
+        return keys
+    
+    def get_revision(self, sheet_id):
+        """Sheet revision the mirror was last synced at, or None"""
+        with self.lock:
+            row = self.conn.execute('SELECT revision FROM sync_state WHERE sheet_id = ?', (sheet_id,)).fetchone()
+        return row[0] if row else None
+    
+    def has_pending_edits(self, sheet_id):
+        """Whether local edits are waiting to be written to the sheet"""
+        with self.lock:
+            row = self.conn.execute('SELECT 1 FROM pending_edits WHERE sheet_id = ? LIMIT 1', (sheet_id,)).fetchone()
+        return row is not None
+    
+    def forget_revision(self, sheet_id):
+        """Force the next read to go back to the sheet"""
+        with self.lock, self.conn:
+            self.conn.execute('UPDATE sync_state SET revision = NULL WHERE sheet_id = ?', (sheet_id,))
+    
+    def write_rows(self, sheet_id, df):
+        """Upsert the rows whose hash changed; returns (rows written, row count)"""
+        rows = sheet_values(df.reindex(columns=self.column_names, fill_value=''))
+        existing = dict(self.conn.execute('SELECT row_num, row_hash FROM posts WHERE sheet_id = ?', (sheet_id,)))
+        
+        changed = []
+        for row_num, values in enumerate(rows):
+            row_hash = self.row_hash(values)
+            if existing.get(row_num) == row_hash:
+                continue
+            changed.append([sheet_id, row_num, row_hash] + self.schedule_key(values) + values)
+        
+        placeholders = ', '.join(['?'] * (6 + len(self.column_names)))
+        self.conn.executemany(f'INSERT OR REPLACE INTO posts VALUES ({placeholders})', changed)
+        return len(changed), len(rows)
+    
+    def sync_from_sheet(self, sheet_id, revision, df, keep_dirty=True):
+        """Bring the mirror up to date with sheet contents, touching only rows whose hash changed
+        
+        keep_dirty leaves unpushed local edits staged; pass False after writing df to the sheet to clear them.
+        """
+        if keep_dirty and self.get_revision(sheet_id) == revision:
+            return 0
+        
+        with self.lock, self.conn:
+            changed, row_count = self.write_rows(sheet_id, df)
+            self.conn.execute('DELETE FROM posts WHERE sheet_id = ? AND row_num >= ?', (sheet_id, row_count))
+            if not keep_dirty:
+                self.conn.execute('DELETE FROM pending_edits WHERE sheet_id = ?', (sheet_id,))
+            self.conn.execute(
+                'INSERT OR REPLACE INTO sync_state (sheet_id, revision, synced_at) VALUES (?, ?, ?)',
+                (sheet_id, revision, time.time())
+            )
+        return changed
+    
+    def stage_frame(self, sheet_id, df):
+        """Keep edits that could not be written to the sheet, to be pushed later
+        
+        df is compared with the mirrored sheet by PostID and only the differences are kept: the edited
+        cells of each post, whole rows for new posts, and the ids of deleted ones. They replace any
+        edits staged before, which df already includes.
+        """
+        columns = self.column_names
+        id_col = columns.index('PostID')
+        clean = {
+            str(values[id_col]): values
+            for values in sheet_values(self.query_posts(sheet_id).reindex(columns=columns, fill_value=''))
+            if values[id_col]
+        }
+        
+        edits = []
+        seen = set()
+        for seq, values in enumerate(sheet_values(df.reindex(columns=columns, fill_value=''))):
+            post_id = str(values[id_col])
+            if not post_id or post_id in seen:
+                continue
+            seen.add(post_id)
+            old = clean.get(post_id)
+            if old is None:
+                edits.append((sheet_id, post_id, seq, 'append', json.dumps(dict(zip(columns, values)), default=str)))
+                continue
+            changes = {col: new for col, value, new in zip(columns, old, values) if str(value) != str(new)}
+            if changes:
+                edits.append((sheet_id, post_id, seq, 'update', json.dumps(changes, default=str)))
+        edits += [(sheet_id, post_id, -1, 'delete', None) for post_id in clean if post_id not in seen]
+        
+        with self.lock, self.conn:
+            self.conn.execute('DELETE FROM pending_edits WHERE sheet_id = ?', (sheet_id,))
+            self.conn.executemany('INSERT INTO pending_edits VALUES (?, ?, ?, ?, ?)', edits)
+    
+    def apply_pending(self, sheet_id, df):
+        """Copy of df with the staged edits re-applied by PostID, wherever those posts sit in it now
+        
+        Edits to posts that are gone from df are dropped, and a new post already in df is updated in place.
+        """
+        with self.lock:
+            edits = self.conn.execute(
+                'SELECT post_id, kind, changes FROM pending_edits WHERE sheet_id = ? ORDER BY seq', (sheet_id,)
+            ).fetchall()
+        if not edits:
+            return df
+        
+        present = set(df['PostID'])
+        deleted = {post_id for post_id, kind, _ in edits if kind == 'delete'}
+        updates = {
+            post_id: json.loads(changes) for post_id, kind, changes in edits
+            if kind == 'update' or (kind == 'append' and post_id in present)
+        }
+        appends = [json.loads(changes) for post_id, kind, changes in edits if kind == 'append' and post_id not in present]
+        return apply_row_edits(df[~df['PostID'].isin(deleted)].reset_index(drop=True), updates, appends)
+    
+    def load_frame(self, sheet_id):
+        """The mirrored sheet as a DataFrame in sheet order, with any staged edits applied"""
+        return self.apply_pending(sheet_id, self.query_posts(sheet_id))
+    
+    def query_posts(self, sheet_id, year=None, month=None):
+        """Posts matching the filters, indexed by their row position in the sheet"""
+        quoted = ', '.join(f'"{col}"' for col in self.column_names)
+        sql = f'SELECT row_num, {quoted} FROM posts WHERE sheet_id = ?'
+        params = [sheet_id]
+        
+        if year is not None:
+            sql += ' AND sched_year = ?'
+            params.append(int(year))
+        if month is not None:
+            sql += ' AND sched_month = ? AND sched_day IS NOT NULL'
+            params.append(int(month))
+        sql += ' ORDER BY row_num'
+        
+        with self.lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        
+        df = pd.DataFrame([row[1:] for row in rows], columns=self.column_names)
+        df.index = [row[0] for row in rows]
+        return add_schedule_columns(apply_sheet_schema(df))
+
+@st.cache_resource
+def get_sheet_mirror():
+    """Process-wide SQLite mirror shared by all sessions"""
+    return SheetMirror(MIRROR_DB_PATH, UltimateSocialMediaManager().column_names)
+
+# Background sync (one worker per server process, polling the sheets sessions have open)
+SHEET_SYNC_INTERVAL = float(os.environ.get('SHEET_SYNC_INTERVAL', '30'))
+SHEET_SYNC_IDLE = 600.0
+
+class SheetSyncWorker:
+    """Daemon thread that polls watched sheets and reloads the shared cache when their revision moves
+    
+    Reruns use the last polled revision instead of asking Drive, and compare it with the revision
+    they rendered to tell the user a teammate has changed the sheet. An interval of 0 disables it.
+    """
+    
+    def __init__(self, interval=SHEET_SYNC_INTERVAL):
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.watched = {}
+        self.revisions = {}
+        self.thread = None
+    
+    def start(self):
+        """Start the polling thread once"""
+        if self.interval > 0 and self.thread is None:
+            self.thread = threading.Thread(target=self.run, name='sheet-sync', daemon=True)
+            self.thread.start()
+    
+    def watch(self, sheet_id, client, sheet_url):
+        """Poll a sheet until no session has loaded it for SHEET_SYNC_IDLE seconds"""
+        with self.lock:
+            self.watched[sheet_id] = {'client': client, 'sheet_url': sheet_url, 'last_used': time.monotonic()}
+    
+    def note_revision(self, sheet_id, revision):
+        """Record a revision seen outside the worker, e.g. right after this process wrote to the sheet"""
+        with self.lock:
+            self.revisions[sheet_id] = (revision, time.monotonic())
+    
+    def get_revision(self, sheet_id):
+        """Last known revision of a sheet, or None if the worker isn't running or hasn't polled it lately"""
+        with self.lock:
+            known = self.revisions.get(sheet_id)
+        if self.thread is None or not known or time.monotonic() - known[1] > self.interval * 2:
+            return None
+        return known[0]
+    
+    def run(self):
+        manager = UltimateSocialMediaManager()
+        while True:
+            time.sleep(self.interval)
+            
+            with self.lock:
+                now = time.monotonic()
+                for sheet_id in [key for key, watch in self.watched.items() if now - watch['last_used'] > SHEET_SYNC_IDLE]:
+                    del self.watched[sheet_id]
+                watched = list(self.watched.items())
+            
+            for sheet_id, watch in watched:
+                try:
+                    self.sync(manager, sheet_id, watch['client'], watch['sheet_url'])
+                except Exception:
+                    # Sessions keep the data they have; try again next interval
+                    pass
+    
+    def sync(self, manager, sheet_id, client, sheet_url):
+        """Poll one sheet and, if it changed, load the new revision into the shared cache"""
+        with self.lock:
+            known = self.revisions.get(sheet_id)
+        revision = manager.get_sheet_revision(client, sheet_url)
+        if not revision:
+            return
+        
+        cache = get_shared_sheet_cache()
+        with cache['lock']:
+            entry = cache['sheets'].get(sheet_id)
+        
+        new_entry = None
+        if not entry or entry['revision'] != revision:
+            df, complete = manager.fetch_sheet_data(client, sheet_url)
+            if not complete:
+                return
+            new_entry = manager.make_sheet_entry(revision, df)
+        
+        # A foreground write during the fetch has newer data than ours, so leave its entry alone
+        with self.lock, cache['lock']:
+            if self.revisions.get(sheet_id) is not known:
+                return
+            if new_entry is not None and cache['sheets'].get(sheet_id) is entry:
+                cache['sheets'][sheet_id] = new_entry
+            self.revisions[sheet_id] = (revision, time.monotonic())
+
+@st.cache_resource
+def get_sheet_sync_worker():
+    """Process-wide background sync worker, started on first use"""
+    worker = SheetSyncWorker()
+    worker.start()
+    return worker
+
+# Sheets fetched at once when a workspace overview loads several brands
+WORKSPACE_MAX_WORKERS = 8
+
+# Column types applied when a sheet is loaded
+INT_COLUMNS = ['Month(1-12)', 'Day(1-31)', 'Year', 'Hour', 'Minute(0-59)']
+CATEGORY_COLUMNS = ['Category', 'HashtagGroup', 'PinterestBoard', 'Story(YorN)', 'Watermark', 'CTAGroup']
+TEXT_COLUMNS = ['Message', 'FirstComment', 'AltText', 'Link', 'ImageURL', 'VideoURL', 'PinTitle', 'VideoThumbnailURL', 'PostID']
+
+def apply_sheet_schema(df):
+    """Convert sheet columns to compact dtypes: nullable Int32 dates, categoricals and Arrow strings
+    
+    Blank date/time cells become <NA>; blank category and text cells stay ''. A date/time column
+    holding any value that is not a whole number in Int32 range (e.g. "Jan" or 3.6) is left as
+    it was read, so writing the sheet back never changes what the user typed.
+    """
+    df = df.copy()
+    for col in INT_COLUMNS:
+        if col in df.columns:
+            blank = df[col].isna() | (df[col].astype(str).str.strip() == '')
+            numbers = pd.to_numeric(df[col].where(~blank), errors='coerce')
+            lossless = numbers[~blank].notna().all() and (numbers[~blank] % 1 == 0).all() \
+                and numbers[~blank].abs().le(np.iinfo('int32').max).all()
+            if lossless:
+                df[col] = numbers.astype('Int32')
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].fillna('').astype(str).astype('category')
+    for col in TEXT_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].fillna('').astype(str).astype(pd.StringDtype('pyarrow'))
+    return df
+
+def sheet_values(df):
+    """Rows of plain Python values for writing to the sheet, with '' for missing cells"""
+    return df.astype(object).where(df.notna(), '').values.tolist()
+
+def set_post_value(df, index, column, value):
+    """Assign one cell of a typed frame, coercing '' to <NA> and extending categories as needed"""
+    if column in INT_COLUMNS and isinstance(df[column].dtype, pd.Int32Dtype):
+        value = pd.NA if value is None or pd.isna(value) or value == '' else int(value)
+    elif column in CATEGORY_COLUMNS:
+        value = '' if value is None else str(value)
+        if value not in df[column].cat.categories:
+            df[column] = df[column].cat.add_categories([value])
+    df.loc[index, column] = value
+
+# Derived scheduling columns, computed once per sheet revision and shared by every view
+def add_schedule_columns(df):
+    """Add scheduled_at (NaT unless Year/Month/Day form a real date) and a Scheduled/Queued status"""
+    df = df.copy()
+    
+    def number(col, low=None, high=None):
+        if col not in df.columns:
+            return pd.Series(0, index=df.index)
+        values = pd.to_numeric(df[col], errors='coerce').astype('float64')
+        if low is None:
+            return values
+        # A bad time shouldn't unschedule a post that has a valid date
+        return values.where(values.between(low, high)).fillna(0)
+    
+    parts = pd.DataFrame({
+        'year': number('Year'),
+        'month': number('Month(1-12)'),
+        'day': number('Day(1-31)'),
+        'hour': number('Hour', 0, 23),
+        'minute': number('Minute(0-59)', 0, 59)
+    }, index=df.index)
+    df['scheduled_at'] = pd.to_datetime(parts, errors='coerce')
+    df['status'] = pd.Categorical(
+        np.where(df['scheduled_at'].notna(), 'Scheduled', 'Queued'),
+        categories=['Scheduled', 'Queued']
+    )
+    return df
+
+class ScheduleIndex:
+    """Row labels of scheduled posts sorted by scheduled_at, so date-range lookups are a binary search"""
+    
+    def __init__(self, df):
+        self.index = df.index
+        self.source = df['scheduled_at'].values
+        scheduled = df['scheduled_at'].dropna().sort_values(kind='stable')
+        self.times = scheduled.values
+        self.labels = scheduled.index.values
+    
+    def __len__(self):
+        return len(self.labels)
+    
+    def matches(self, df):
+        """Whether this index was built from df's current schedule"""
+        return (
+            'scheduled_at' in df.columns
+            and df.index.equals(self.index)
+            and np.array_equal(df['scheduled_at'].values, self.source, equal_nan=True)
+        )
+    
+    def between(self, start, end):
+        """Row labels scheduled in [start, end), in time order"""
+        bounds = [pd.Timestamp(t).to_datetime64().astype(self.times.dtype) for t in (start, end)]
+        low, high = np.searchsorted(self.times, bounds, side='left')
+        return self.labels[low:high]
+    
+    def in_month(self, year, month):
+        """Row labels scheduled in the given month, in time order"""
+        start = datetime(year, month, 1)
+        end = datetime(year + month // 12, month % 12 + 1, 1)
+        return self.between(start, end)
+
+WRITE_FLUSH_DELAY = 2.0
+
+class WriteBehindQueue:
+    """Sheet edits waiting to be written, coalesced per row and flushed as one batch
+    
+    The first queued edit starts a short timer; everything queued before it fires goes out
+    in a single write. flush() can also be called directly, e.g. before a delete shifts rows.
+    """
+    
+    def __init__(self, flush_delay=WRITE_FLUSH_DELAY):
+        self.flush_delay = flush_delay
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self.updates = {}
+        self.appends = []
+        self.in_flight = ({}, [])
+        self.write = None
+        self.timer = None
+        self.last_result = None
+    
+    def add_update(self, post_id, changes):
+        """Queue cell changes for one post; later edits to the same cell win"""
+        with self.lock:
+            self.updates.setdefault(post_id, {}).update(changes)
+    
+    def add_append(self, row):
+        """Queue a new post to be added after the last row"""
+        with self.lock:
+            self.appends.append(dict(row))
+    
+    def pending_count(self):
+        """Number of rows with edits not yet confirmed by the sheet"""
+        with self.lock:
+            updates, appends = self.in_flight
+            return len(self.updates) + len(self.appends) + len(updates) + len(appends)
+    
+    def schedule_flush(self, write):
+        """Arrange for write(updates, appends) to run once the flush delay has passed"""
+        with self.lock:
+            self.write = write
+            if self.timer is None or not self.timer.is_alive():
+                self.timer = threading.Timer(self.flush_delay, self.flush)
+                self.timer.daemon = True
+                self.timer.start()
+    
+    def flush(self):
+        """Write everything queued in one go; on failure the edits go back in the queue"""
+        with self.flush_lock:
+            with self.lock:
+                updates, appends = self.updates, self.appends
+                self.updates, self.appends = {}, []
+                self.in_flight = (updates, appends)
+                write = self.write
+            
+            if not updates and not appends:
+                return True, "No pending edits"
+            
+            try:
+                success, message = write(updates, appends)
+            except Exception as e:
+                success, message = False, f"Error saving edits: {str(e)}"
+            
+            with self.lock:
+                self.in_flight = ({}, [])
+                if not success:
+                    # Keep anything queued during the write on top of the failed edits
+                    for post_id, changes in updates.items():
+                        self.updates[post_id] = {**changes, **self.updates.get(post_id, {})}
+                    self.appends = appends + self.appends
+                self.last_result = (datetime.now(), success, message)
+            
+            return success, message
+    
+    def apply_to(self, df):
+        """Copy of df with in-flight and queued edits applied, so the UI shows them straight away"""
+        with self.lock:
+            batches = [self.in_flight, (self.updates, self.appends)]
+            batches = [(dict(updates), list(appends)) for updates, appends in batches]
+        
+        for updates, appends in batches:
+            df = apply_row_edits(df, updates, appends)
+        return df
+
+def apply_row_edits(df, updates, appends):
+    """Return a copy of df with new rows appended, then per-post cell changes applied"""
+    if not updates and not appends:
+        return df
+    
+    df = df.copy()
+    if appends:
+        new_rows = pd.DataFrame(appends).reindex(columns=df.columns, fill_value='')
+        df = apply_sheet_schema(pd.concat([df.astype(object), new_rows], ignore_index=True))
+    
+    rows = dict(zip(df['PostID'], df.index))
+    for post_id, changes in updates.items():
+        index = rows.get(post_id)
+        if index is None:
+            # The post was deleted before its edit was written
+            continue
+        for column, value in changes.items():
+            set_post_value(df, index, column, value)
+    
+    if 'scheduled_at' in df.columns:
+        # Dates may have changed, so re-derive the schedule columns
+        df = add_schedule_columns(df)
+    return df
+
+# Storage backends behind the manager's get_sheet_data, update_sheet and append_rows
+LOCAL_STORAGE_SUFFIXES = ('.parquet', '.csv')
+# Local files are off unless this names the one directory they may live in, since any visitor can type a path
+LOCAL_STORAGE_DIR = os.environ.get('LOCAL_STORAGE_DIR', '')
+
+def is_local_storage(location):
+    """Whether a data location is a local Parquet/CSV file rather than a Google Sheets URL (needs LOCAL_STORAGE_DIR)"""
+    return bool(LOCAL_STORAGE_DIR) and str(location).strip().lower().endswith(LOCAL_STORAGE_SUFFIXES)
+
+def resolve_local_path(location):
+    """Real path of a local data file, relative paths taken from LOCAL_STORAGE_DIR; ValueError if it falls outside it"""
+    root = os.path.realpath(LOCAL_STORAGE_DIR)
+    path = os.path.realpath(os.path.join(root, str(location).strip()))
+    if os.path.commonpath([root, path]) != root:
+        raise ValueError(f"Local data files must be inside {root}")
+    return path
+
+class GoogleSheetsStorage:
+    """Posts kept in the first worksheet of a Google Sheet, read and written through the manager's gspread helpers"""
+    
+    def __init__(self, manager, client, sheet_url):
+        self.manager = manager
+        self.client = client
+        self.sheet_url = sheet_url
+        self.sheet = None
+    
+    def worksheet(self):
+        """The worksheet, opened once per backend instance"""
+        if self.sheet is None:
+            self.sheet = self.manager.open_worksheet(self.client, self.sheet_url)
+        return self.sheet
+    
+    def get_revision(self):
+        """The spreadsheet's Drive modifiedTime, or None if Drive can't be asked"""
+        try:
+            metadata = self.manager.api_call(
+                'drive', 'get_file_metadata', self.client.get_file_drive_metadata, self.manager.get_sheet_key(self.sheet_url)
+            )
+            return metadata.get('modifiedTime')
+        except Exception:
+            # Drive API unavailable for this project - caller falls back to a full read
+            return None
+    
+    def read(self, on_chunk=None):
+        """All rows with the manager's columns, or None for a blank sheet (which gets a header row)"""
+        sheet = self.worksheet()
+        header, df = self.manager.read_sheet_chunks(sheet, on_chunk)
+        
+        if not header:
+            self.manager.api_call('sheets', 'append_row', sheet.append_row, self.manager.column_names)
+            return None
+        
+        for col in self.manager.column_names:
+            if col not in df.columns:
+                df[col] = ''
+        return df[self.manager.column_names]
+    
+    def write(self, df, snapshot=None):
+        """Store df as the full contents; with a snapshot of what the sheet holds, only changed cells are sent"""
+        sheet = self.worksheet()
+        new_rows = sheet_values(df)
+        
+        updates = None
+        if snapshot is not None:
+            updates = self.manager.diff_sheet_rows(sheet_values(snapshot), new_rows)
+        
+        if updates is None:
+            self.manager.rewrite_sheet(sheet, new_rows)
+        elif updates:
+            self.manager.api_call('sheets', 'batch_update', sheet.batch_update, updates)
+    
+    def append(self, df, batch_size=1000):
+        """Add rows after the last one without rewriting the existing ones"""
+        sheet = self.worksheet()
+        values = sheet_values(df)
+        for start in range(0, len(values), batch_size):
+            self.manager.api_call('sheets', 'append_rows', sheet.append_rows, values[start:start + batch_size], table_range='A1')
+    
+    def write_post_ids(self, df):
+        """Save newly assigned PostIDs"""
+        self.manager.write_post_ids(self.worksheet(), df)
+
+class LocalFileStorage:
+    """Posts kept in a local Parquet or CSV file, for offline runs, load tests and very large schedules"""
+    
+    def __init__(self, path, column_names):
+        self.path = resolve_local_path(path)
+        self.column_names = column_names
+        self.is_parquet = self.path.lower().endswith('.parquet')
+    
+    def get_revision(self):
+        """Modification time and size of the file, or None if it doesn't exist yet"""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return f"{stat.st_mtime_ns}-{stat.st_size}"
+    
+    def read(self, on_chunk=None):
+        """All rows with the manager's columns, or None if the file doesn't exist yet"""
+        if not os.path.exists(self.path):
+            return None
+        
+        if self.is_parquet:
+            df = pd.read_parquet(self.path)
+        else:
+            # Read as text like the sheet does; apply_sheet_schema converts the date columns
+            df = pd.read_csv(self.path, dtype=str, keep_default_na=False)
+        return df.reindex(columns=self.column_names, fill_value='')
+    
+    def write(self, df, snapshot=None):
+        """Replace the file via a temporary copy, so readers never see it half-written"""
+        df = apply_sheet_schema(df.reindex(columns=self.column_names, fill_value=''))
+        directory = os.path.dirname(self.path)
+        os.makedirs(directory, exist_ok=True)
+        
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=os.path.splitext(self.path)[1])
+        os.close(fd)
+        try:
+            if self.is_parquet:
+                df.to_parquet(tmp_path, index=False)
+            else:
+                df.to_csv(tmp_path, index=False)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+    
+    def append(self, df, batch_size=None):
+        """Add rows at the end; CSV files are appended to in place, Parquet files are rewritten
+        
+        Appended CSV rows follow the file's own header order. A CSV whose header lacks some of
+        the manager's columns is rewritten instead, so the new rows' values aren't dropped.
+        """
+        df = apply_sheet_schema(df.reindex(columns=self.column_names, fill_value=''))
+        header = None
+        if not self.is_parquet and os.path.exists(self.path):
+            try:
+                header = list(pd.read_csv(self.path, nrows=0).columns)
+            except pd.errors.EmptyDataError:
+                header = []
+        
+        if header and set(self.column_names) <= set(header):
+            df.reindex(columns=header, fill_value='').to_csv(self.path, mode='a', header=False, index=False)
+        else:
+            existing = self.read() if header != [] else None
+            if existing is not None:
+                df = pd.concat([existing.astype(object), df.astype(object)], ignore_index=True)
+            self.write(df)
+    
+    def write_post_ids(self, df):
+        """Save newly assigned PostIDs"""
+        self.write(df)
+
+# Card thumbnails, kept on disk so reruns and other sessions don't download the originals again
+THUMBNAIL_CACHE_DIR = os.environ.get('THUMBNAIL_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'social-media-thumbnails'))
+THUMBNAIL_CACHE_MAX_BYTES = int(os.environ.get('THUMBNAIL_CACHE_MAX_MB', '256')) * 1024 * 1024
+THUMBNAIL_SIZE = 480
+# Seconds a thumbnail is used without asking the origin whether the image has changed
+THUMBNAIL_MAX_AGE = float(os.environ.get('THUMBNAIL_MAX_AGE', '3600'))
+IMAGE_PREFETCH_WORKERS = 8
+
+class ThumbnailCache:
+    """Disk LRU of resized WebP thumbnails keyed by image URL, with the origin's ETag/Last-Modified alongside
+    
+    Reading an entry bumps its mtime; once the directory passes max_bytes the least recently read go first.
+    Entries older than max_age are revalidated with a conditional request before they are used again.
+    """
+    
+    def __init__(self, directory=THUMBNAIL_CACHE_DIR, max_bytes=THUMBNAIL_CACHE_MAX_BYTES, size=THUMBNAIL_SIZE, max_age=THUMBNAIL_MAX_AGE):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.size = size
+        self.max_age = max_age
+        self.lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+    
+    def paths(self, url):
+        """Thumbnail and metadata file paths for a URL"""
+        base = os.path.join(self.directory, hashlib.sha256(url.encode('utf-8')).hexdigest())
+        return base + '.webp', base + '.json'
+    
+    def get(self, url):
+        """(thumbnail, metadata) for a cached URL, or None"""
+        image_path, meta_path = self.paths(url)
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            image = Image.open(image_path)
+            image.load()
+            os.utime(image_path)
+        except (OSError, ValueError):
+            return None
+        return image, meta
+    
+    def is_fresh(self, meta):
+        """Whether an entry can be used without revalidating it"""
+        return time.time() - meta.get('fetched_at', 0) < self.max_age
+    
+    def conditional_headers(self, meta):
+        """If-None-Match / If-Modified-Since headers from an entry's validators"""
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+    
+    def mark_fresh(self, url, meta, headers):
+        """Record a 304 Not Modified: keep the thumbnail, restart its max-age and take any updated validators"""
+        meta = dict(meta, fetched_at=time.time())
+        if headers.get('ETag'):
+            meta['etag'] = headers['ETag']
+        if headers.get('Last-Modified'):
+            meta['last_modified'] = headers['Last-Modified']
+        
+        _, meta_path = self.paths(url)
+        self.write_file(meta_path, lambda f: f.write(json.dumps(meta).encode('utf-8')))
+    
+    def put(self, url, content, headers):
+        """Resize downloaded image bytes, store the thumbnail with its validators and return it"""
+        image = Image.open(io.BytesIO(content))
+        image.thumbnail((self.size, self.size))
+        if image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGBA' if image.mode in ('LA', 'PA') or 'transparency' in image.info else 'RGB')
+        
+        meta = {
+            'url': url,
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'fetched_at': time.time()
+        }
+        image_path, meta_path = self.paths(url)
+        self.write_file(image_path, lambda f: image.save(f, format='WEBP', quality=80))
+        self.write_file(meta_path, lambda f: f.write(json.dumps(meta).encode('utf-8')))
+        self.evict()
+        return image
+    
+    def write_file(self, path, write):
+        """Write through a temporary file and rename, so readers never see half a file"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                write(f)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def evict(self):
+        """Remove least recently used thumbnails until the cache fits in max_bytes"""
+        with self.lock:
+            entries = []
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith('.webp'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.path, stat.st_size))
+            
+            total = sum(size for _, _, size in entries)
+            for _, path, size in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                for stale_path in (path, path[:-len('.webp')] + '.json'):
+                    try:
+                        os.remove(stale_path)
+                    except OSError:
+                        pass
+                total -= size
+
+@st.cache_resource
+def get_thumbnail_cache():
+    """Process-wide thumbnail cache shared by all sessions"""
+    return ThumbnailCache()
+
+@st.cache_resource
+def get_image_session():
+    """HTTP session shared by image downloads, pooling one connection per prefetch worker"""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=IMAGE_PREFETCH_WORKERS, pool_maxsize=IMAGE_PREFETCH_WORKERS)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+@st.cache_resource
+def get_image_prefetch_pool():
+    """Background pool that warms the thumbnail cache ahead of the page being viewed"""
+    return ThreadPoolExecutor(max_workers=IMAGE_PREFETCH_WORKERS, thread_name_prefix='thumbnail-prefetch')
+
+# Persistent index of the media referenced by posts, so the picker never walks the sheet or fetches originals
+MEDIA_INDEX_DB_PATH = "social_media_media.db"
+MEDIA_HASH_CHUNK_BYTES = 1024 * 1024
+
+class MediaIndex:
+    """SQLite index of media URLs with type, dimensions, byte size, content SHA-256 and the posts using them
+    
+    References are synced from the sheet incrementally (only when its revision moves, touching only changed
+    references). Size, dimensions and hash are filled in by a background download the first time a URL is seen,
+    or straight from the bytes when the file is uploaded here. Equal hashes mark duplicate uploads.
+    """
+    
+    def __init__(self, db_path):
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.describing = set()
+        with self.lock, self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS media (
+                    url TEXT PRIMARY KEY,
+                    type TEXT NOT NULL,
+                    width INTEGER,
+                    height INTEGER,
+                    bytes INTEGER,
+                    sha256 TEXT,
+                    indexed_at REAL,
+                    error TEXT
+                )
+            """)
+            self.conn.execute('CREATE INDEX IF NOT EXISTS idx_media_sha256 ON media (sha256)')
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS media_refs (
+                    sheet_id TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    post_id TEXT NOT NULL,
+                    message_preview TEXT,
+                    PRIMARY KEY (sheet_id, url, post_id)
+                )
+            """)
+            self.conn.execute('CREATE TABLE IF NOT EXISTS media_sync (sheet_id TEXT PRIMARY KEY, revision TEXT)')
+    
+    def sync_posts(self, sheet_id, revision, df):
+        """Update the sheet's media references from df; a no-op while the revision is unchanged"""
+        with self.lock:
+            row = self.conn.execute('SELECT revision FROM media_sync WHERE sheet_id = ?', (sheet_id,)).fetchone()
+        if revision and row and row[0] == revision:
+            return
+        
+        # (url, post_id) -> (type, preview) for every media cell, built column-wise
+        current = {}
+        for col, media_type in [('ImageURL', 'image'), ('VideoURL', 'video')]:
+            if col not in df.columns:
+                continue
+            urls = df[col].fillna('').astype(str).str.strip()
+            used = urls != ''
+            post_ids = df['PostID'].fillna('').astype(str) if 'PostID' in df.columns else pd.Series(df.index.astype(str), index=df.index)
+            previews = df['Message'].fillna('').astype(str).str[:50] + "..."
+            for url, post_id, preview in zip(urls[used], post_ids[used], previews[used]):
+                current[(url, post_id)] = (media_type, preview)
+        
+        with self.lock, self.conn:
+            stored = {
+                (url, post_id): preview
+                for url, post_id, preview in self.conn.execute(
+                    "SELECT url, post_id, message_preview FROM media_refs WHERE sheet_id = ? AND post_id != ''", (sheet_id,)
+                )
+            }
+            self.conn.executemany(
+                'DELETE FROM media_refs WHERE sheet_id = ? AND url = ? AND post_id = ?',
+                [(sheet_id, url, post_id) for url, post_id in stored.keys() - current.keys()]
+            )
+            changed = [(key, value) for key, value in current.items() if stored.get(key) != value[1]]
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO media_refs (sheet_id, url, post_id, message_preview) VALUES (?, ?, ?, ?)',
+                [(sheet_id, url, post_id, preview) for (url, post_id), (_, preview) in changed]
+            )
+            self.conn.executemany(
+                'INSERT OR IGNORE INTO media (url, type) VALUES (?, ?)',
+                [(url, media_type) for (url, _), (media_type, _) in changed]
+            )
+            self.conn.execute('INSERT OR REPLACE INTO media_sync (sheet_id, revision) VALUES (?, ?)', (sheet_id, revision))
+    
+    def describe_content(self, content):
+        """Byte size, SHA-256 and (for images) dimensions of a whole file"""
+        width = height = None
+        try:
+            width, height = Image.open(io.BytesIO(content)).size
+        except Exception:
+            pass
+        return {'width': width, 'height': height, 'bytes': len(content), 'sha256': hashlib.sha256(content).hexdigest()}
+    
+    def record(self, sheet_id, url, media_type, content):
+        """Index a file whose bytes are already at hand, e.g. one just uploaded to Drive for this sheet
+        
+        The upload is referenced by the sheet with an empty post id until a post uses it.
+        """
+        info = self.describe_content(content)
+        with self.lock, self.conn:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO media (url, type, width, height, bytes, sha256, indexed_at, error) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, NULL)',
+                (url, media_type, info['width'], info['height'], info['bytes'], info['sha256'], time.time())
+            )
+            self.conn.execute(
+                "INSERT OR IGNORE INTO media_refs (sheet_id, url, post_id) VALUES (?, ?, '')", (sheet_id, url)
+            )
+    
+    def describe_url(self, url, media_type):
+        """Download one media URL and store its size, hash and dimensions; runs on the prefetch pool"""
+        try:
+            if media_type == 'image':
+                response = get_image_session().get(url, timeout=30)
+                response.raise_for_status()
+                info = self.describe_content(response.content)
+            else:
+                # Videos are hashed as they stream in rather than held in memory
+                digest = hashlib.sha256()
+                size = 0
+                with get_image_session().get(url, timeout=30, stream=True) as response:
+                    response.raise_for_status()
+                    for chunk in response.iter_content(MEDIA_HASH_CHUNK_BYTES):
+                        digest.update(chunk)
+                        size += len(chunk)
+                info = {'width': None, 'height': None, 'bytes': size, 'sha256': digest.hexdigest()}
+            with self.lock, self.conn:
+                self.conn.execute(
+                    'UPDATE media SET width = ?, height = ?, bytes = ?, sha256 = ?, indexed_at = ?, error = NULL WHERE url = ?',
+                    (info['width'], info['height'], info['bytes'], info['sha256'], time.time(), url)
+                )
+        except Exception as e:
+            with self.lock, self.conn:
+                self.conn.execute('UPDATE media SET indexed_at = ?, error = ? WHERE url = ?', (time.time(), str(e), url))
+        finally:
+            with self.lock:
+                self.describing.discard(url)
+    
+    def describe_pending(self, limit=50):
+        """Queue downloads for media not described yet; returns how many are still waiting"""
+        with self.lock:
+            pending = self.conn.execute(
+                "SELECT url, type FROM media WHERE indexed_at IS NULL AND (url LIKE 'http://%' OR url LIKE 'https://%')"
+            ).fetchall()
+            queued = [(url, media_type) for url, media_type in pending if url not in self.describing][:limit]
+            self.describing.update(url for url, _ in queued)
+        
+        pool = get_image_prefetch_pool()
+        get_image_session()
+        for url, media_type in queued:
+            pool.submit(self.describe_url, url, media_type)
+        return len(pending)
+    
+    def list_media(self, sheet_id, media_type=None):
+        """Media referenced by a sheet's posts, one row per URL, with the post ids using it and duplicate counts
+        
+        Duplicates are other URLs with the same content in this sheet only, uploads included.
+        """
+        sql = """
+            SELECT m.url, m.type, m.width, m.height, m.bytes, m.sha256,
+                   GROUP_CONCAT(r.post_id, ', ') AS post_ids, MIN(r.message_preview) AS message_preview,
+                   CASE WHEN m.sha256 IS NULL THEN 0
+                        ELSE (SELECT COUNT(DISTINCT d.url) FROM media d JOIN media_refs dr ON dr.url = d.url
+                              WHERE dr.sheet_id = ? AND d.sha256 = m.sha256) - 1 END AS duplicates
+            FROM media m JOIN media_refs r ON r.url = m.url
+            WHERE r.sheet_id = ? AND r.post_id != ''
+        """
+        params = [sheet_id, sheet_id]
+        if media_type:
+            sql += ' AND m.type = ?'
+            params.append(media_type)
+        sql += ' GROUP BY m.url ORDER BY MIN(r.rowid)'
+        
+        with self.lock:
+            cursor = self.conn.execute(sql, params)
+            columns = [description[0] for description in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+    
+    def find_by_hash(self, sheet_id, sha256):
+        """URLs with this content hash that the sheet's posts or uploads already use"""
+        with self.lock:
+            return [
+                row[0] for row in self.conn.execute(
+                    'SELECT DISTINCT m.url FROM media m JOIN media_refs r ON r.url = m.url WHERE r.sheet_id = ? AND m.sha256 = ?',
+                    (sheet_id, sha256)
+                )
+            ]
+
+@st.cache_resource
+def get_media_index():
+    """Process-wide media index shared by all sessions"""
+    return MediaIndex(MEDIA_INDEX_DB_PATH)
+
 class UltimateSocialMediaManager:
     def __init__(self):
         self.column_names = [
             'Message', 'Link', 'ImageURL', 'VideoURL', 'Month(1-12)', 
             'Day(1-31)', 'Year', 'Hour', 'Minute(0-59)', 'PinTitle', 
             'Category', 'Watermark', 'HashtagGroup', 'VideoThumbnailURL',
-            'CTAGroup', 'FirstComment', 'Story(YorN)', 'PinterestBoard', 'AltText'
+            'CTAGroup', 'FirstComment', 'Story(YorN)', 'PinterestBoard', 'AltText', 'PostID'
         ]
         
         self.platform_limits = {
@@ -387,6 +1504,52 @@ class UltimateSocialMediaManager:
             'Education': ['#Learning', '#Education', '#SkillDevelopment', '#ProfessionalDevelopment', '#Training', '#Knowledge'],
             'Industry Specific': ['#Healthcare', '#Finance', '#Retail', '#Manufacturing', '#RealEstate', '#Consulting']
         }
+        
+        # Local SQLite mirror, set by main() when enabled in the sidebar
+        self.mirror = None
+        self.schedule_index = None
+        self.data_revision = None
+        
+        # Thumbnails loaded ahead of rendering a page of cards, see prefetch_thumbnails()
+        self.prefetched_thumbnails = {}
+        
+        # PostID -> row index for the data loaded this run, see index_posts()
+        self.post_index = {}
+    
+    def get_credentials_fingerprint(self, credentials_dict):
+        """Stable hash of the service account JSON, used to key pooled clients"""
+        return hashlib.sha256(json.dumps(credentials_dict, sort_keys=True).encode()).hexdigest()
+    
+    def get_pooled_google_resources(self):
+        """Shared credentials and Sheets client for the uploaded service account
+        
+        The credentials refresh their own access token when it expires, and the
+        client keeps its HTTP connections open, so every rerun and session using
+        the same service account skips the OAuth exchange.
+        """
+        credentials_dict = st.session_state.google_credentials
+        fingerprint = self.get_credentials_fingerprint(credentials_dict)
+        pool = get_google_client_pool()
+        
+        with pool['lock']:
+            entry = pool['clients'].get(fingerprint)
+            if entry is None:
+                credentials = Credentials.from_service_account_info(
+                    credentials_dict,
+                    scopes=[
+                        "https://www.googleapis.com/auth/spreadsheets",
+                        "https://www.googleapis.com/auth/drive",
+                        "https://www.googleapis.com/auth/drive.file"
+                    ]
+                )
+                entry = {
+                    'fingerprint': fingerprint,
+                    'credentials': credentials,
+                    'client': gspread.authorize(credentials)
+                }
+                pool['clients'][fingerprint] = entry
+        
+        return entry
     
     def setup_google_sheets(self):
         """Initialize Google Sheets connection"""
@@ -394,18 +1557,7 @@ class UltimateSocialMediaManager:
             if 'google_credentials' not in st.session_state:
                 return None, "Please upload Google service account credentials"
             
-            credentials_dict = st.session_state.google_credentials
-            credentials = Credentials.from_service_account_info(
-                credentials_dict,
-                scopes=[
-                    "https://www.googleapis.com/auth/spreadsheets",
-                    "https://www.googleapis.com/auth/drive",
-                    "https://www.googleapis.com/auth/drive.file"
-                ]
-            )
-            
-            client = gspread.authorize(credentials)
-            return client, None
+            return self.get_pooled_google_resources()['client'], None
         except Exception as e:
             return None, f"Error connecting to Google Sheets: {str(e)}"
     
@@ -415,18 +1567,20 @@ class UltimateSocialMediaManager:
             if 'google_credentials' not in st.session_state:
                 return None, "Please upload Google service account credentials"
             
-            credentials_dict = st.session_state.google_credentials
-            credentials = Credentials.from_service_account_info(
-                credentials_dict,
-                scopes=[
-                    "https://www.googleapis.com/auth/spreadsheets",
-                    "https://www.googleapis.com/auth/drive",
-                    "https://www.googleapis.com/auth/drive.file"
-                ]
-            )
+            entry = self.get_pooled_google_resources()
+            
+            # googleapiclient's httplib2 transport is not thread-safe, so each session
+            # builds its own service on the shared credentials and keeps it across reruns
+            if 'drive_services' not in st.session_state:
+                st.session_state.drive_services = {}
+            
+            drive_services = st.session_state.drive_services
+            if entry['fingerprint'] not in drive_services:
+                drive_services[entry['fingerprint']] = build(
+                    'drive', 'v3', credentials=entry['credentials'], cache_discovery=False
+                )
             
-            drive_service = build('drive', 'v3', credentials=credentials)
-            return drive_service, None
+            return drive_services[entry['fingerprint']], None
         except Exception as e:
             return None, f"Error connecting to Google Drive: {str(e)}"
     
@@ -436,7 +1590,7 @@ class UltimateSocialMediaManager:
             # Check if folder already exists
             folder_name = "Social Media Assets"
             query = f"name='{folder_name}' and mimeType='application/vnd.google-apps.folder' and trashed=false"
-            results = drive_service.files().list(q=query).execute()
+            results = self.api_call('drive', 'files.list', drive_service.files().list(q=query).execute)
             folders = results.get('files', [])
             
             if folders:
@@ -449,7 +1603,7 @@ class UltimateSocialMediaManager:
                     'name': folder_name,
                     'mimeType': 'application/vnd.google-apps.folder'
                 }
-                folder = drive_service.files().create(body=folder_metadata).execute()
+                folder = self.api_call('drive', 'files.create', drive_service.files().create(body=folder_metadata).execute)
                 folder_id = folder.get('id')
                 
                 # Make folder publicly viewable
@@ -457,7 +1611,7 @@ class UltimateSocialMediaManager:
                     'type': 'anyone',
                     'role': 'reader'
                 }
-                drive_service.permissions().create(fileId=folder_id, body=permission).execute()
+                self.api_call('drive', 'permissions.create', drive_service.permissions().create(fileId=folder_id, body=permission).execute)
                 
                 st.session_state.media_folder_id = folder_id
                 return folder_id
@@ -465,110 +1619,619 @@ class UltimateSocialMediaManager:
             st.error(f"Error creating media folder: {str(e)}")
             return None
     
+    def get_media_folder(self, drive_service, sheet_url=None, refresh=False):
+        """Media folder for these credentials and sheet as {'id', 'public'}, looked up once per process
+        
+        public means the folder is shared with anyone, so files in it inherit read access and need no grant.
+        refresh drops the cached entry first, e.g. after the folder was deleted in Drive.
+        """
+        sheet_url = sheet_url or st.session_state.get('sheet_url', '')
+        key = (self.get_credentials_fingerprint(st.session_state.google_credentials), self.get_sheet_key(sheet_url))
+        cache = get_drive_folder_cache()
+        with cache['lock']:
+            if refresh:
+                cache['folders'].pop(key, None)
+            folder = cache['folders'].get(key)
+        if folder:
+            st.session_state.media_folder_id = folder['id']
+            return folder
+        
+        folder_id = self.create_media_folder(drive_service)
+        if not folder_id:
+            return None
+        
+        result = self.api_call(
+            'drive', 'permissions.list',
+            drive_service.permissions().list(fileId=folder_id, fields='permissions(type,role)').execute
+        )
+        public = any(permission.get('type') == 'anyone' for permission in result.get('permissions', []))
+        
+        folder = {'id': folder_id, 'public': public}
+        with cache['lock']:
+            cache['folders'][key] = folder
+        return folder
+    
+    def grant_public_read(self, drive_service, file_ids):
+        """Make files viewable by anyone through Drive's batch endpoint; returns {file_id: error} for failures"""
+        errors = {}
+        
+        def on_response(request_id, response, exception):
+            if exception is not None:
+                errors[request_id] = str(exception)
+        
+        permission = {'type': 'anyone', 'role': 'reader'}
+        for start in range(0, len(file_ids), DRIVE_BATCH_MAX_CALLS):
+            batch = drive_service.new_batch_http_request(callback=on_response)
+            for file_id in file_ids[start:start + DRIVE_BATCH_MAX_CALLS]:
+                batch.add(drive_service.permissions().create(fileId=file_id, body=permission, fields='id'), request_id=file_id)
+            self.api_call('drive', 'permissions.batch', batch.execute)
+        return errors
+    
+    def upload_files_to_drive(self, drive_service, files, sheet_url=None):
+        """Upload (file_content, filename, mime_type) tuples and return a (public_url, error) pair for each
+        
+        The folder lookup is cached and small files go up in one request each. Read access comes from
+        the shared folder or, if the folder isn't public, from one batched grant for all the files.
+        If Drive reports the cached folder missing, it is looked up again and the upload retried once.
+        """
+        try:
+            folder = self.get_media_folder(drive_service, sheet_url)
+        except Exception as e:
+            return [(None, f"Error uploading file: {str(e)}")] * len(files)
+        if not folder:
+            return [(None, "Failed to create media folder")] * len(files)
+        
+        results = []
+        # Files that went into a folder not shared with anyone, which need their own grant
+        private_ids = []
+        folder_refreshed = False
+        for file_content, filename, mime_type in files:
+            if folder is None:
+                results.append((None, "Failed to create media folder"))
+                continue
+            while True:
+                try:
+                    # Create file metadata
+                    file_metadata = {
+                        'name': filename,
+                        'parents': [folder['id']]
+                    }
+                    
+                    # Create media upload
+                    media = MediaIoBaseUpload(
+                        io.BytesIO(file_content),
+                        mimetype=mime_type,
+                        resumable=len(file_content) > DRIVE_SIMPLE_UPLOAD_MAX_BYTES
+                    )
+                    
+                    # Upload file
+                    request = drive_service.files().create(
+                        body=file_metadata,
+                        media_body=media,
+                        fields='id'
+                    )
+                    file = self.api_call('drive', 'files.upload', request.execute)
+                    results.append((file.get('id'), None))
+                    if not folder['public']:
+                        private_ids.append(file.get('id'))
+                except HttpError as e:
+                    # A 404 here means the cached parent folder is gone: forget it and retry once in a fresh one
+                    if e.resp.status == 404 and not folder_refreshed:
+                        folder_refreshed = True
+                        st.session_state.pop('media_folder_id', None)
+                        try:
+                            folder = self.get_media_folder(drive_service, sheet_url, refresh=True)
+                        except Exception:
+                            folder = None
+                        if folder:
+                            continue
+                        # Files uploaded before this one are kept; this and the rest have nowhere to go
+                        results.append((None, "Failed to create media folder"))
+                        break
+                    results.append((None, f"Error uploading file: {str(e)}"))
+                except Exception as e:
+                    results.append((None, f"Error uploading file: {str(e)}"))
+                break
+        
+        # Media uploads can't be batched, but the permission grants can
+        grant_errors = {}
+        if private_ids:
+            try:
+                grant_errors = self.grant_public_read(drive_service, private_ids)
+            except Exception as e:
+                grant_errors = {file_id: str(e) for file_id in private_ids}
+        
+        uploads = []
+        for file_id, error in results:
+            if error:
+                uploads.append((None, error))
+            elif file_id in grant_errors:
+                uploads.append((None, f"Error sharing file: {grant_errors[file_id]}"))
+            else:
+                # Return direct download URL
+                uploads.append((f"https://drive.google.com/uc?export=view&id={file_id}", None))
+        return uploads
+    
     def upload_file_to_drive(self, drive_service, file_content, filename, mime_type):
         """Upload file to Google Drive and return public URL"""
+        return self.upload_files_to_drive(drive_service, [(file_content, filename, mime_type)])[0]
+    
+    def get_existing_media_from_sheets(self, df, sheet_url, media_type=None):
+        """Media used by the sheet's posts, read from the media index after syncing it with df"""
+        media_index = get_media_index()
+        sheet_id = self.get_sheet_key(sheet_url)
+        media_index.sync_posts(sheet_id, self.data_revision, df)
+        media_index.describe_pending()
+        return media_index.list_media(sheet_id, media_type)
+    
+    def api_call(self, api, name, func, *args, **kwargs):
+        """Call a Google API function through the shared rate limiter for that API"""
+        return get_google_api_limiters()[api].call(name, func, *args, **kwargs)
+    
+    def open_worksheet(self, client, sheet_url):
+        """First worksheet of a spreadsheet; opening it costs a Sheets metadata request"""
+        return self.api_call('sheets', 'open_by_url', lambda: client.open_by_url(sheet_url).sheet1)
+    
+    def get_storage(self, client, sheet_url):
+        """Storage backend for a data location: a local .parquet/.csv path, or else a Google Sheets URL"""
+        if is_local_storage(sheet_url):
+            return LocalFileStorage(sheet_url, self.column_names)
+        return GoogleSheetsStorage(self, client, sheet_url)
+    
+    def get_sheet_key(self, sheet_url):
+        """Spreadsheet id for a sheet URL, so different links to the same sheet share a cache entry"""
+        if is_local_storage(sheet_url):
+            try:
+                return resolve_local_path(sheet_url)
+            except ValueError:
+                return sheet_url.strip()
         try:
-            # Get or create media folder
-            folder_id = self.create_media_folder(drive_service)
-            if not folder_id:
-                return None, "Failed to create media folder"
-            
-            # Create file metadata
-            file_metadata = {
-                'name': filename,
-                'parents': [folder_id]
-            }
+            return gspread.utils.extract_id_from_url(sheet_url)
+        except Exception:
+            return sheet_url
+    
+    def get_sheet_revision(self, client, sheet_url):
+        """Cheap revision marker for the stored posts (Drive modifiedTime for a sheet), or None if unknown"""
+        return self.get_storage(client, sheet_url).get_revision()
+    
+    def get_sheet_data(self, client, sheet_url, on_chunk=None):
+        """Fetch data from Google Sheets, served from the shared cache while the revision is unchanged
+        
+        on_chunk is passed to read_sheet_chunks to report progress when the sheet has to be read.
+        """
+        cache = get_shared_sheet_cache()
+        sheet_id = self.get_sheet_key(sheet_url)
+        
+        # Read the revision before the data so a concurrent edit can only make the entry look older.
+        # A recent poll by the sync worker is trusted, so reruns normally don't wait on Drive at all.
+        sync = get_sheet_sync_worker()
+        sync.watch(sheet_id, client, sheet_url)
+        revision = sync.get_revision(sheet_id)
+        if not revision:
+            revision = self.get_sheet_revision(client, sheet_url)
+            if revision:
+                sync.note_revision(sheet_id, revision)
+        
+        self.data_revision = None
+        df = None
+        with cache['lock']:
+            entry = cache['sheets'].get(sheet_id)
+            if revision and entry and entry['revision'] == revision:
+                self.schedule_index = entry['schedule']
+                self.data_revision = revision
+                # Callers edit the frame in place, so never hand out the cached object itself
+                df = entry['df'].copy()
+        
+        mirror = self.mirror
+        if df is None and mirror is not None and revision and not mirror.has_pending_edits(sheet_id):
+            if mirror.get_revision(sheet_id) == revision:
+                # Unchanged since the mirror last synced (e.g. before a restart), so skip the Sheets read
+                entry = self.make_sheet_entry(revision, mirror.load_frame(sheet_id))
+                with cache['lock']:
+                    cache['sheets'][sheet_id] = entry
+                self.schedule_index = entry['schedule']
+                self.data_revision = revision
+                df = entry['df'].copy()
+        
+        if df is None:
+            try:
+                df, complete = self.fetch_sheet_data(client, sheet_url, on_chunk)
+            except Exception as e:
+                return self.get_stale_sheet_data(sheet_url, e)
             
-            # Create media upload
-            media = MediaIoBaseUpload(
-                io.BytesIO(file_content),
-                mimetype=mime_type,
-                resumable=True
-            )
+            if not (revision and complete):
+                if mirror is not None:
+                    # Without a revision we cannot tell whether the mirror is current, so stop using it
+                    mirror.forget_revision(sheet_id)
+                return add_schedule_columns(df)
             
-            # Upload file
-            file = drive_service.files().create(
-                body=file_metadata,
-                media_body=media,
-                fields='id'
-            ).execute()
+            entry = self.make_sheet_entry(revision, df)
+            with cache['lock']:
+                cache['sheets'][sheet_id] = entry
+            self.schedule_index = entry['schedule']
+            self.data_revision = revision
+            df = entry['df'].copy()
+        
+        if mirror is not None:
+            mirror.sync_from_sheet(sheet_id, revision, df)
+            if mirror.has_pending_edits(sheet_id):
+                # Show edits that are still waiting to be pushed on top of the sheet contents
+                df = mirror.apply_pending(sheet_id, df)
+        
+        return df
+    
+    def get_workspace_data(self, client, sheets, max_workers=WORKSPACE_MAX_WORKERS):
+        """Union of several brands' posts with a Brand column; returns (df, errors) with errors keyed by brand
+        
+        sheets maps brand name to sheet URL. Stale sheets are refreshed into the shared cache in parallel
+        (each by the sync worker's own refresh, on a manager of its own), so N brands cost about one read.
+        """
+        sync = get_sheet_sync_worker()
+        
+        def refresh(sheet_url):
+            # Rejects local paths outside LOCAL_STORAGE_DIR before the sync worker starts watching them
+            self.get_storage(client, sheet_url)
+            sheet_id = self.get_sheet_key(sheet_url)
+            sync.watch(sheet_id, client, sheet_url)
+            sync.sync(UltimateSocialMediaManager(), sheet_id, client, sheet_url)
+        
+        errors = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(sheets)))) as pool:
+            futures = {brand: pool.submit(refresh, sheet_url) for brand, sheet_url in sheets.items()}
+            for brand, future in futures.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    errors[brand] = str(e)
+        
+        cache = get_shared_sheet_cache()
+        frames = []
+        for brand, sheet_url in sheets.items():
+            with cache['lock']:
+                entry = cache['sheets'].get(self.get_sheet_key(sheet_url))
             
-            file_id = file.get('id')
+            if entry is not None:
+                # A failed refresh still leaves the last loaded copy, reported alongside the error
+                df = entry['df'].copy()
+            elif brand in errors:
+                continue
+            else:
+                # Nothing cacheable came back (e.g. no revision), so read it the ordinary way
+                df = self.get_sheet_data(client, sheet_url)
             
-            # Make file publicly viewable
-            permission = {
-                'type': 'anyone',
-                'role': 'reader'
-            }
-            drive_service.permissions().create(fileId=file_id, body=permission).execute()
+            df.insert(0, 'Brand', brand)
+            frames.append(df)
+        
+        if not frames:
+            df = add_schedule_columns(apply_sheet_schema(pd.DataFrame(columns=self.column_names)))
+            df.insert(0, 'Brand', '')
+            return df, errors
+        
+        df = pd.concat(frames, ignore_index=True)
+        df['Brand'] = df['Brand'].astype('category')
+        return df, errors
+    
+    def make_sheet_entry(self, revision, df):
+        """Cache entry for one revision of a sheet, with the schedule columns and index derived up front"""
+        df = add_schedule_columns(df.reindex(columns=self.column_names, fill_value=''))
+        return {'revision': revision, 'df': df, 'schedule': ScheduleIndex(df)}
+    
+    def get_schedule_index(self, df):
+        """Sorted schedule index for df, reusing the one built when this revision was loaded"""
+        if self.schedule_index is None or not self.schedule_index.matches(df):
+            if 'scheduled_at' not in df.columns:
+                df = add_schedule_columns(df)
+            self.schedule_index = ScheduleIndex(df)
+        return self.schedule_index
+    
+    def fetch_sheet_data(self, client, sheet_url, on_chunk=None):
+        """Read all stored posts; returns (df, complete) where complete is False if the result shouldn't be cached
+        
+        Read errors are raised so callers can fall back to an older copy.
+        """
+        storage = self.get_storage(client, sheet_url)
+        df = storage.read(on_chunk)
+        
+        if df is None:
+            return apply_sheet_schema(pd.DataFrame(columns=self.column_names)), False
+        
+        # Backfill ids for sheets created before the PostID column existed
+        df, backfilled = self.assign_post_ids(apply_sheet_schema(df))
+        if backfilled:
+            try:
+                storage.write_post_ids(df)
+            except Exception as e:
+                # The ids still work for this run, but don't cache them since the sheet lacks them
+                st.warning(f"Could not save post ids to the sheet: {str(e)}")
+                return df, False
             
-            # Return direct download URL
-            public_url = f"https://drive.google.com/uc?export=view&id={file_id}"
-            return public_url, None
+            # Our write moved the sheet past the revision read before this fetch, so skip caching once
+            return df, False
+        
+        return df, True
+    
+    def read_sheet_chunks(self, sheet, on_chunk=None, chunk_rows=SHEET_CHUNK_ROWS):
+        """Read the sheet in fixed row ranges and build the DataFrame chunk by chunk
+        
+        Values are numericised the same way get_all_records does it. For sheets bigger than one
+        chunk, on_chunk(rows_loaded, total_rows, first_chunk) is called after each range arrives.
+        Once a range comes back short the remainder of the grid is read in a single call.
+        Returns (header, df); header is empty for a blank sheet.
+        """
+        header = []
+        frames = []
+        blank_gap = 0
+        total_rows = max(sheet.row_count - 1, 0)
+        
+        for start in range(2, max(sheet.row_count, 2) + 1, chunk_rows):
+            end = start + chunk_rows - 1
+            ranges = [f'{start}:{end}']
+            if start == 2:
+                ranges.insert(0, '1:1')
             
-        except Exception as e:
-            return None, f"Error uploading file: {str(e)}"
-    
-    def get_existing_media_from_sheets(self, df):
-        """Extract all existing media URLs from the sheets"""
-        media_items = []
-        
-        for idx, row in df.iterrows():
-            # Get image URLs
-            image_url = self.safe_str_conversion(row.get('ImageURL', ''))
-            if image_url:
-                media_items.append({
-                    'type': 'image',
-                    'url': image_url,
-                    'post_index': idx,
-                    'message_preview': self.safe_str_conversion(row.get('Message', ''))[:50] + "..."
-                })
+            response = self.api_call('sheets', 'batch_get', sheet.batch_get, ranges)
+            if start == 2:
+                header = response[0][0] if response[0] else []
+                if not header:
+                    return [], None
             
-            # Get video URLs
-            video_url = self.safe_str_conversion(row.get('VideoURL', ''))
-            if video_url:
-                media_items.append({
-                    'type': 'video',
-                    'url': video_url,
-                    'post_index': idx,
-                    'message_preview': self.safe_str_conversion(row.get('Message', ''))[:50] + "..."
-                })
+            values = response[-1]
+            width = len(header)
+            if len(values) < chunk_rows and end < sheet.row_count:
+                # A short range means the API trimmed trailing blank rows, so the data has almost certainly
+                # ended and the rest is unused grid: read whatever remains in one call instead of walking it
+                rest = self.api_call('sheets', 'batch_get', sheet.batch_get, [f'{end + 1}:{sheet.row_count}'])[0]
+                if rest:
+                    values = values + [[]] * (chunk_rows - len(values)) + rest
+                end = sheet.row_count
+            
+            if values:
+                # Blank rows at the end of the previous range were trimmed by the API, but they still hold row positions
+                rows = [[''] * width] * blank_gap
+                rows += [
+                    gspread.utils.numericise_all(row[:width] + [''] * (width - len(row)), empty2zero=False, default_blank='')
+                    for row in values
+                ]
+                frames.append(pd.DataFrame(rows, columns=header))
+                blank_gap = 0
+            blank_gap += chunk_rows - len(values)
+            
+            if on_chunk is not None and total_rows > chunk_rows and frames:
+                on_chunk(min(end - 1, total_rows), total_rows, frames[0])
+            if end >= sheet.row_count:
+                break
+        
+        df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=header)
+        return header, df
+    
+    def get_stale_sheet_data(self, sheet_url, error):
+        """Last known copy of a sheet that can't be read right now, so views degrade instead of going blank"""
+        sheet_id = self.get_sheet_key(sheet_url)
+        cache = get_shared_sheet_cache()
+        with cache['lock']:
+            entry = cache['sheets'].get(sheet_id)
+        
+        df = entry['df'].copy() if entry else None
+        if df is None and self.mirror is not None:
+            df = self.mirror.load_frame(sheet_id)
+        
+        if df is None or df.empty:
+            st.error(f"Error reading sheet: {str(error)}")
+            return add_schedule_columns(apply_sheet_schema(pd.DataFrame(columns=self.column_names)))
+        
+        st.warning(f"⚠️ Google Sheets is unavailable ({str(error)}). Showing the last loaded copy, which may be out of date.")
+        return df
+    
+    def invalidate_sheet_cache(self, sheet_url):
+        """Drop the cached copy of a sheet whose contents we can no longer vouch for"""
+        cache = get_shared_sheet_cache()
+        sheet_id = self.get_sheet_key(sheet_url)
+        with cache['lock']:
+            cache['sheets'].pop(sheet_id, None)
+        
+        if self.mirror is not None:
+            self.mirror.forget_revision(sheet_id)
+    
+    def get_sheet_snapshot(self, client, sheet_url):
+        """Cached copy of the sheet if it still matches the live revision, else None"""
+        cache = get_shared_sheet_cache()
+        revision = self.get_sheet_revision(client, sheet_url)
+        
+        with cache['lock']:
+            entry = cache['sheets'].get(self.get_sheet_key(sheet_url))
+        
+        if revision and entry and entry['revision'] == revision:
+            return entry['df'][self.column_names]
+        return None
+    
+    def remember_sheet_data(self, client, sheet_url, df):
+        """Store what we just wrote as the cached snapshot for the sheet's new revision"""
+        df = apply_sheet_schema(df)
+        revision = self.get_sheet_revision(client, sheet_url)
+        if not revision:
+            self.invalidate_sheet_cache(sheet_url)
+            return
+        
+        entry = self.make_sheet_entry(revision, df)
+        cache = get_shared_sheet_cache()
+        with cache['lock']:
+            cache['sheets'][self.get_sheet_key(sheet_url)] = entry
+        get_sheet_sync_worker().note_revision(self.get_sheet_key(sheet_url), revision)
         
-        return media_items
+        if self.mirror is not None:
+            self.mirror.sync_from_sheet(self.get_sheet_key(sheet_url), revision, df, keep_dirty=False)
     
-    def get_sheet_data(self, client, sheet_url):
-        """Fetch data from Google Sheets"""
+    def push_pending_edits(self, client, sheet_url):
+        """Write edits held in the local mirror back to the sheet in one batch"""
+        sheet_id = self.get_sheet_key(sheet_url)
+        if self.mirror is None or not self.mirror.has_pending_edits(sheet_id):
+            return True, "No pending edits"
+        
+        # Rows may have been inserted or deleted since the edits were staged, so re-read the sheet
+        # and apply them by PostID rather than writing back the mirror's old row positions
         try:
-            sheet = client.open_by_url(sheet_url).sheet1
-            data = sheet.get_all_records()
-            
-            if not data:
-                sheet.append_row(self.column_names)
-                return pd.DataFrame(columns=self.column_names)
-            
-            df = pd.DataFrame(data)
-            
-            for col in self.column_names:
-                if col not in df.columns:
-                    df[col] = ''
-            
-            return df[self.column_names]
+            revision = self.get_sheet_revision(client, sheet_url)
+            df, _ = self.fetch_sheet_data(client, sheet_url)
         except Exception as e:
-            st.error(f"Error reading sheet: {str(e)}")
-            return pd.DataFrame(columns=self.column_names)
+            return False, f"Error reading sheet: {str(e)}"
+        self.mirror.sync_from_sheet(sheet_id, revision, df)
+        return self.update_sheet(client, sheet_url, self.mirror.apply_pending(sheet_id, df))
     
     def update_sheet(self, client, sheet_url, df):
-        """Update Google Sheets with DataFrame"""
+        """Store the DataFrame as the full set of posts; for Google Sheets only the cells that changed are sent"""
         try:
-            sheet = client.open_by_url(sheet_url).sheet1
-            sheet.clear()
-            
-            data_to_upload = [self.column_names] + df.fillna('').values.tolist()
-            sheet.update(f'A1:S{len(data_to_upload)}', data_to_upload)
+            df = df.reindex(columns=self.column_names, fill_value='')
+            self.get_storage(client, sheet_url).write(df, self.get_sheet_snapshot(client, sheet_url))
+            self.remember_sheet_data(client, sheet_url, df)
             return True, "Sheet updated successfully!"
         except Exception as e:
+            # A failed write may have partially applied, so the snapshot can no longer be trusted
+            self.invalidate_sheet_cache(sheet_url)
+            
+            if self.mirror is not None:
+                self.mirror.stage_frame(self.get_sheet_key(sheet_url), df)
+                return False, f"Error updating sheet: {str(e)} (changes kept in the local mirror)"
             return False, f"Error updating sheet: {str(e)}"
     
+    def append_rows(self, client, sheet_url, rows, batch_size=1000):
+        """Append posts after the last row without rewriting the existing ones
+        
+        rows can be a DataFrame or a list of dicts/Series keyed by column name.
+        """
+        try:
+            new_df = rows if isinstance(rows, pd.DataFrame) else pd.DataFrame(list(rows))
+            new_df = new_df.reindex(columns=self.column_names, fill_value='').astype(object)
+            new_df = new_df.where(new_df.notna(), '')
+            new_df['PostID'] = [post_id or self.generate_post_id() for post_id in new_df['PostID']]
+            if new_df.empty:
+                return True, "No posts to append"
+            
+            snapshot = self.get_sheet_snapshot(client, sheet_url)
+            self.get_storage(client, sheet_url).append(new_df, batch_size)
+            
+            if snapshot is not None:
+                self.remember_sheet_data(client, sheet_url, pd.concat([snapshot.astype(object), new_df], ignore_index=True))
+            else:
+                self.invalidate_sheet_cache(sheet_url)
+            return True, f"Appended {len(new_df)} post(s)"
+        except Exception as e:
+            self.invalidate_sheet_cache(sheet_url)
+            return False, f"Error appending to sheet: {str(e)}"
+    
+    def append_row(self, client, sheet_url, row):
+        """Append a single post (dict or Series keyed by column name)"""
+        return self.append_rows(client, sheet_url, [row])
+
+    def get_write_queue(self, sheet_url):
+        """This session's write-behind queue for a sheet"""
+        if 'write_queues' not in st.session_state:
+            st.session_state.write_queues = {}
+        
+        queues = st.session_state.write_queues
+        sheet_id = self.get_sheet_key(sheet_url)
+        if sheet_id not in queues:
+            queues[sheet_id] = WriteBehindQueue()
+        return queues[sheet_id]
+    
+    def queue_row_update(self, client, sheet_url, post_id, changes):
+        """Queue cell changes for a post; they are written with other recent edits in one batch"""
+        queue = self.get_write_queue(sheet_url)
+        queue.add_update(post_id, changes)
+        queue.schedule_flush(lambda updates, appends: self.write_queued_edits(client, sheet_url, updates, appends))
+    
+    def queue_append(self, client, sheet_url, row):
+        """Queue a new post to be appended with the next batch of edits"""
+        row = dict(row)
+        if not row.get('PostID'):
+            row['PostID'] = self.generate_post_id()
+        
+        queue = self.get_write_queue(sheet_url)
+        queue.add_append(row)
+        queue.schedule_flush(lambda updates, appends: self.write_queued_edits(client, sheet_url, updates, appends))
+    
+    def flush_write_queue(self, sheet_url):
+        """Write this session's queued edits now instead of waiting for the timer"""
+        return self.get_write_queue(sheet_url).flush()
+    
+    def write_queued_edits(self, client, sheet_url, updates, appends):
+        """Apply queued edits to the current sheet contents and write them in a single update"""
+        df = self.get_sheet_snapshot(client, sheet_url)
+        if df is None:
+            # Runs off the script thread, so read directly rather than through get_sheet_data's UI path
+            df, _ = self.fetch_sheet_data(client, sheet_url)
+        
+        return self.update_sheet(client, sheet_url, apply_row_edits(df, updates, appends))
+
+    def diff_sheet_rows(self, old_rows, new_rows):
+        """Build batch_update ranges for the cells that differ between two lists of sheet rows
+        
+        Returns None when enough rows changed that a full rewrite is the cheaper request.
+        """
+        width = len(self.column_names)
+        updates = []
+        
+        for i in range(max(len(old_rows), len(new_rows))):
+            # Rows past the new end are blanked out; rows past the old end are written in full
+            old = old_rows[i] if i < len(old_rows) else [None] * width
+            new = new_rows[i] if i < len(new_rows) else [''] * width
+            
+            changed_cols = [j for j in range(width) if str(old[j]) != str(new[j])]
+            if not changed_cols:
+                continue
+            
+            first, last = changed_cols[0], changed_cols[-1]
+            start = gspread.utils.rowcol_to_a1(i + 2, first + 1)
+            end = gspread.utils.rowcol_to_a1(i + 2, last + 1)
+            updates.append({'range': f'{start}:{end}', 'values': [list(new[first:last + 1])]})
+        
+        if len(updates) > 50 and len(updates) > len(new_rows) // 2:
+            return None
+        
+        return updates
+    
+    def rewrite_sheet(self, sheet, rows):
+        """Overwrite the whole sheet, then trim leftovers so it is never left empty mid-write"""
+        data_to_upload = [self.column_names] + rows
+        last_col = self.get_last_column_letter()
+        self.api_call('sheets', 'update', sheet.update, range_name=f'A1:{last_col}{len(data_to_upload)}', values=data_to_upload)
+        self.api_call('sheets', 'batch_clear', sheet.batch_clear, [f'A{len(data_to_upload) + 1}:{last_col}'])
+    
+    def get_last_column_letter(self):
+        """Sheet column letter of the last managed column (PostID)"""
+        return re.sub(r'\d', '', gspread.utils.rowcol_to_a1(1, len(self.column_names)))
+    
+    def generate_post_id(self):
+        """New unique id for a post row, prefixed so Sheets never reads it as a number"""
+        return f"P{uuid.uuid4().hex[:11]}"
+    
+    def assign_post_ids(self, df):
+        """Give rows without a PostID a new one; returns (df, whether any ids were added)"""
+        missing = df['PostID'].fillna('').astype(str) == ''
+        if not missing.any():
+            return df, False
+        
+        df = df.copy()
+        df.loc[missing, 'PostID'] = [self.generate_post_id() for _ in range(int(missing.sum()))]
+        return df, True
+    
+    def write_post_ids(self, sheet, df):
+        """Write the whole PostID column back in one request"""
+        if sheet.col_count < len(self.column_names):
+            self.api_call('sheets', 'add_cols', sheet.add_cols, len(self.column_names) - sheet.col_count)
+        
+        last_col = self.get_last_column_letter()
+        values = [['PostID']] + [[post_id] for post_id in df['PostID']]
+        self.api_call('sheets', 'update', sheet.update, range_name=f'{last_col}1:{last_col}{len(values)}', values=values)
+    
+    def index_posts(self, df):
+        """Build the PostID -> row index lookup used by post actions this run"""
+        self.post_index = {post_id: index for index, post_id in zip(df.index, df['PostID']) if post_id}
+        return self.post_index
+    
+    def get_post_row(self, post_id):
+        """Row index of a post in this run's data, or None if it no longer exists"""
+        return self.post_index.get(post_id)
+    
     def safe_int_conversion(self, value, default=0):
         """Safely convert value to integer with fallback"""
         try:
@@ -578,6 +2241,12 @@ class UltimateSocialMediaManager:
         except (ValueError, TypeError):
             return default
     
+    def has_schedule(self, row):
+        """Whether a post has month, day and year set to a real date; blank cells may be '' or <NA>"""
+        if 'status' in row:
+            return row['status'] == 'Scheduled'
+        return all(self.safe_int_conversion(row.get(col), 0) for col in ['Month(1-12)', 'Day(1-31)', 'Year'])
+    
     def safe_str_conversion(self, value, default=''):
         """Safely convert value to string with fallback"""
         try:
@@ -601,7 +2270,7 @@ class UltimateSocialMediaManager:
             score += 10
         
         # Has scheduling info (20 points)
-        if row.get('Month(1-12)') and row.get('Day(1-31)') and row.get('Year'):
+        if self.has_schedule(row):
             score += 20
         
         # Has media (20 points)
@@ -643,7 +2312,7 @@ class UltimateSocialMediaManager:
             feedback.append("🖼️ Adding visual content can significantly boost engagement")
         
         # Scheduling feedback
-        if not (row.get('Month(1-12)') and row.get('Day(1-31)') and row.get('Year')):
+        if not self.has_schedule(row):
             feedback.append("📅 Schedule this post for optimal timing")
         
         # Engagement feedback
@@ -720,6 +2389,53 @@ class UltimateSocialMediaManager:
         except:
             return None
     
+    def load_thumbnail(self, url):
+        """Card-sized copy of an image, served from the disk cache after the first download"""
+        if url in self.prefetched_thumbnails:
+            return self.prefetched_thumbnails[url]
+        if not isinstance(url, str) or not url.startswith(('http://', 'https://')):
+            return None
+        
+        cache = get_thumbnail_cache()
+        cached = cache.get(url)
+        if cached and cache.is_fresh(cached[1]):
+            return cached[0]
+        
+        # Past max-age, ask the origin whether the image changed; a 304 costs no body
+        headers = cache.conditional_headers(cached[1]) if cached else {}
+        try:
+            response = get_image_session().get(url, headers=headers, timeout=10)
+            if cached and response.status_code == 304:
+                cache.mark_fresh(url, cached[1], response.headers)
+                return cached[0]
+            response.raise_for_status()
+            return cache.put(url, response.content, response.headers)
+        except Exception:
+            # Keep showing the old thumbnail while the origin can't be reached
+            return cached[0] if cached else None
+    
+    def warm_thumbnails(self, urls):
+        """Load thumbnails into the disk cache in the background, e.g. for the next page of cards"""
+        pool = get_image_prefetch_pool()
+        get_thumbnail_cache()
+        get_image_session()
+        for url in dict.fromkeys(urls):
+            if url and url not in self.prefetched_thumbnails:
+                pool.submit(self.load_thumbnail, url)
+    
+    def prefetch_thumbnails(self, urls, max_workers=IMAGE_PREFETCH_WORKERS):
+        """Load the thumbnails for a page of cards concurrently; a failed image only leaves its own card without one"""
+        pending = [url for url in dict.fromkeys(urls) if url and url not in self.prefetched_thumbnails]
+        if not pending:
+            return
+        
+        # Resolve the shared resources here rather than racing to create them in the workers
+        get_thumbnail_cache()
+        get_image_session()
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as pool:
+            for url, image in zip(pending, pool.map(self.load_thumbnail, pending)):
+                self.prefetched_thumbnails[url] = image
+    
     def generate_ai_post(self, topic, platform, tone="professional", include_hashtags=True):
         """Generate AI-powered social media post"""
         try:
@@ -790,7 +2506,7 @@ class UltimateSocialMediaManager:
         minute = self.safe_int_conversion(row.get('Minute(0-59)', ''), 0)
         
         # Determine post status
-        if month and day and year:
+        if self.has_schedule(row):
             status = "Scheduled"
             status_class = "status-scheduled"
         else:
@@ -830,10 +2546,12 @@ class UltimateSocialMediaManager:
             image_url = self.safe_str_conversion(row.get('ImageURL', ''))
             if image_url:
                 st.markdown(f"🖼️ **Image Preview:**")
-                try:
-                    st.image(image_url, caption="Post Image", use_column_width=True)
-                except Exception as e:
-                    st.markdown(f"🖼️ [Image Link]({image_url}) - *Preview failed: {str(e)}*")
+                image = self.load_thumbnail(image_url)
+                if image:
+                    st.image(image, caption="Post Image", use_column_width=True)
+                    st.markdown(f"🔍 [Full size]({image_url})")
+                else:
+                    st.markdown(f"🖼️ [Image Link]({image_url}) - *Preview failed*")
             
             video_url = self.safe_str_conversion(row.get('VideoURL', ''))
             if video_url:
@@ -934,11 +2652,14 @@ class UltimateSocialMediaManager:
                     for item in feedback:
                         st.write(item)
             
-            # Display media
+            # Display media; cards show the cached thumbnail and link to the original
+            image_url = self.safe_str_conversion(row.get('ImageURL', ''))
+            video_url = self.safe_str_conversion(row.get('VideoURL', ''))
             if image_url:
-                image = self.load_image_from_url(image_url)
+                image = self.load_thumbnail(image_url)
                 if image:
                     st.image(image, caption="Post Image", use_column_width=True)
+                    st.markdown(f"🔍 [Full size]({image_url})")
                 else:
                     st.info(f"🖼️ Image URL: {image_url}")
             
@@ -951,6 +2672,44 @@ class UltimateSocialMediaManager:
                 else:
                     st.info(f"🎥 Video URL: {video_url}")
 
+class SheetDataContext:
+    """Sheet data for one rerun, loaded once and shared by the sidebar, page router and post actions"""
+    
+    def __init__(self, manager, client, sheet_url, on_chunk=None):
+        self.manager = manager
+        self.client = client
+        self.sheet_url = sheet_url
+        self.on_chunk = on_chunk
+        self._df = None
+        self._stats = None
+    
+    @property
+    def df(self):
+        """The posts DataFrame, fetched on first access"""
+        if self._df is None:
+            df = self.manager.get_sheet_data(self.client, self.sheet_url, self.on_chunk)
+            # Show edits still waiting in the write-behind queue as if they were already saved
+            self._df = self.manager.get_write_queue(self.sheet_url).apply_to(df)
+            self.manager.index_posts(self._df)
+        return self._df
+    
+    @property
+    def stats(self):
+        """Quick-stat counts, computed once per rerun"""
+        if self._stats is None:
+            df = self.df
+            scheduled = len(self.manager.get_schedule_index(df))
+            categories = df['Category'][df['Category'] != ''].value_counts()
+            categories = categories[categories > 0]
+            
+            self._stats = {
+                'total': len(df),
+                'scheduled': scheduled,
+                'queued': len(df) - scheduled,
+                'top_category': categories.index[0] if not categories.empty else "None"
+            }
+        return self._stats
+
 def show_calendar_view(manager, df, client):
     """Clean calendar view with clickable date buttons"""
     st.markdown('<div class="main-header"><h2>📅 Interactive Calendar</h2></div>', unsafe_allow_html=True)
@@ -1001,13 +2760,16 @@ def show_calendar_view(manager, df, client):
             st.rerun()
     
     # Filter posts for current month/year
-    scheduled_posts = df[
-        (df['Month(1-12)'].astype(str) == str(st.session_state.calendar_month)) &
-        (df['Year'].astype(str) == str(st.session_state.calendar_year)) &
-        (df['Month(1-12)'] != '') &
-        (df['Day(1-31)'] != '') &
-        (df['Year'] != '')
-    ].copy()
+    sheet_id = manager.get_sheet_key(st.session_state.sheet_url)
+    if manager.mirror is not None and manager.mirror.get_revision(sheet_id):
+        scheduled_posts = manager.mirror.query_posts(
+            sheet_id, year=st.session_state.calendar_year, month=st.session_state.calendar_month
+        )
+    else:
+        schedule = manager.get_schedule_index(df)
+        scheduled_posts = df.loc[
+            schedule.in_month(st.session_state.calendar_year, st.session_state.calendar_month)
+        ].copy()
     
     # Group posts by day
     posts_by_day = {}
@@ -1094,9 +2856,15 @@ def show_posts_for_date(manager, date_info, df, client):
     # View mode toggle
     view_mode = st.radio("View Mode", ["Clean", "Enhanced"], horizontal=True, key="date_view_mode")
     
-    for i, post in enumerate(posts_sorted):
-        # Find the original index in the dataframe
-        original_index = df[df['Message'] == post['Message']].index[0] if not df[df['Message'] == post['Message']].empty else i
+    manager.prefetch_thumbnails(manager.safe_str_conversion(post.get('ImageURL', '')) for post in posts_sorted)
+    
+    for post in posts_sorted:
+        # Find the post's current row; the selection may predate an edit or delete
+        post_id = post.get('PostID', '')
+        original_index = manager.get_post_row(post_id)
+        if original_index is None:
+            continue
+        post = df.loc[original_index]
         
         # Display post card
         if view_mode == "Clean":
@@ -1108,27 +2876,27 @@ def show_posts_for_date(manager, date_info, df, client):
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            if st.button("✏️ Edit", key=f"edit_{original_index}"):
-                st.session_state.editing_post = original_index
+            if st.button("✏️ Edit", key=f"edit_{post_id}"):
+                st.session_state.editing_post = post_id
                 st.rerun()
         
         with col2:
-            if st.button("📅 Change Date", key=f"change_date_{original_index}"):
-                st.session_state.editing_post_date = original_index
+            if st.button("📅 Change Date", key=f"change_date_{post_id}"):
+                st.session_state.editing_post_date = post_id
                 st.session_state.page = "edit_dates"
                 st.rerun()
         
         with col3:
-            if st.button("📋 Duplicate", key=f"duplicate_{original_index}"):
+            if st.button("📋 Duplicate", key=f"duplicate_{post_id}"):
                 duplicate_post(manager, df, client, original_index)
         
         with col4:
-            if st.button("🗑️ Delete", key=f"delete_{original_index}"):
-                if st.button("Confirm Delete", key=f"confirm_delete_{original_index}"):
+            if st.button("🗑️ Delete", key=f"delete_{post_id}"):
+                if st.button("Confirm Delete", key=f"confirm_delete_{post_id}"):
                     delete_post(manager, df, client, original_index)
         
         # Handle inline editing
-        if 'editing_post' in st.session_state and st.session_state.editing_post == original_index:
+        if 'editing_post' in st.session_state and st.session_state.editing_post == post_id:
             show_inline_edit_form(manager, df, client, original_index, post)
 
 def show_inline_edit_form(manager, df, client, index, post):
@@ -1154,27 +2922,85 @@ def show_inline_edit_form(manager, df, client, index, post):
         col1, col2 = st.columns(2)
         with col1:
             if st.form_submit_button("💾 Save Changes", type="primary"):
-                # Update the dataframe
-                df.loc[index, 'Message'] = new_message
-                df.loc[index, 'Category'] = new_category
-                df.loc[index, 'Link'] = new_link
-                df.loc[index, 'ImageURL'] = new_image_url
-                df.loc[index, 'VideoURL'] = new_video_url
-                
-                # Update Google Sheets
-                success, message = manager.update_sheet(client, st.session_state.sheet_url, df)
-                if success:
-                    st.success("✅ Post updated successfully!")
-                    del st.session_state.editing_post
-                    st.rerun()
-                else:
-                    st.error(f"❌ {message}")
+                # Queue the change; it is written with other recent edits in one batch
+                manager.queue_row_update(client, st.session_state.sheet_url, post['PostID'], {
+                    'Message': new_message,
+                    'Category': new_category,
+                    'Link': new_link,
+                    'ImageURL': new_image_url,
+                    'VideoURL': new_video_url
+                })
+                del st.session_state.editing_post
+                st.rerun()
         
         with col2:
             if st.form_submit_button("❌ Cancel"):
                 del st.session_state.editing_post
                 st.rerun()
 
+# Post lists render one page of cards per run
+POST_PAGE_SIZES = [10, 25, 50, 100]
+DEFAULT_POST_PAGE_SIZE = 25
+
+def paginate_posts(filtered_df, key, filters, focus_post_id=None, label="Posts per page", button=st.button):
+    """Current page of a filtered post list, with page size and navigation controls; returns (page, next_page)
+    
+    The page is kept per list in session state and goes back to the first page when the filters change.
+    focus_post_id jumps once to the page holding that post, e.g. one opened for editing from the calendar.
+    Inside a form pass button=st.form_submit_button for the navigation buttons.
+    """
+    state_key = f"{key}_pagination"
+    if state_key not in st.session_state:
+        st.session_state[state_key] = {'page': 0, 'page_size': DEFAULT_POST_PAGE_SIZE, 'filters': filters, 'focus': None}
+    state = st.session_state[state_key]
+    
+    col1, col2, col3, col4 = st.columns([1, 1, 2, 1])
+    
+    with col4:
+        page_size = st.selectbox(
+            label,
+            POST_PAGE_SIZES,
+            index=POST_PAGE_SIZES.index(DEFAULT_POST_PAGE_SIZE),
+            key=f"{key}_page_size"
+        )
+    
+    # Keep the first visible post in view when the page size changes
+    if page_size != state['page_size']:
+        state['page'] = state['page'] * state['page_size'] // page_size
+        state['page_size'] = page_size
+    
+    if filters != state['filters']:
+        state['filters'] = filters
+        state['page'] = 0
+    
+    if focus_post_id and focus_post_id != state['focus'] and 'PostID' in filtered_df.columns:
+        positions = np.flatnonzero(filtered_df['PostID'].values == focus_post_id)
+        if len(positions):
+            state['page'] = int(positions[0]) // page_size
+    state['focus'] = focus_post_id
+    
+    page_count = max(1, -(-len(filtered_df) // page_size))
+    state['page'] = min(state['page'], page_count - 1)
+    
+    with col1:
+        if button("◀ Previous", key=f"{key}_previous", disabled=state['page'] == 0):
+            state['page'] -= 1
+            st.rerun()
+    
+    with col2:
+        if button("Next ▶", key=f"{key}_next", disabled=state['page'] >= page_count - 1):
+            state['page'] += 1
+            st.rerun()
+    
+    with col3:
+        st.markdown(
+            f"<div style='text-align: center; padding-top: 8px;'>Page {state['page'] + 1} of {page_count}</div>",
+            unsafe_allow_html=True
+        )
+    
+    start = state['page'] * page_size
+    return filtered_df.iloc[start:start + page_size], filtered_df.iloc[start + page_size:start + 2 * page_size]
+
 def show_edit_dates_page(manager, df, client):
     """Separate page for editing posting dates and times"""
     st.markdown('<div class="main-header"><h2>📅 Edit Posting Dates & Times</h2></div>', unsafe_allow_html=True)
@@ -1205,25 +3031,21 @@ def show_edit_dates_page(manager, df, client):
     filtered_df = df.copy()
     
     if filter_option == "Scheduled Posts":
-        filtered_df = filtered_df[
-            (filtered_df['Month(1-12)'] != '') & 
-            (filtered_df['Day(1-31)'] != '') & 
-            (filtered_df['Year'] != '')
-        ]
+        filtered_df = filtered_df[filtered_df['status'] == 'Scheduled']
     elif filter_option == "Unscheduled Posts":
-        filtered_df = filtered_df[
-            (filtered_df['Month(1-12)'] == '') | 
-            (filtered_df['Day(1-31)'] == '') | 
-            (filtered_df['Year'] == '')
-        ]
+        filtered_df = filtered_df[filtered_df['status'] == 'Queued']
     
     if search_term:
         filtered_df = filtered_df[
             filtered_df['Message'].str.contains(search_term, case=False, na=False)
         ]
     
-    # Show posts
-    for index, post in filtered_df.iterrows():
+    # Show the current page of posts
+    page_df, _ = paginate_posts(
+        filtered_df, "edit_dates", (filter_option, search_term),
+        focus_post_id=st.session_state.get('editing_post_date')
+    )
+    for index, post in page_df.iterrows():
         st.markdown('<div class="post-card-clean">', unsafe_allow_html=True)
         
         # Post info
@@ -1237,7 +3059,7 @@ def show_edit_dates_page(manager, df, client):
             hour = manager.safe_str_conversion(post.get('Hour', ''))
             minute = manager.safe_int_conversion(post.get('Minute(0-59)', ''), 0)
             
-            if month and day and year:
+            if manager.has_schedule(post):
                 status = "Scheduled"
                 status_class = "status-scheduled"
                 time_str = f"{hour}:{minute:02d}" if hour else "No time"
@@ -1256,14 +3078,14 @@ def show_edit_dates_page(manager, df, client):
             st.markdown(f'<div class="post-content">{preview}</div>', unsafe_allow_html=True)
         
         with col2:
-            if st.button("📅 Edit Date/Time", key=f"edit_date_{index}"):
-                st.session_state.editing_post_date = index
+            if st.button("📅 Edit Date/Time", key=f"edit_date_{post['PostID']}"):
+                st.session_state.editing_post_date = post['PostID']
                 st.rerun()
         
         st.markdown('</div>', unsafe_allow_html=True)
         
         # Show edit form if this post is being edited
-        if 'editing_post_date' in st.session_state and st.session_state.editing_post_date == index:
+        if 'editing_post_date' in st.session_state and st.session_state.editing_post_date == post['PostID']:
             show_date_edit_form(manager, df, client, index, post)
 
 def show_date_edit_form(manager, df, client, index, post):
@@ -1373,21 +3195,18 @@ def show_date_edit_form(manager, df, client, index, post):
         
         with col1:
             if st.form_submit_button("💾 Save Date & Time", type="primary"):
-                # Update the dataframe
-                df.loc[index, 'Month(1-12)'] = new_month if new_month > 0 else ''
-                df.loc[index, 'Day(1-31)'] = new_day if new_day > 0 else ''
-                df.loc[index, 'Year'] = new_year if new_year > 0 else ''
-                df.loc[index, 'Hour'] = new_hour if new_month > 0 and new_day > 0 and new_year > 0 else ''
-                df.loc[index, 'Minute(0-59)'] = new_minute if new_month > 0 and new_day > 0 and new_year > 0 else ''
+                has_date = new_month > 0 and new_day > 0 and new_year > 0
                 
-                # Update Google Sheets
-                success, message = manager.update_sheet(client, st.session_state.sheet_url, df)
-                if success:
-                    st.success("✅ Date and time updated successfully!")
-                    del st.session_state.editing_post_date
-                    st.rerun()
-                else:
-                    st.error(f"❌ {message}")
+                # Queue the change; it is written with other recent edits in one batch
+                manager.queue_row_update(client, st.session_state.sheet_url, post['PostID'], {
+                    'Month(1-12)': new_month if new_month > 0 else '',
+                    'Day(1-31)': new_day if new_day > 0 else '',
+                    'Year': new_year if new_year > 0 else '',
+                    'Hour': new_hour if has_date else '',
+                    'Minute(0-59)': new_minute if has_date else ''
+                })
+                del st.session_state.editing_post_date
+                st.rerun()
         
         with col2:
             if st.form_submit_button("❌ Cancel"):
@@ -1401,6 +3220,7 @@ def duplicate_post(manager, df, client, index):
     if index < len(df):
         post = df.iloc[index].copy()
         post['Message'] = f"[COPY] {post['Message']}"
+        post['PostID'] = manager.generate_post_id()
         
         # Clear scheduling to avoid conflicts
         post['Month(1-12)'] = ''
@@ -1409,19 +3229,18 @@ def duplicate_post(manager, df, client, index):
         post['Hour'] = ''
         post['Minute(0-59)'] = ''
         
-        # Add to dataframe
-        new_df = pd.concat([df, pd.DataFrame([post])], ignore_index=True)
-        
-        success, message = manager.update_sheet(client, st.session_state.sheet_url, new_df)
-        if success:
-            st.success("✅ Post duplicated successfully!")
-            st.rerun()
-        else:
-            st.error(f"❌ {message}")
+        manager.queue_append(client, st.session_state.sheet_url, post)
+        st.rerun()
 
 def delete_post(manager, df, client, index):
     """Delete a post"""
     if index < len(df):
+        # Queued edits are addressed by row, so write them before the rows shift
+        success, message = manager.flush_write_queue(st.session_state.sheet_url)
+        if not success:
+            st.error(f"❌ {message}")
+            return
+        
         df.drop(index, inplace=True)
         df.reset_index(drop=True, inplace=True)
         
@@ -1444,7 +3263,7 @@ def show_posts_list(manager, df, client):
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        categories = ['All'] + list(df['Category'].dropna().unique())
+        categories = ['All'] + [category for category in df['Category'].unique() if category != '']
         category_filter = st.selectbox("Filter by Category", categories)
     
     with col2:
@@ -1467,17 +3286,9 @@ def show_posts_list(manager, df, client):
         filtered_df = filtered_df[filtered_df['Category'] == category_filter]
     
     if status_filter == "Scheduled":
-        filtered_df = filtered_df[
-            (filtered_df['Month(1-12)'] != '') & 
-            (filtered_df['Day(1-31)'] != '') & 
-            (filtered_df['Year'] != '')
-        ]
+        filtered_df = filtered_df[filtered_df['status'] == 'Scheduled']
     elif status_filter == "Unscheduled":
-        filtered_df = filtered_df[
-            (filtered_df['Month(1-12)'] == '') | 
-            (filtered_df['Day(1-31)'] == '') | 
-            (filtered_df['Year'] == '')
-        ]
+        filtered_df = filtered_df[filtered_df['status'] == 'Queued']
     
     if search_term:
         filtered_df = filtered_df[
@@ -1501,8 +3312,15 @@ def show_posts_list(manager, df, client):
     
     st.write(f"Showing {len(filtered_df)} of {len(df)} posts")
     
+    # Only the current page is rendered
+    page_df, next_page_df = paginate_posts(filtered_df, "posts_list", (category_filter, status_filter, sort_by, search_term))
+    
+    # Fetch the page's images together before rendering the cards, and the next page's in the background
+    manager.prefetch_thumbnails(page_df['ImageURL'])
+    manager.warm_thumbnails(next_page_df['ImageURL'])
+    
     # Display posts
-    for index, post in filtered_df.iterrows():
+    for index, post in page_df.iterrows():
         # Display post card based on view mode
         if view_mode == "Clean":
             manager.display_enhanced_post_card(post, index, view_mode="clean")
@@ -1514,12 +3332,12 @@ def show_posts_list(manager, df, client):
         
         with col1:
             if st.button("✏️ Edit", key=f"edit_list_{index}"):
-                st.session_state.editing_post = index
+                st.session_state.editing_post = post['PostID']
                 st.rerun()
         
         with col2:
             if st.button("📅 Schedule", key=f"schedule_list_{index}"):
-                st.session_state.editing_post_date = index
+                st.session_state.editing_post_date = post['PostID']
                 st.session_state.page = "edit_dates"
                 st.rerun()
         
@@ -1647,7 +3465,14 @@ def show_manual_post_creation(manager, df, client):
                         st.session_state.uploaded_video_name = file_name
                         st.session_state.uploaded_video_type = file_type
                     
-                    if st.button("📤 Upload to Google Drive", type="primary"):
+                    # The same file may already be in the library under another URL
+                    existing_urls = get_media_index().find_by_hash(
+                        manager.get_sheet_key(st.session_state.sheet_url), hashlib.sha256(file_content).hexdigest()
+                    )
+                    if existing_urls:
+                        st.info(f"♻️ This file is already in your media library: {existing_urls[0]}")
+                    
+                    if st.form_submit_button("📤 Upload to Google Drive", type="primary"):
                         drive_service, error = manager.setup_google_drive()
                         if error:
                             st.error(f"❌ {error}")
@@ -1666,6 +3491,10 @@ def show_manual_post_creation(manager, df, client):
                                 else:
                                     st.success(f"✅ File uploaded successfully!")
                                     st.code(public_url)
+                                    get_media_index().record(
+                                        manager.get_sheet_key(st.session_state.sheet_url), public_url,
+                                        'image' if file_type.startswith('image/') else 'video', file_content
+                                    )
                                     
                                     # Store URL for form submission
                                     if file_type.startswith('image/'):
@@ -1676,46 +3505,63 @@ def show_manual_post_creation(manager, df, client):
             with media_tab2:
                 st.markdown("**Pick from Existing Media:**")
                 
-                # Get existing media from sheets
-                existing_media = manager.get_existing_media_from_sheets(df)
+                # Filter by type
+                media_type_filter = st.selectbox("Filter by type:", ["All", "Images", "Videos"])
+                media_type = {"Images": "image", "Videos": "video"}.get(media_type_filter)
                 
-                if existing_media:
-                    # Filter by type
-                    media_type_filter = st.selectbox("Filter by type:", ["All", "Images", "Videos"])
-                    
-                    filtered_media = existing_media
-                    if media_type_filter == "Images":
-                        filtered_media = [m for m in existing_media if m['type'] == 'image']
-                    elif media_type_filter == "Videos":
-                        filtered_media = [m for m in existing_media if m['type'] == 'video']
+                # Everything shown here comes from the media index, previews from the thumbnail cache
+                filtered_media = manager.get_existing_media_from_sheets(df, st.session_state.sheet_url, media_type)
+                
+                if filtered_media:
+                    # Page the grid like the post list; only the visible page is fetched and rendered
+                    page, _ = paginate_posts(
+                        pd.DataFrame({'url': [media['url'] for media in filtered_media]}),
+                        "media_picker", (media_type_filter,), label="Media per page", button=st.form_submit_button
+                    )
+                    page_media = [(idx, filtered_media[idx]) for idx in page.index]
+                    manager.prefetch_thumbnails(media['url'] for _, media in page_media if media['type'] == 'image')
                     
-                    if filtered_media:
-                        # Display media grid
-                        cols = st.columns(3)
-                        for idx, media in enumerate(filtered_media):
-                            with cols[idx % 3]:
-                                st.markdown(f"**{media['type'].title()}**")
-                                
-                                # Show preview
+                    # Display media grid
+                    cols = st.columns(3)
+                    for position, (idx, media) in enumerate(page_media):
+                        with cols[position % 3]:
+                            st.markdown(f"**{media['type'].title()}**")
+                            
+                            # Show preview
+                            if media['type'] == 'image':
+                                image = manager.load_thumbnail(media['url'])
+                                if image:
+                                    st.image(image, use_column_width=True)
+                                else:
+                                    st.markdown(f"🔗 [Preview]({media['url']})")
+                            else:
                                 try:
-                                    if media['type'] == 'image':
-                                        st.image(media['url'], use_column_width=True)
-                                    else:
-                                        st.video(media['url'])
+                                    st.video(media['url'])
                                 except:
                                     st.markdown(f"🔗 [Preview]({media['url']})")
-                                
-                                st.markdown(f"*From: {media['message_preview']}*")
-                                
-                                if st.button(f"Use This {media['type'].title()}", key=f"use_media_{idx}"):
-                                    if media['type'] == 'image':
-                                        st.session_state.selected_image_url = media['url']
-                                        st.success(f"✅ Image selected!")
-                                    else:
-                                        st.session_state.selected_video_url = media['url']
-                                        st.success(f"✅ Video selected!")
-                    else:
-                        st.info("No media found matching the filter.")
+                            
+                            details = []
+                            if media['width'] and media['height']:
+                                details.append(f"{media['width']}×{media['height']}")
+                            if media['bytes']:
+                                size_mb = media['bytes'] / 1024 / 1024
+                                details.append(f"{size_mb:.1f} MB" if size_mb >= 1 else f"{media['bytes'] / 1024:.0f} KB")
+                            if details:
+                                st.caption(" · ".join(details))
+                            if media['duplicates']:
+                                st.caption(f"⚠️ Same file as {media['duplicates']} other URL{'s' if media['duplicates'] != 1 else ''}")
+                            
+                            st.markdown(f"*From: {media['message_preview']}*")
+                            
+                            if st.form_submit_button(f"Use This {media['type'].title()}", key=f"use_media_{idx}"):
+                                if media['type'] == 'image':
+                                    st.session_state.selected_image_url = media['url']
+                                    st.success(f"✅ Image selected!")
+                                else:
+                                    st.session_state.selected_video_url = media['url']
+                                    st.success(f"✅ Video selected!")
+                elif media_type:
+                    st.info("No media found matching the filter.")
                 else:
                     st.info("No existing media found in your posts. Upload some media first!")
             
@@ -1859,11 +3705,8 @@ def show_manual_post_creation(manager, df, client):
                 'AltText': alt_text
             }
             
-            # Add to dataframe
-            new_df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-            
-            # Update Google Sheets
-            success, message_result = manager.update_sheet(client, st.session_state.sheet_url, new_df)
+            # Append to Google Sheets
+            success, message_result = manager.append_row(client, st.session_state.sheet_url, new_row)
             
             if success:
                 st.success("✅ Post created successfully!")
@@ -1985,11 +3828,8 @@ def show_ai_post_generation(manager, df, client):
                     'AltText': ''
                 }
                 
-                # Add to dataframe
-                new_df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-                
-                # Update Google Sheets
-                success, message_result = manager.update_sheet(client, st.session_state.sheet_url, new_df)
+                # Append to Google Sheets
+                success, message_result = manager.append_row(client, st.session_state.sheet_url, new_row)
                 
                 if success:
                     st.success("✅ Post saved as draft!")
@@ -2090,11 +3930,8 @@ def show_template_post_creation(manager, df, client):
                         'AltText': ''
                     }
                     
-                    # Add to dataframe
-                    new_df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-                    
-                    # Update Google Sheets
-                    success, message_result = manager.update_sheet(client, st.session_state.sheet_url, new_df)
+                    # Append to Google Sheets
+                    success, message_result = manager.append_row(client, st.session_state.sheet_url, new_row)
                     
                     if success:
                         st.success("✅ Template post created successfully!")
@@ -2126,7 +3963,7 @@ def show_analytics_dashboard(df):
         """, unsafe_allow_html=True)
     
     with col2:
-        scheduled_posts = len(df[(df['Month(1-12)'] != '') & (df['Day(1-31)'] != '') & (df['Year'] != '')])
+        scheduled_posts = int((df['status'] == 'Scheduled').sum())
         st.markdown(f"""
         <div class="metric-card">
             <div class="metric-value">{scheduled_posts}</div>
@@ -2159,6 +3996,7 @@ def show_analytics_dashboard(df):
         st.subheader("📂 Posts by Category")
         if not df['Category'].empty:
             category_counts = df['Category'].value_counts()
+            category_counts = category_counts[category_counts > 0]
             fig = px.pie(
                 values=category_counts.values,
                 names=category_counts.index,
@@ -2383,6 +4221,151 @@ def show_ai_tools(manager, df, client):
                     )
                     st.plotly_chart(fig, use_container_width=True)
 
+def show_workspace_overview(manager, client, workspace_sheets):
+    """Cross-brand dashboard, calendar and analytics over every sheet in the workspace"""
+    st.markdown('<div class="main-header"><h2>🏢 Brand Overview</h2></div>', unsafe_allow_html=True)
+    
+    # Brand -> sheet URL, skipping rows that are still being filled in
+    sheets = {}
+    for _, row in workspace_sheets.iterrows():
+        brand = str(row['Brand'] or '').strip()
+        sheet_url = str(row['Sheet URL'] or '').strip()
+        if brand and sheet_url:
+            sheets[brand] = sheet_url
+    
+    if not sheets:
+        st.info("🏢 Add a brand name and sheet URL for each brand under Workspace in the sidebar.")
+        return
+    
+    with st.spinner(f"📊 Loading {len(sheets)} brand sheet{'s' if len(sheets) != 1 else ''}..."):
+        df, errors = manager.get_workspace_data(client, sheets)
+    
+    for brand, error in errors.items():
+        st.warning(f"⚠️ {brand}: couldn't refresh the sheet ({error}). Showing the last loaded copy, if any.")
+    
+    brands = st.multiselect("Brands", list(sheets), default=list(sheets))
+    df = df[df['Brand'].isin(brands)].reset_index(drop=True)
+    
+    if df.empty:
+        st.info("No posts for the selected brands yet.")
+        return
+    
+    schedule = ScheduleIndex(df)
+    tab1, tab2, tab3 = st.tabs(["📊 Dashboard", "📅 Calendar", "📈 Analytics"])
+    
+    with tab1:
+        # Per-brand totals and the next post due for each
+        scheduled = df['status'] == 'Scheduled'
+        upcoming = df.loc[schedule.between(datetime.now(), pd.Timestamp.max)]
+        summary = pd.DataFrame({
+            'Posts': df.groupby('Brand', observed=True).size(),
+            'Scheduled': scheduled.groupby(df['Brand'], observed=True).sum(),
+            'Next Post': upcoming.groupby('Brand', observed=True)['scheduled_at'].min()
+        }).reindex(brands)
+        summary['Queued'] = summary['Posts'].fillna(0) - summary['Scheduled'].fillna(0)
+        st.dataframe(summary[['Posts', 'Scheduled', 'Queued', 'Next Post']], use_container_width=True)
+        
+        st.subheader("⏭️ Coming Up")
+        st.dataframe(
+            upcoming.head(20)[['scheduled_at', 'Brand', 'Category', 'Message']],
+            use_container_width=True,
+            hide_index=True
+        )
+    
+    with tab2:
+        col1, col2 = st.columns(2)
+        with col1:
+            month = st.selectbox(
+                "Month",
+                options=list(range(1, 13)),
+                index=datetime.now().month - 1,
+                format_func=lambda x: calendar.month_name[x],
+                key="workspace_month"
+            )
+        with col2:
+            year = st.number_input("Year", min_value=2000, max_value=2100, value=datetime.now().year, key="workspace_year")
+        
+        month_posts = df.loc[schedule.in_month(int(year), month)]
+        if month_posts.empty:
+            st.info(f"No posts scheduled for {calendar.month_name[month]} {int(year)}.")
+        else:
+            # Posts per day and brand, then the posts themselves in time order
+            per_day = pd.crosstab(month_posts['scheduled_at'].dt.day.rename('Day'), month_posts['Brand'])
+            st.dataframe(per_day, use_container_width=True)
+            st.dataframe(
+                month_posts[['scheduled_at', 'Brand', 'Category', 'Message']],
+                use_container_width=True,
+                hide_index=True
+            )
+    
+    with tab3:
+        st.subheader("🏢 Posts by Brand")
+        brand_counts = pd.crosstab(df['Brand'], df['status'])
+        fig = px.bar(brand_counts, barmode='stack', title="Scheduled and Queued Posts per Brand")
+        st.plotly_chart(fig, use_container_width=True)
+        
+        show_analytics_dashboard(df.copy())
+
+@st.fragment(run_every=WRITE_FLUSH_DELAY)
+def show_write_queue_status(manager, sheet_url):
+    """Sidebar status of the write-behind queue, refreshed while edits are being saved"""
+    queue = manager.get_write_queue(sheet_url)
+    pending = queue.pending_count()
+    
+    if pending:
+        st.info(f"⏳ Saving {pending} edited post(s)...")
+        if st.button("💾 Save Now", use_container_width=True):
+            success, message = queue.flush()
+            if not success:
+                st.error(f"❌ {message}")
+    elif queue.last_result:
+        flushed_at, success, message = queue.last_result
+        if success:
+            st.caption(f"✅ All edits saved at {flushed_at.strftime('%H:%M:%S')}")
+        else:
+            st.error(f"❌ {message}")
+
+@st.fragment(run_every=SHEET_SYNC_INTERVAL or None)
+def show_sync_status(manager, sheet_url):
+    """Sidebar notice, rechecked every sync interval, when the sheet has moved past the revision on screen"""
+    sheet_id = manager.get_sheet_key(sheet_url)
+    loaded = st.session_state.get('loaded_revisions', {}).get(sheet_id)
+    latest = get_sheet_sync_worker().get_revision(sheet_id)
+    
+    if loaded and latest and latest != loaded:
+        st.info("🔄 The sheet has changed since this page loaded")
+        if st.button("🔄 Refresh", use_container_width=True):
+            st.rerun()
+
+def make_load_progress(placeholder):
+    """on_chunk callback that shows load progress and the first rows while a large sheet is read"""
+    def on_chunk(rows_loaded, total_rows, first_rows):
+        with placeholder.container():
+            st.progress(min(rows_loaded / total_rows, 1.0), text=f"📊 Loaded {rows_loaded:,} of about {total_rows:,} rows...")
+            preview = first_rows.reindex(columns=['Message', 'Category', 'Month(1-12)', 'Day(1-31)', 'Year'], fill_value='')
+            st.dataframe(preview.head(50), hide_index=True, use_container_width=True)
+    return on_chunk
+
+def show_api_metrics():
+    """Sidebar table of Google API calls, retries and latency since the server started"""
+    rows = []
+    for api, limiter in get_google_api_limiters().items():
+        for name, stats in limiter.get_metrics().items():
+            attempts = stats['calls'] + stats['retries']
+            rows.append({
+                'API': api,
+                'Call': name,
+                'Calls': stats['calls'],
+                'Retries': stats['retries'],
+                'Errors': stats['errors'],
+                'Avg ms': round(stats['total_time'] / attempts * 1000) if attempts else 0,
+                'Max ms': round(stats['max_time'] * 1000)
+            })
+    
+    if rows:
+        with st.expander("📡 Google API Usage"):
+            st.dataframe(pd.DataFrame(rows), hide_index=True, use_container_width=True)
+
 def main():
     """Main application function"""
     st.title("🚀 Ultimate AI-Powered Social Media Manager")
@@ -2421,12 +4404,39 @@ def main():
         sheet_url = st.text_input(
             "Google Sheets URL",
             value=st.session_state.sheet_url,
-            help="Your Google Sheets URL (pre-filled)"
+            help=(
+                f"Your Google Sheets URL (pre-filled), or a .parquet/.csv file in {LOCAL_STORAGE_DIR} to work without Google"
+                if LOCAL_STORAGE_DIR else "Your Google Sheets URL (pre-filled)"
+            )
         )
         
         if sheet_url:
             st.session_state.sheet_url = sheet_url
         
+        use_mirror = st.checkbox(
+            "💾 Local SQLite mirror",
+            key="use_local_mirror",
+            help="Keep a local copy of the sheet for faster views and to hold edits during Sheets outages"
+        )
+        if use_mirror:
+            manager.mirror = get_sheet_mirror()
+        
+        # Brand sheets for the cross-brand overview
+        if 'workspace_sheets' not in st.session_state:
+            st.session_state.workspace_sheets = pd.DataFrame({'Brand': ['Main'], 'Sheet URL': [st.session_state.sheet_url]})
+        
+        with st.expander("🏢 Workspace"):
+            workspace_sheets = st.data_editor(
+                st.session_state.workspace_sheets,
+                num_rows="dynamic",
+                key="workspace_editor",
+                use_container_width=True,
+                column_config={
+                    'Brand': st.column_config.TextColumn("Brand"),
+                    'Sheet URL': st.column_config.TextColumn("Sheet URL", help="Google Sheets URL or local .parquet/.csv path")
+                }
+            )
+        
         # Navigation
         st.markdown("---")
         st.header("📍 Navigation")
@@ -2455,40 +4465,68 @@ def main():
             st.session_state.page = "ai_tools"
             st.rerun()
         
-        # Quick stats
-        if 'google_credentials' in st.session_state and 'sheet_url' in st.session_state:
-            st.markdown("---")
-            st.subheader("📈 Quick Stats")
-            
-            # Try to load data for stats
-            try:
-                client, error = manager.setup_google_sheets()
-                if not error:
-                    df = manager.get_sheet_data(client, st.session_state.sheet_url)
-                    
-                    if not df.empty:
-                        st.metric("Total Posts", len(df))
-                        scheduled = len(df[(df['Month(1-12)'] != '') & (df['Day(1-31)'] != '') & (df['Year'] != '')])
-                        st.metric("Scheduled", scheduled)
-                        
-                        if df['Category'].notna().any():
-                            top_category = df['Category'].value_counts().index[0] if not df['Category'].value_counts().empty else "None"
-                            st.metric("Top Category", top_category)
-            except:
-                pass  # Silently fail for sidebar stats
+        if st.button("🏢 Brand Overview", use_container_width=True):
+            st.session_state.page = "workspace"
+            st.rerun()
+        
+        # Quick stats are filled in below, once the sheet has been loaded for this run
+        quick_stats = st.container()
     
     # Main content
-    if 'google_credentials' in st.session_state and 'sheet_url' in st.session_state:
-        # Setup Google Sheets connection
-        client, error = manager.setup_google_sheets()
+    local_storage = 'sheet_url' in st.session_state and is_local_storage(st.session_state.sheet_url)
+    if local_storage or ('google_credentials' in st.session_state and 'sheet_url' in st.session_state):
+        # Setup Google Sheets connection; local files need no client
+        client, error = (None, None) if local_storage else manager.setup_google_sheets()
+        if local_storage:
+            try:
+                manager.get_storage(client, st.session_state.sheet_url)
+            except ValueError as e:
+                error = str(e)
         
         if error:
             st.error(f"❌ {error}")
             return
         
-        # Load data
+        # Load data once for the whole run; large sheets preview their first rows while the rest arrives
+        loading = st.empty()
+        data = SheetDataContext(manager, client, st.session_state.sheet_url, on_chunk=make_load_progress(loading))
         with st.spinner("📊 Loading your social media data..."):
-            df = manager.get_sheet_data(client, st.session_state.sheet_url)
+            df = data.df
+        loading.empty()
+        
+        # Revision on screen, for the background sync's stale-data notice
+        if 'loaded_revisions' not in st.session_state:
+            st.session_state.loaded_revisions = {}
+        st.session_state.loaded_revisions[manager.get_sheet_key(data.sheet_url)] = manager.data_revision
+        
+        # Edits held locally after a failed write
+        if manager.mirror is not None and manager.mirror.has_pending_edits(manager.get_sheet_key(data.sheet_url)):
+            with quick_stats:
+                st.warning("⏳ Local edits not yet saved to Google Sheets")
+                if st.button("⬆️ Push Pending Edits", use_container_width=True):
+                    success, message = manager.push_pending_edits(client, data.sheet_url)
+                    if success:
+                        st.rerun()
+                    else:
+                        st.error(f"❌ {message}")
+        
+        # Edits waiting in the write-behind queue, and newer data from the background sync
+        with quick_stats:
+            show_write_queue_status(manager, data.sheet_url)
+            show_sync_status(manager, data.sheet_url)
+        
+        # Quick stats
+        with quick_stats:
+            if not df.empty:
+                st.markdown("---")
+                st.subheader("📈 Quick Stats")
+                
+                stats = data.stats
+                st.metric("Total Posts", stats['total'])
+                st.metric("Scheduled", stats['scheduled'])
+                st.metric("Top Category", stats['top_category'])
+            
+            show_api_metrics()
         
         # Show appropriate page
         if st.session_state.page == "calendar":
@@ -2503,6 +4541,8 @@ def main():
             show_analytics_dashboard(df)
         elif st.session_state.page == "ai_tools":
             show_ai_tools(manager, df, client)
+        elif st.session_state.page == "workspace":
+            show_workspace_overview(manager, client, workspace_sheets)
     
     else:
         # Welcome screen
@@ -5,6 +5,8 @@ from PIL import Image
 import requests
 from io import BytesIO
 import os
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 
 # ------------------------
 # App Setup
@@ -35,6 +37,156 @@ if "posts" not in st.session_state:
         for i, url in enumerate(demo_images)
     ])
 
+# Uploaded CSVs already applied this session, keyed by content hash
+if "imports" not in st.session_state:
+    st.session_state.imports = {}
+
+# ------------------------
+# CSV Import
+# ------------------------
+POST_COLUMNS = ["ImagePath", "Caption", "PostDate"]
+IMPORT_CHUNK_ROWS = 10000
+IMPORT_MAX_ERRORS = 1000
+
+def post_hashes(posts):
+    """Content hash of each post (image, caption and date), used to spot duplicates"""
+    content = posts.reindex(columns=POST_COLUMNS, fill_value="").fillna("").astype(str)
+    return pd.util.hash_pandas_object(content, index=False)
+
+def normalize_import_chunk(chunk, first_row):
+    """Validate one chunk of CSV rows; returns (clean rows, [(row number, problem), ...])"""
+    chunk = chunk.reindex(columns=POST_COLUMNS, fill_value="").fillna("").astype(str)
+    chunk = chunk.apply(lambda col: col.str.strip())
+    problems = pd.Series("", index=chunk.index)
+
+    # ISO dates are parsed in one pass; only the rest go through the slower per-value parser
+    dates = pd.to_datetime(chunk["PostDate"], format="%Y-%m-%d", errors="coerce")
+    other = dates.isna() & (chunk["PostDate"] != "")
+    if other.any():
+        dates[other] = pd.to_datetime(chunk.loc[other, "PostDate"], format="mixed", errors="coerce")
+
+    problems[dates.isna()] = "PostDate is missing or not a date"
+    problems[(chunk["ImagePath"] == "") & (problems == "")] = "ImagePath is empty"
+
+    chunk["PostDate"] = dates.dt.strftime("%Y-%m-%d")
+    chunk.loc[chunk["Caption"] == "", "Caption"] = "No caption"
+
+    bad = problems != ""
+    rows = range(first_row, first_row + len(chunk))
+    errors = [(row, problem) for row, problem, is_bad in zip(rows, problems, bad) if is_bad]
+    return chunk[~bad], errors
+
+def import_posts_csv(uploaded_csv, existing):
+    """Read an uploaded CSV in chunks, validate it and drop posts that already exist
+
+    Returns (new_posts, errors, error_count, duplicates).
+    """
+    uploaded_csv.seek(0)
+    seen = set(post_hashes(existing))
+    kept, errors, error_count, duplicates = [], [], 0, 0
+    first_row = 2  # Row 1 is the header
+
+    for chunk in pd.read_csv(uploaded_csv, dtype=str, keep_default_na=False, chunksize=IMPORT_CHUNK_ROWS):
+        clean, chunk_errors = normalize_import_chunk(chunk, first_row)
+        first_row += len(chunk)
+        error_count += len(chunk_errors)
+        errors.extend(chunk_errors[:IMPORT_MAX_ERRORS - len(errors)])
+
+        hashes = post_hashes(clean)
+        duplicate = (hashes.duplicated() | hashes.isin(seen)).values
+        seen.update(hashes[~duplicate])
+        duplicates += int(duplicate.sum())
+        kept.append(clean[~duplicate])
+
+    new_posts = pd.concat(kept, ignore_index=True) if kept else pd.DataFrame(columns=POST_COLUMNS)
+    return new_posts, errors, error_count, duplicates
+
+def apply_csv_import(uploaded_csv, mode):
+    """Import an uploaded CSV into the session posts once; later reruns with the same file are no-ops
+
+    mode is "Merge" (add new posts, skip duplicates) or "Replace" (the file becomes the post list).
+    Returns the registry entry for the file and whether it was applied on this run.
+    """
+    file_hash = hashlib.sha256(uploaded_csv.getvalue()).hexdigest()
+    if file_hash in st.session_state.imports:
+        return st.session_state.imports[file_hash], False
+
+    existing = st.session_state.posts if mode == "Merge" else pd.DataFrame(columns=POST_COLUMNS)
+    new_posts, errors, error_count, duplicates = import_posts_csv(uploaded_csv, existing)
+
+    if mode == "Replace" and not new_posts.empty:
+        st.session_state.posts = new_posts
+    elif not new_posts.empty:
+        posts = pd.concat([st.session_state.posts, new_posts], ignore_index=True)
+        # Dedupe pass over the whole list, for duplicates left by earlier imports
+        st.session_state.posts = posts[~post_hashes(posts).duplicated().values].reset_index(drop=True)
+
+    entry = {
+        "name": uploaded_csv.name,
+        "mode": mode,
+        "imported": len(new_posts),
+        "duplicates": duplicates,
+        "errors": errors,
+        "error_count": error_count,
+        "at": datetime.now().strftime("%Y-%m-%d %H:%M"),
+        "reported": False,
+    }
+    st.session_state.imports[file_hash] = entry
+    return entry, True
+
+# ------------------------
+# CSV Export
+# ------------------------
+EXPORT_CHUNK_ROWS = 10000
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def posts_to_csv(posts):
+    """CSV bytes for the posts, encoded a chunk at a time and cached until the posts change"""
+    out = BytesIO()
+    posts.head(0).to_csv(out, index=False, encoding="utf-8")
+    for start in range(0, len(posts), EXPORT_CHUNK_ROWS):
+        posts.iloc[start:start + EXPORT_CHUNK_ROWS].to_csv(out, header=False, index=False, encoding="utf-8")
+    return out.getvalue()
+
+# ------------------------
+# Image Prefetch
+# ------------------------
+IMAGE_PREFETCH_WORKERS = 8
+
+@st.cache_resource
+def get_image_session():
+    """HTTP session shared by image downloads, pooling one connection per prefetch worker"""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=IMAGE_PREFETCH_WORKERS, pool_maxsize=IMAGE_PREFETCH_WORKERS)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def load_post_image(path):
+    """Open a post image from a URL or local path, or return None if it can't be loaded"""
+    try:
+        if str(path).startswith("http"):
+            response = get_image_session().get(path, timeout=10)
+            response.raise_for_status()
+            img = Image.open(BytesIO(response.content))
+        else:
+            img = Image.open(path)
+        # Decode here, in the worker, instead of when the grid renders
+        img.load()
+        return img
+    except Exception:
+        return None
+
+def prefetch_images(paths):
+    """Load every image the grid will show concurrently; returns {path: image or None}"""
+    paths = list(dict.fromkeys(paths))
+    if not paths:
+        return {}
+
+    get_image_session()
+    with ThreadPoolExecutor(max_workers=min(IMAGE_PREFETCH_WORKERS, len(paths))) as pool:
+        return dict(zip(paths, pool.map(load_post_image, paths)))
+
 # ------------------------
 # Tabs
 # ------------------------
@@ -86,19 +238,18 @@ with tab2:
         # Sort
         posts = posts.sort_values("PostDate", ascending=True if sort_order == "Ascending" else False)
 
+        # Fetch all of the grid's images at once, then render
+        images = prefetch_images(posts["ImagePath"])
+
         # Display grid
         cols = st.columns(3)
         for i, row in posts.iterrows():
             col = cols[i % 3]
             with col:
-                try:
-                    if str(row["ImagePath"]).startswith("http"):
-                        response = requests.get(row["ImagePath"])
-                        img = Image.open(BytesIO(response.content))
-                    else:
-                        img = Image.open(row["ImagePath"])
+                img = images.get(row["ImagePath"])
+                if img is not None:
                     st.image(img, use_column_width=True)
-                except:
+                else:
                     st.warning("⚠️ Could not load image")
 
                 st.caption(row["Caption"])
@@ -125,20 +276,39 @@ with tab3:
     if not st.session_state.posts.empty:
         st.dataframe(st.session_state.posts)
 
-        # Export to CSV
-        csv = st.session_state.posts.to_csv(index=False).encode("utf-8")
+        # Export to CSV, built only when the button is clicked
+        posts = st.session_state.posts
         st.download_button(
             label="⬇️ Download Posts as CSV",
-            data=csv,
+            data=lambda: posts_to_csv(posts),
             file_name="scheduled_posts.csv",
             mime="text/csv"
         )
 
         # Import from CSV
+        import_mode = st.radio(
+            "Import mode",
+            ["Merge", "Replace"],
+            horizontal=True,
+            help="Merge adds posts that aren't already listed; Replace makes the file the full post list"
+        )
         uploaded_csv = st.file_uploader("Upload CSV to import posts", type=["csv"], key="csv")
         if uploaded_csv is not None:
-            df = pd.read_csv(uploaded_csv)
-            st.session_state.posts = pd.concat([st.session_state.posts, df], ignore_index=True)
-            st.success("✅ Imported posts from CSV")
+            try:
+                entry, applied = apply_csv_import(uploaded_csv, import_mode)
+                if applied:
+                    # Rerun so the tabs above show the imported posts; the report is shown on that run
+                    st.rerun()
+
+                if not entry["reported"]:
+                    entry["reported"] = True
+                    st.success(f"✅ Imported {entry['imported']} posts from CSV ({entry['duplicates']} duplicates skipped)")
+                    if entry["errors"]:
+                        st.warning(f"⚠️ {entry['error_count']} rows were skipped because of invalid values")
+                        st.dataframe(pd.DataFrame(entry["errors"], columns=["Row", "Problem"]))
+                else:
+                    st.info(f"ℹ️ {entry['name']} was already imported ({entry['mode']}) at {entry['at']}")
+            except Exception as e:
+                st.error(f"❌ Could not read CSV: {str(e)}")
     else:
         st.info("No posts available to manage yet.")